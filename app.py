@@ -1,8 +1,36 @@
+import streamlit as st
 from authentications import Authentication
 from app_pages.usa.subpages.activity import UsAct
+from src.warmup import Warmup
+from src.http_replay import HttpReplay
+
+
+@st.cache_resource(show_spinner=False)
+def start_replay() -> HttpReplay:
+    """Routes upstream calls through
+    the recordings when enabled"""
+
+    replay = HttpReplay()
+    replay.install()
+
+    return replay
+
+
+@st.cache_resource(show_spinner=False)
+def start_warmup() -> Warmup:
+    """Starts the store warm-up
+    once per server process"""
+
+    warmup = Warmup()
+    warmup.start()
+
+    return warmup
+
 
 if __name__ == "__main__":
 
+    start_replay()
+    start_warmup()
     act = UsAct()
     # act.generate_hist_graphs()
-    auth = Authentication()
\ No newline at end of file
+    auth = Authentication()
@@ -6,11 +6,10 @@ import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 import warnings
-import altair as alt
 import requests
-import pandas_datareader.data as pdr
 from streamlit_echarts import st_echarts
 import numpy as np
+from src.cache_policy import CachePolicy
 
 
 class BrAct:
@@ -24,11 +23,13 @@ class BrAct:
         from src.iface_extract import Extract
         from src.indicators import Indicators
         from app_pages.utils import Utils
+        from src.pyramid import SeriesPyramid
 
         self.config = Config()
         self.extract = Extract()
         self.indicators = Indicators()
         self.utils = Utils()
+        self.pyramid = SeriesPyramid()
 
         self.data_dir = self.config.vars.data_dir
         self.start = datetime(2000, 1, 1)
@@ -61,7 +62,7 @@ class BrAct:
         
 
     # Data Extraction
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("vendas_varejo")
     def vendas_varejo(_self):
         """Get Brasil Retail Sales"""
 
@@ -90,7 +91,7 @@ class BrAct:
         return data
 
 
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("producao_industrial")
     def prod_ind(_self):
         """Get Brasil Retail Sales"""
 
@@ -104,7 +105,7 @@ class BrAct:
         
         try:
             url = _self.config.vars.relatorio_inflacao_url.replace(r"{ano_tri}", ano_tri)
-            data = pd.read_excel(url, sheet_name="C1 Boxe2 Graf 1", skiprows=8)
+            data = _self.extract.downloads.read_excel(url, sheet_name="C1 Boxe2 Graf 1", skiprows=8)
             data.rename(columns={"Mês": "Data", "PIM-IT": "ind_pro"}, inplace=True)
             data.set_index("Data", inplace=True)
         
@@ -114,7 +115,7 @@ class BrAct:
         return data
     
 
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("projecao_pib_bcb")
     def projecao_pib_bcb(_self):
         """Get Brasil Retail Sales"""
 
@@ -129,7 +130,7 @@ class BrAct:
         try:
             url = _self.config.vars.relatorio_inflacao_url.replace(r"{ano_tri}", ano_tri)
 
-            data = pd.read_excel(url, sheet_name="C1 Boxe1 Tab 2", skiprows=6)
+            data = _self.extract.downloads.read_excel(url, sheet_name="C1 Boxe1 Tab 2", skiprows=6)
 
             for col in data.columns:
                 if sum(data[col].isna())/len(data) >= 0.8:
@@ -165,13 +166,16 @@ class BrAct:
                     )
                 
                 gdp = self.utils.get_gdp("BRA", self.hist_ind_ids[0])
-                ibcbr = self.utils.get_bcb("IBC-Br", 24364)
                 prod_ind = self.prod_ind()
                 vendas_var = self.vendas_varejo()
-                inec_corrente = self.utils.get_bcb("INEC-Corrente", 7345)
-                inec_compras = self.utils.get_bcb("INEC-Compras", 7346)
-                inec_renda_pessoal = self.utils.get_bcb("INEC-Renda Pessoal", 7347)
-                icei_condicoes = self.utils.get_bcb("INEC-Condições", 7342)
+                (ibcbr, inec_corrente, inec_compras,
+                 inec_renda_pessoal, icei_condicoes) = self.utils.get_bcb_many({
+                    "IBC-Br": 24364,
+                    "INEC-Corrente": 7345,
+                    "INEC-Compras": 7346,
+                    "INEC-Renda Pessoal": 7347,
+                    "INEC-Condições": 7342
+                })
 
                 br_act_ind = [
                     gdp, ibcbr, prod_ind,
@@ -179,9 +183,10 @@ class BrAct:
                     inec_renda_pessoal, icei_condicoes
                 ]
             
-                br_macro_act_data = br_act_ind[self.br_macro_act_hist.get(indicator_filter)]
-                if coluna2.toggle("Anual", value=True):
-                    br_macro_act_data = br_macro_act_data.resample("Y").first()
+                br_macro_act_raw = br_act_ind[self.br_macro_act_hist.get(indicator_filter)]
+                # every level is built once, the toggles only look them up
+                level = "Y" if coluna2.toggle("Anual", value=True) else "D"
+                br_macro_act_data = self.pyramid.get(br_macro_act_raw, level)
                 
             c1, c2, c3 = st.columns([6, .3, 3], vertical_alignment="center")
             
@@ -195,7 +200,7 @@ class BrAct:
             if coluna3.toggle("Variação Percentual"):
                 formatter = "%"
                 if indicator_filter != "PIB Real - FMI":
-                    br_macro_act_data = round(br_macro_act_data.pct_change().dropna(), 3) * 100
+                    br_macro_act_data = self.pyramid.get(br_macro_act_raw, level, change=True)
                 options = self.utils.bar_chart_dict(br_macro_act_data, title=indicator_filter)
             
             with c1.container():
@@ -234,8 +239,8 @@ class BrAct:
             
             br_act_forecasts = [gdp_imf, icei_expectativas]
             br_act_forecasts = br_act_forecasts[self.br_macro_act_for.get(indicator_filter)]
-            if coluna2.toggle("Anual", value=True):
-                    br_act_forecasts = br_act_forecasts.resample("Y").first()
+            level = "Y" if coluna2.toggle("Anual", value=True) else "D"
+            br_act_forecasts = self.pyramid.get(br_act_forecasts, level)
 
             c1, c2, c3 = st.columns([6, .3, 3], vertical_alignment="center")
             
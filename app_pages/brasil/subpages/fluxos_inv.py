@@ -6,15 +6,13 @@ import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 import warnings
-import altair as alt
-import requests
-import pandas_datareader.data as pdr
 from streamlit_echarts import st_echarts
 import numpy as np
-from fredapi import Fred
-from bs4 import BeautifulSoup
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
 
+@Metrics.instrument(prefixes=("get_",))
 class BrFlows:
     """US Market Financial Conditions"""
 
@@ -41,7 +39,7 @@ class BrFlows:
 
         self.br_fluxos_inv = list(self.ind.keys())
 
-        self.fred = Fred(api_key=self.config.vars.FRED_API_KEY)
+        self.fred = self.extract.fred
 
         warnings.filterwarnings('ignore')
 
@@ -55,14 +53,17 @@ class BrFlows:
         col3.image(path.join(self.config.vars.img_dir, 
                             self.config.vars.logo_bequest), width=300)
 
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("scraper")
     def get_b3_flows(_self) -> pd.DataFrame | list:
         """Downloads Brasil b3 
         investiment flows"""
 
+        # import heavy module on demand
+        from bs4 import BeautifulSoup
+
         try:
-            response = requests.get(_self.config.vars.url_b3_flows)
-            if not response.ok:
+            response = _self.extract.http.get(_self.config.vars.url_b3_flows)
+            if not response.is_success:
                 raise OSError(f"Erro na requisição ao site: Código{response.status_code}")
             soup = BeautifulSoup(response.content, "html.parser")
             elems = soup.find_all("td")
@@ -7,16 +7,12 @@ from datetime import datetime, timedelta
 import datetime as dt
 import streamlit as st
 import warnings
-import altair as alt
-import requests
-import pandas_datareader.data as pdr
 from streamlit_echarts import st_echarts
 import numpy as np
-from bs4 import BeautifulSoup
-from bcb import currency
-from functools import reduce
+from src.metrics import Metrics
 
 
+@Metrics.instrument(prefixes=("get_",))
 class BrFocus:
     """Brasil Focus Relatory"""
 
@@ -28,11 +24,13 @@ class BrFocus:
         from src.iface_extract import Extract
         from src.indicators import Indicators
         from app_pages.utils import Utils
+        from src.derived import Derived
 
         self.config = Config()
         self.extract = Extract()
         self.indicators = Indicators()
         self.utils = Utils()
+        self.derived = Derived()
 
         self.data_dir = self.config.vars.data_dir
         self.start = datetime(2000, 1, 1)
@@ -47,92 +45,49 @@ class BrFocus:
         warnings.filterwarnings('ignore')
 
 
-    @st.cache_data(show_spinner=False)
     def get_focus_data(_self, year: int, indicador: str):
-        """Gets Focus Data"""
+        """Gets Focus Data
+        of one reference year"""
 
-        dict_indicator = {
-            "ipca": _self.config.vars.ipca_focus,
-            "selic": _self.config.vars.selic_focus,
-            "câmbio": _self.config.vars.cambio_focus,
-            "pib": _self.config.vars.pib_focus
-        }
-
-        if indicador not in list(dict_indicator.keys()):
+        mirror = _self.extract.get_focus_mirror()
+        if indicador not in mirror:
             raise OSError("Este indicador não existe na base dos relatórios Focus")
 
-        try:
-            response = requests.get(dict_indicator[indicador].replace("{data_inicial}", str(year)).replace("{data_final}", str(year)))
-            if not response.ok:
-                raise OSError("Não foi possível requisitar o site")
-            
-            data = pd.json_normalize(response.json()["value"])
-
-            data.set_index("Data", inplace=True)
-            data.index = pd.to_datetime(data.index)
-
-            data = data[["Mediana", "DataReferencia"]]
-            data["DataReferencia"] = data["DataReferencia"].astype(int)
+        data = mirror[indicador].get(str(year), pd.Series(dtype=float)).dropna()
 
-        except Exception as error:
-            raise OSError(error) from error
-        
-        return data
+        return pd.DataFrame({"Mediana": data, "DataReferencia": year}, index=data.index)
     
 
-    @st.cache_data(show_spinner=False)
     def get_forward_focus(_self, indicador: str):
-        """Gets Focus Data"""
-
-        dict_indicator = {
-            "ipca": _self.config.vars.ipca_focus,
-            "selic": _self.config.vars.selic_focus,
-            "câmbio": _self.config.vars.cambio_focus,
-            "pib": _self.config.vars.pib_focus
-        }
+        """Gets Focus Data of the
+        next five reference years"""
 
-        if indicador not in list(dict_indicator.keys()):
+        mirror = _self.extract.get_focus_mirror()
+        if indicador not in mirror:
             raise OSError("Este indicador não existe na base dos relatórios Focus")
 
-        try:
-            response = requests.get(dict_indicator[indicador].replace("{data_inicial}", 
-                                                                      str(_self.end.year)).replace("{data_final}", 
-                                                                      str(_self.end.year + 4)))
-            if not response.ok:
-                raise OSError("Não foi possível requisitar o site")
-            
-            data = pd.json_normalize(response.json()["value"])
+        anos = [str(ano) for ano in range(_self.end.year, _self.end.year + 5)
+                if str(ano) in mirror[indicador].columns]
+        medianas = mirror[indicador][anos].dropna(how="all")
 
-            data.set_index("Data", inplace=True)
-            data.index = pd.to_datetime(data.index)
+        # one pivot instead of merging the years pairwise
+        referencias = pd.DataFrame({ano: int(ano) for ano in anos},
+                                   index=medianas.index).where(medianas.notna())
+        dados_final = pd.concat([medianas.add_prefix("Mediana_"),
+                                 referencias.add_prefix("DataReferencia_")], axis=1)
+        dados_final = dados_final[[f"{column}_{ano}" for ano in anos
+                                   for column in ["Mediana", "DataReferencia"]]]
 
-            data = data[["Mediana", "DataReferencia"]]
-            data["DataReferencia"] = data["DataReferencia"].astype(int)
-
-            anos = sorted(data["DataReferencia"].unique()[:5])
-
-            dados_segregados = [data[data["DataReferencia"] == ano].rename(columns={"DataReferencia": f"DataReferencia_{ano}",
-                                                                                    "Mediana": f"Mediana_{ano}"}) for ano in anos]
-
-            
-            dados_final = dados_segregados[0]
-            for i in range(1, len(dados_segregados)):
-                dados_final = dados_final.merge(dados_segregados[i], 
-                                                left_index=True,
-                                                right_index=True,
-                                                how="outer")
-            dados_final = dados_final.fillna("temp_value").replace("temp_value", None)
-
-        except Exception as error:
-            raise OSError(error) from error
-        
-        return dados_final
+        return dados_final.astype(object).where(dados_final.notna(), None)
 
 
     # Plot historical Dashboard
     @st.fragment()
     def generate_graphs(self) -> None:
         """Generates dashboard interface"""
+
+        # import heavy module on demand
+        from bcb import currency
         
         c1, c2, c3 = st.columns([2, .5, 1])
         coluna1, coluna2, coluna3 = c1.columns([4,2,4], vertical_alignment="center")
@@ -168,9 +123,9 @@ class BrFocus:
                     real_indicator_df = self.utils.get_bcb(list(dict_real_indicator[indicator_filter].keys())[0],
                                                         list(dict_real_indicator[indicator_filter].values())[0])
                     if indicator_filter != "IPCA":
-                        real_indicator = real_indicator_df.resample("Y").last()
+                        real_indicator = self.derived.apply("resample", real_indicator_df, rule="YE", how="last")
                     else:
-                        real_indicator = real_indicator_df.resample("Y").apply(lambda x: (1 + x/100).prod() - 1) * 100
+                        real_indicator = self.derived.apply("resample", real_indicator_df, rule="YE", how="compound")
                     real_indicator = real_indicator[real_indicator.index.year == year_selector][indicator_filter].values[0]
                         
                 else:
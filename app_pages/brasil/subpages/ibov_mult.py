@@ -6,21 +6,14 @@ import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 import warnings
-import altair as alt
-import requests
-import pandas_datareader.data as pdr
 from streamlit_echarts import st_echarts
 import numpy as np
-import requests
-from bs4 import BeautifulSoup
 import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.action_chains import ActionChains
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
 
+@Metrics.instrument(prefixes=("get_",))
 class IBOVMult:
     """Ibovespa Multiples"""
 
@@ -53,6 +46,13 @@ class IBOVMult:
     
     def scrap_ibov_pl(self):
 
+        # selenium is only needed to refresh the sheet
+        from selenium import webdriver
+        from selenium.webdriver.common.by import By
+        from webdriver_manager.chrome import ChromeDriverManager
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.common.action_chains import ActionChains
+
         try:
 
             chrome_options = webdriver.ChromeOptions()
@@ -107,7 +107,7 @@ class IBOVMult:
         return "Extraction Done"
 
     
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("files")
     def get_ibov_multiples(_self) -> pd.DataFrame:
         """Reads the IBOV multiples sheet"""
 
@@ -6,13 +6,13 @@ import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 import warnings
-import altair as alt
-import requests
-import pandas_datareader.data as pdr
 from streamlit_echarts import st_echarts
 import numpy as np
-from bs4 import BeautifulSoup
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
+
+@Metrics.instrument(prefixes=("get_",))
 class BrInf:
     """Br Macro Inflation Indicators"""
 
@@ -24,11 +24,13 @@ class BrInf:
         from src.iface_extract import Extract
         from src.indicators import Indicators
         from app_pages.utils import Utils
+        from src.pyramid import SeriesPyramid
 
         self.config = Config()
         self.extract = Extract()
         self.indicators = Indicators()
         self.utils = Utils()
+        self.pyramid = SeriesPyramid()
 
         self.data_dir = self.config.vars.data_dir
         self.start = datetime(2000, 1, 1)
@@ -49,42 +51,7 @@ class BrInf:
         warnings.filterwarnings('ignore')
     
     
-    @st.cache_data(show_spinner=False)
-    def get_br_implied_inflation(_self) -> str:
-        """Scrap Implied Inflation
-        data for specific vertices"""
-
-        url = _self.config.vars.url_anbima_inf
-
-        try:
-            response = requests.get(url)
-            if not response.ok:
-                raise FileNotFoundError(f"Unable to request the AMBIMA web site")
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            lista_elems = [elem.text for elem in soup.find_all("div", id="ETTJs")]
-            lista_elems = [elem.replace("\n", " ").replace("\t", " ") for elem in lista_elems]
-            lista_elems = lista_elems[0].split(" ")
-            lista_elems = [elem for elem in lista_elems if elem not in [" ", ""]]
-            lista_elems = lista_elems[lista_elems.index("Implícita") + 1:lista_elems.index("2.394") + 4]
-
-            lista_vertices = [int(lista_elems[i].replace(".", "")) for i in range(0, len(lista_elems) - 2, 4)]
-            lista_eetj_ntnb = [float(lista_elems[i].replace(",", ".")) for i in range(1, len(lista_elems) - 1, 4)]
-            lista_eetj_pre = [float(lista_elems[i].replace(",", ".")) for i in range(2, len(lista_elems), 4)]
-            lista_inf_implicita = [float(lista_elems[i].replace(",", ".")) for i in range(3, len(lista_elems) + 1, 4)]
-
-        except Exception as error:
-            raise OSError(error) from error
-        
-        df_implicita = pd.DataFrame({"Vértice": lista_vertices,
-                                     "ETTJ PRE": lista_eetj_pre,
-                                     "ETTJ NTNB": lista_eetj_ntnb,
-                                     "Inflação Implicita": lista_inf_implicita})
-
-        return df_implicita
-    
-
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("projecao_inflacao_bcb")
     def proj_inf_bcb(_self):
         """Gets BCB inflation forecasts"""
 
@@ -98,7 +65,7 @@ class BrInf:
         
         try:
             url = _self.config.vars.relatorio_inflacao_url.replace(r"{ano_tri}", ano_tri)
-            data = pd.read_excel(url, sheet_name="Graf 2.2.9", skiprows=8)
+            data = _self.extract.downloads.read_excel(url, sheet_name="Graf 2.2.9", skiprows=8)
             data = data.drop(0, axis=0)
             data.set_index("Trimestre", inplace=True)
             data["Data"] = data.index.date
@@ -130,14 +97,13 @@ class BrInf:
                     index=0, key="inflation_indicator"
                     )
                 
-                ipca = self.utils.get_bcb("IPCA", 433)
-                igpm = self.utils.get_bcb("IGPM", 189)
-                ipca_ms = self.utils.get_bcb("IPCA-MS", 4466)
+                ipca, igpm, ipca_ms = self.utils.get_bcb_many({"IPCA": 433, "IGPM": 189,
+                                                               "IPCA-MS": 4466})
             
             br_macro_inf_hist = [ipca, igpm, ipca_ms]
             br_macro_inf_data = br_macro_inf_hist[self.br_macro_inf_hist[indicator_filter]]
-            if coluna2.toggle("Anual", value=True, key="inflation_toggle"):
-                br_macro_inf_data = br_macro_inf_data.resample("Y").apply(lambda x: (1 + x/100).prod() - 1) * 100
+            level = "Y" if coluna2.toggle("Anual", value=True, key="inflation_toggle") else "D"
+            br_macro_inf_data = self.pyramid.get(br_macro_inf_data, level, how="compound")
             
             
             c1, c2, c3 = st.columns([6, .3, 3], vertical_alignment="center")
@@ -174,7 +140,7 @@ class BrInf:
             
             with st.spinner("Carregando os dados..."):
                 
-                inf_implicita = self.get_br_implied_inflation()
+                inf_implicita = self.utils.get_br_implied_inflation()
                 projecao_inflacao = self.proj_inf_bcb()
 
             col1.markdown("""
@@ -7,13 +7,13 @@ from datetime import datetime, timedelta
 import streamlit as st
 import warnings
 from streamlit_echarts import st_echarts
-import pandas_datareader.data as pdr
 from pandas.tseries.offsets import *
-from scipy import interpolate
-from bs4 import BeautifulSoup
-import requests
 import numpy as np
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
+
+@Metrics.instrument(prefixes=("get_",))
 class CurvaJuros:
     """Curva de Juros BR"""
 
@@ -47,43 +47,7 @@ class CurvaJuros:
 
         warnings.filterwarnings('ignore')    
 
-    @st.cache_data(show_spinner=False)
-    def get_br_implied_inflation(_self) -> str:
-        """Scrap Implied Inflation
-        data for specific vertices"""
-
-        url = _self.config.vars.url_anbima_inf
-
-        try:
-            response = requests.get(url)
-            if not response.ok:
-                raise FileNotFoundError(f"Unable to request the AMBIMA web site")
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            lista_elems = [elem.text for elem in soup.find_all("div", id="ETTJs")]
-            lista_elems = [elem.replace("\n", " ").replace("\t", " ") for elem in lista_elems]
-            lista_elems = lista_elems[0].split(" ")
-            lista_elems = [elem for elem in lista_elems if elem not in [" ", ""]]
-            lista_elems = lista_elems[lista_elems.index("Implícita") + 1:lista_elems.index("2.394") + 4]
-
-            lista_vertices = [int(lista_elems[i].replace(".", "")) for i in range(0, len(lista_elems) - 2, 4)]
-            lista_eetj_ntnb = [float(lista_elems[i].replace(",", ".")) for i in range(1, len(lista_elems) - 1, 4)]
-            lista_eetj_pre = [float(lista_elems[i].replace(",", ".")) for i in range(2, len(lista_elems), 4)]
-            lista_inf_implicita = [float(lista_elems[i].replace(",", ".")) for i in range(3, len(lista_elems) + 1, 4)]
-
-        except Exception as error:
-            raise OSError(error) from error
-        
-        df_implicita = pd.DataFrame({"Vértice": lista_vertices,
-                                     "ETTJ PRE": lista_eetj_pre,
-                                     "ETTJ NTNB": lista_eetj_ntnb,
-                                     "Inflação Implicita": lista_inf_implicita})
-        df_implicita.set_index("Vértice", inplace=True)
-
-        return df_implicita
-    
-
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("di")
     def own_expectations(_self):
         
             lista_meetings = ["2025-01-28", "2025-03-18", 
@@ -94,9 +58,7 @@ class CurvaJuros:
             lista_datas = [datetime.strptime(data, "%Y-%m-%d") for data in lista_meetings]
             lista_datas = [data for data in lista_datas if data > datetime.today()]
 
-            dias_proximo_meeting = [len(pd.date_range(datetime.today(), fim, 
-                                                      freq=CustomBusinessDay(holidays=_self.inter.get_anbima_holidays()))) 
-                                                      for fim in lista_datas]
+            dias_proximo_meeting = _self.inter.calendar.count(datetime.today(), lista_datas).tolist()
 
             df = pd.DataFrame(
                     {"Próximo Meeting": [datetime.strftime(data, format="%d/%m/%Y") for data in lista_datas],
@@ -110,7 +72,7 @@ class CurvaJuros:
             return df
     
     
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("di")
     def get_br_interest(_self, lista_dias):
 
         return _self.inter.interpolate(lista_dias)
@@ -138,21 +100,22 @@ class CurvaJuros:
         
                 select_curve = coluna2.selectbox(" ", ["DI Futuro", "ETTJ Pré", "ETTJ NTNB"], index=0)
 
+                ettj = self.utils.get_br_implied_inflation().set_index("Vértice")
                 dados = {
-                    "ETTJ Pré": self.get_br_implied_inflation()["ETTJ PRE"].to_frame(),
-                    "ETTJ NTNB": self.get_br_implied_inflation()["ETTJ NTNB"].to_frame(),
+                    "ETTJ Pré": ettj["ETTJ PRE"].to_frame(),
+                    "ETTJ NTNB": ettj["ETTJ NTNB"].to_frame(),
                     "DI Futuro": curva_di
                 }
 
             dados_selected = dados[select_curve]
 
             if "Futuro" in select_curve:
-                options = self.utils.multiple_interest_br(dados_selected, title = "Curva de Juros Atual", 
-                                               smooth=True,
-                                               min_value=round(np.min(dados_selected.values) - 1),
-                                               max_value=16,
-                                              marker=True,
-                                              label_format="%")
+                options = self.utils.multiple_series_echart(dados_selected, title = "Curva de Juros Atual", 
+                                                            names=["Atual", "1 mês", "3 meses", "6 meses"],
+                                                            x_column="Vértices",
+                                                            min_value=round(np.min(dados_selected.values) - 1),
+                                                            max_value=16,
+                                                            data_view=True)
                 
             else:
                 options = self.utils.no_time_echart(dados_selected, title=select_curve, 
@@ -193,7 +156,13 @@ class CurvaJuros:
                 coluna1, coluna2, coluna3 = c1.columns([6,.5,4], vertical_alignment="center")
                 coluna1.warning("Por favor, preencha todos os valores antes de continuar.")
             else:
-                options = self.utils.multiple_4series_echart(edited_df, curva_real = curva_di_atual)
+                curvas = edited_df.assign(**{"Curva DI": curva_di_atual.round(2).values})
+                options = self.utils.multiple_series_echart(curvas, 
+                                                            names=["Positivo", "Neutro", "Negativo", "Curva DI"],
+                                                            x_column="Dias Úteis",
+                                                            columns=["Cenário Positivo", "Cenário Neutro", 
+                                                                     "Cenário Negativo", "Curva DI"],
+                                                            smooth=True)
 
                 with c2.container():
                     st.html("<span class='column_graph'></span>")
@@ -6,12 +6,8 @@ import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 import warnings
-import altair as alt
-import requests
-import pandas_datareader.data as pdr
 from streamlit_echarts import st_echarts
 import numpy as np
-from bs4 import BeautifulSoup
 
 
 class BRSelic:
@@ -25,11 +21,13 @@ class BRSelic:
         from src.iface_extract import Extract
         from src.indicators import Indicators
         from app_pages.utils import Utils
+        from src.derived import Derived
 
         self.config = Config()
         self.extract = Extract()
         self.indicators = Indicators()
         self.utils = Utils()
+        self.derived = Derived()
 
         self.data_dir = self.config.vars.data_dir
         self.start = datetime(2000, 1, 1)
@@ -56,13 +54,8 @@ class BRSelic:
             indicator_filter = c1.selectbox(" ",
                                             list(self.ind.keys()), index=0)
             
-            selic = self.utils.get_bcb("SELIC", 1178)
-            ipca = self.utils.get_bcb("IPCA", 433)/100
-            ipca = ipca.rolling(12).apply(lambda x: (1 + x).prod() - 1)
-            selic_real_df = pd.merge(selic/100, ipca, right_index=True, 
-                                     left_index=True, how="inner")
-            selic_real_df.dropna(inplace=True)
-            selic_real = ((((1 + selic_real_df["SELIC"])/(1 + selic_real_df["IPCA"])) - 1) * 100).to_frame()
+            selic, ipca = self.utils.get_bcb_many({"SELIC": 1178, "IPCA": 433})
+            selic_real = self.derived.evaluate("selic_real", selic=selic, ipca=ipca)
 
         br_macro_selic = [selic, selic_real]
         br_macro_selic_data = br_macro_selic[self.br_macro_selic[indicator_filter]]
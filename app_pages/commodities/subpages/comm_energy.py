@@ -6,11 +6,12 @@ import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 import warnings
-import altair as alt
 from streamlit_echarts import st_echarts
-from fredapi import Fred
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
 
+@Metrics.instrument(prefixes=("get_",))
 class EnergyComm:
     """Energy Commodities Global"""
 
@@ -32,8 +33,6 @@ class EnergyComm:
         self.start = datetime(2000, 1, 1)
         self.end = datetime.today()
 
-        self.fred = Fred(self.config.vars.FRED_API_KEY)
-
         self.energy_ind = self.indicators.get_theme_dict("energy_prices")
         self.energy_ids = self.indicators.get_ids_list("energy_prices")
 
@@ -44,24 +43,13 @@ class EnergyComm:
         warnings.filterwarnings('ignore')
 
 
-    @st.cache_resource(show_spinner=False)
+    @CachePolicy.swr("fred")
     def get_energy_prices(_self) -> pd.DataFrame | list:
         """Download energy comms Prices"""
         
-        comm_list = []
-
-        for comm_ind in _self.energy_ids:
-            try:
-                comm = _self.fred.get_series(comm_ind, observation_start=_self.start, 
-                                     observation_end=_self.end)
-                comm = comm.to_frame(name=comm_ind)
-                comm_list.append(comm)
-            except Exception as error:
-                raise OSError(error) from error
-            
-        df_final = pd.concat(comm_list, axis=1)
+        df_final = _self.extract.get_fred_data(_self.energy_ids)
         df_final.dropna(inplace=True)
-            
+
         return df_final
 
 
@@ -6,13 +6,12 @@ import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 import warnings
-import altair as alt
-import requests
-from bs4 import BeautifulSoup
 from streamlit_echarts import st_echarts
-from fredapi import Fred
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
 
+@Metrics.instrument(prefixes=("get_",))
 class GoldComm:
     """Energy Commodities Global"""
 
@@ -34,7 +33,7 @@ class GoldComm:
         self.start = datetime(2000, 1, 1)
         self.end = datetime.today()
 
-        self.fred = Fred(api_key=self.config.vars.FRED_API_KEY)
+        self.fred = self.extract.fred
 
         self.gold_ind = self.indicators.get_theme_dict("gold")
         self.gold_ids = self.indicators.get_ids_list("gold")
@@ -55,32 +54,40 @@ class GoldComm:
                             _self.config.vars.logo_bequest), width=300)
         
     
-    @st.cache_resource(show_spinner=False)
-    def get_gold_prices(_self, ouro=True):
+    @CachePolicy.swr("scraper")
+    def get_gold_prices(_self) -> list:
+        """Scraps gold and silver
+        spot prices concurrently"""
+
+        # import heavy module on demand
+        from bs4 import BeautifulSoup
+
+        urls = [_self.config.vars.gold_prices, _self.config.vars.silver_prices]
+        responses = _self.extract.http.get_many(urls, headers=_self.config.headers)
+
+        prices = []
+        for url, response in zip(urls, responses):
         
-        try:
-            url = _self.config.vars.gold_prices if ouro == True else _self.config.vars.silver_prices
-            response = requests.get(url,
-                            headers=_self.config.headers)
-                
+            try:
+                if not response.is_success:
+                    st.error(f"Erro na requisição ao site: {url}")
             
-            if not response.ok:
-                st.error(f"Erro na requisição ao site: {_self.config.vars.gold_prices}")
-        
-            soup = BeautifulSoup(response.content, "html.parser")
-            tabela = soup.find(id="dtDGrid")
-            tabela = tabela.text.split("\n")
-            data_hora = " ".join(tabela[19].split(" ")[:2])
-            valor_oz = tabela[37]
-            variaca_dia = tabela[27]
+                soup = BeautifulSoup(response.content, "html.parser")
+                tabela = soup.find(id="dtDGrid")
+                tabela = tabela.text.split("\n")
+                data_hora = " ".join(tabela[19].split(" ")[:2])
+                valor_oz = tabela[37]
+                variaca_dia = tabela[27]
+
+            except Exception as error:
+                raise OSError(error) from error
 
-        except Exception as error:
-            raise OSError(error) from error
+            prices.append((data_hora, valor_oz, variaca_dia))
         
-        return data_hora, valor_oz, variaca_dia
+        return prices
     
 
-    @st.cache_resource(show_spinner=False)
+    @CachePolicy.swr("fred")
     def get_gold_vol_series(_self) -> pd.DataFrame:
         """Downloads gld 
         etf vol series"""
@@ -106,8 +113,9 @@ class GoldComm:
 
 
             gold_etf_vol = self.get_gold_vol_series()
-            date, gold_price, gold_var = self.get_gold_prices()
-            date, silver_price, silver_var = self.get_gold_prices(ouro=False)
+            gold, silver = self.get_gold_prices()
+            date, gold_price, gold_var = gold
+            date, silver_price, silver_var = silver
             
         
         options = self.utils.echart_dict(gold_etf_vol, 
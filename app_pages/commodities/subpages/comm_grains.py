@@ -6,11 +6,12 @@ import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 import warnings
-import altair as alt
 from streamlit_echarts import st_echarts
-from fredapi import Fred
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
 
+@Metrics.instrument(prefixes=("get_",))
 class GrainsComm:
     """Grains Commodities Global"""
 
@@ -32,7 +33,7 @@ class GrainsComm:
         self.start = datetime(2000, 1, 1)
         self.end = datetime.today()
 
-        self.fred = Fred(self.config.vars.FRED_API_KEY)
+        self.fred = self.extract.fred
 
         self.grains_ind = self.indicators.get_theme_dict("grain_prices")
         self.grains_ids = self.indicators.get_ids_list("grain_prices")
@@ -44,28 +45,17 @@ class GrainsComm:
         warnings.filterwarnings('ignore')
 
 
-    @st.cache_resource(show_spinner=False)
+    @CachePolicy.swr("fred")
     def get_grain_prices(_self) -> pd.DataFrame | list:
         """Download Commodities Prices"""
         
-        comm_list = []
-
-        for comm_ind in _self.grains_ids[:-1]:
-            try:
-                comm = _self.fred.get_series(comm_ind, observation_start=_self.start, 
-                                     observation_end=_self.end)
-                comm = comm.to_frame(name=comm_ind)
-                comm_list.append(comm)
-            except Exception as error:
-                raise OSError(error) from error
-            
-        df_final = pd.concat(comm_list, axis=1)
+        df_final = _self.extract.get_fred_data(_self.grains_ids[:-1])
         df_final.dropna(inplace=True)
-            
+
         return df_final
     
     
-    @st.cache_resource(show_spinner=False)
+    @CachePolicy.swr("fred")
     def get_soy_series(_self) -> pd.DataFrame:
         """Downloads soybean series"""
         
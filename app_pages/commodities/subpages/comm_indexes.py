@@ -6,12 +6,12 @@ import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 import warnings
-import altair as alt
 from streamlit_echarts import st_echarts
-from fredapi import Fred
-import yfinance as yf
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
 
+@Metrics.instrument(prefixes=("get_",))
 class CommIndexes:
     """Commodities Indexes Global"""
 
@@ -33,7 +33,7 @@ class CommIndexes:
         self.start = datetime(2000, 1, 1)
         self.end = datetime.today()
 
-        self.fred = Fred(self.config.vars.FRED_API_KEY)
+        self.fred = self.extract.fred
 
         self.indexes_ind = self.indicators.get_theme_dict("comm_indexes")
         self.indexes_ids = self.indicators.get_ids_list("comm_indexes")
@@ -45,19 +45,16 @@ class CommIndexes:
         warnings.filterwarnings('ignore')
 
 
-    @st.cache_resource(show_spinner=False)
+    @CachePolicy.swr("yfinance")
     def get_gsci_series(_self) -> pd.DataFrame:
         """Downloads GSCI etf
         series"""
         
-        try:
-            gsci = yf.download(_self.indicators.get_ids_list("comm_indexes")[0], start=_self.start, end=_self.end)["Close"]
-        except Exception as error:
-                raise OSError(error) from error
-
+        gsci = _self.extract.get_yf_data(_self.indexes_ids[0])
+        
         return gsci
     
-    @st.cache_resource(show_spinner=False)
+    @CachePolicy.swr("fred")
     def get_all_comm_index(_self) -> pd.DataFrame:
         """Downloads all comms index"""
         
@@ -75,24 +72,12 @@ class CommIndexes:
     
 
 
-    @st.cache_resource(show_spinner=False)
+    @CachePolicy.swr("fred")
     def get_comm_indexes(_self) -> pd.DataFrame | list:
         """Download Commodities Indexes"""
         
-        comm_list = []
+        df_final = _self.extract.get_fred_data(_self.indexes_ids[1:3]).interpolate()
 
-        for comm_ind in _self.indexes_ids[1:3]:
-            try:
-                comm = _self.fred.get_series(comm_ind, observation_start=_self.start, 
-                                     observation_end=_self.end)
-                comm = comm.to_frame(name=comm_ind).interpolate()
-                comm_list.append(comm)
-            except Exception as error:
-                raise OSError(error) from error
-            
-        df_final = pd.concat(comm_list, axis=1)
-        df_final.dropna
-            
         return df_final
     
 
@@ -6,11 +6,13 @@ import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 import warnings
-import altair as alt
 import time
 import asyncio
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
 
+@Metrics.instrument(prefixes=("get_",))
 class EmMkt:
     """Emergin Markets Indicators"""
 
@@ -30,7 +32,7 @@ class EmMkt:
         self.start = datetime(2000, 1, 1)
         self.end = datetime.today()
 
-        self.em_indicators = self.indicators.get_theme_dict("emerging_markets")
+        self.em_indicators = self.indicators.get_theme_dict("em_mkt_spread_cred")
         
         warnings.filterwarnings('ignore')
 
@@ -59,7 +61,7 @@ class EmMkt:
                         unsafe_allow_html=True)
 
 
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("yfinance")
     def get_data(_self):
 
         return _self.extract.get_emerging_data(), _self.extract.get_emb_series(), _self.extract.get_vxeem()
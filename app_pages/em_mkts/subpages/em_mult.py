@@ -7,16 +7,15 @@ from glob import glob
 from datetime import datetime, timedelta
 import streamlit as st
 import warnings
-import altair as alt
-import requests
-import pandas_datareader.data as pdr
 from streamlit_echarts import st_echarts
 import numpy as np
-import requests
-from bs4 import BeautifulSoup
 import json
 from functools import reduce
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
+
+@Metrics.instrument(prefixes=("get_",))
 class EmMult:
     """Emerging Markets Multiples"""
 
@@ -47,7 +46,7 @@ class EmMult:
         warnings.filterwarnings('ignore')        
 
     
-    @st.cache_resource(show_spinner=False)
+    @CachePolicy.swr("files")
     def get_indexes_series(_self, filename: list, list_names: list) -> pd.DataFrame:
         """Gets the Emerging Markets PE Ratio"""
 
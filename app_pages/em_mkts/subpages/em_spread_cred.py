@@ -6,14 +6,13 @@ import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 import warnings
-import altair as alt
-import requests
-import pandas_datareader.data as pdr
 from streamlit_echarts import st_echarts
 import numpy as np
-from fredapi import Fred
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
 
+@Metrics.instrument(prefixes=("get_",))
 class EmCredSpread:
     """Emerging Markets 
     Market Credit Spread"""
@@ -26,11 +25,13 @@ class EmCredSpread:
         from src.iface_extract import Extract
         from src.indicators import Indicators
         from app_pages.utils import Utils
+        from src.pyramid import SeriesPyramid
 
         self.config = Config()
         self.extract = Extract()
         self.indicators = Indicators()
         self.utils = Utils()
+        self.pyramid = SeriesPyramid()
 
         self.data_dir = self.config.vars.data_dir
         self.start = datetime(2000, 1, 1)
@@ -42,8 +43,6 @@ class EmCredSpread:
         self.em_mkt_cred_spread = dict(zip(list(self.ind.keys()), 
                                list(range(5))))
         
-        self.fred = Fred(api_key=self.config.vars.FRED_API_KEY)
-        
         
         warnings.filterwarnings('ignore')
 
@@ -62,26 +61,14 @@ class EmCredSpread:
 
         
 
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("fred")
     def get_market_indicators(_self) -> pd.DataFrame | list:
         """Downloads EM Market
           Indicators"""
         
-        ind_list = []
-
-        for ind in _self.ind_ids:
-            try:
-                ind_series = _self.fred.get_series(ind,
-                                                  observation_start=_self.start, 
-                                                  observation_end=_self.end)
-                ind_series = ind_series.to_frame(name=ind)
-                ind_series.index.name = "Date"
-                ind_list.append(ind_series)
-
-            except Exception as error:
-                raise OSError(error) from error
-            
-        return ind_list
+        em_spread_data = _self.extract.get_fred_data(_self.ind_ids)
+
+        return [em_spread_data[[ind]].dropna() for ind in _self.ind_ids]
 
 
     @st.fragment()
@@ -101,8 +88,9 @@ class EmCredSpread:
             
             em_spread_ind = self.get_market_indicators()
         em_mkt_spread_data = em_spread_ind[self.em_mkt_cred_spread.get(indicator_filter)]
-        if coluna2.toggle("Anual", value=True, key="cred_spread_toggle"):
-            em_mkt_spread_data = em_mkt_spread_data.resample("Y").first().dropna()
+        # long daily series render at the finest level that fits the chart
+        level = "Y" if coluna2.toggle("Anual", value=True, key="cred_spread_toggle") else "auto"
+        em_mkt_spread_data = self.pyramid.get(em_mkt_spread_data, level, dropna=True)
         
         em_mkt_spread_data = em_mkt_spread_data.interpolate()
 
@@ -6,12 +6,8 @@ import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 import warnings
-import altair as alt
-import requests
-import pandas_datareader.data as pdr
 from streamlit_echarts import st_echarts
 import numpy as np
-from bs4 import BeautifulSoup
 
 class EmInf:
     """Emerging Markets 
@@ -6,14 +6,12 @@ import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 import warnings
-import altair as alt
-import requests
-import pandas_datareader.data as pdr
 from streamlit_echarts import st_echarts
-import yfinance as yf
-from fredapi import Fred
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
 
+@Metrics.instrument(prefixes=("get_",))
 class EmExtras:
     """Emerging Markets Extras Indicators"""
 
@@ -41,13 +39,13 @@ class EmExtras:
         self.em_mkt_extras = dict(zip(list(self.ind.keys()), 
                                list(range(1))))
         
-        self.fred = Fred(api_key=self.config.vars.FRED_API_KEY)
+        self.fred = self.extract.fred
         
         warnings.filterwarnings('ignore')
 
     
 
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("fred")
     def get_vix_index(_self) -> pd.DataFrame:
         """Gets vix index"""
 
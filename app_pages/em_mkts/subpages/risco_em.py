@@ -7,16 +7,13 @@ from datetime import datetime, timedelta
 import datetime as dt
 import streamlit as st
 import warnings
-import altair as alt
-import requests
-import pandas_datareader.data as pdr
 from streamlit_echarts import st_echarts
 import numpy as np
-from bs4 import BeautifulSoup
-from bcb import currency
 from functools import reduce
+from src.metrics import Metrics
 
 
+@Metrics.instrument(prefixes=("get_",))
 class EmRisk:
     """Emerging Markets Risk Indicators"""
 
@@ -47,54 +44,6 @@ class EmRisk:
         warnings.filterwarnings('ignore')
 
 
-    @st.cache_resource(show_spinner=False)
-    def get_adamodar_data(_self):
-        """Scraps the adamodar 
-        Default Spreads and Risks data"""
-
-        def clean_list(lst, begin, step = 6):
-            return [" ".join(lst[i].replace("\n", "").split()) for i in range(begin, len(lst) - (5 - begin), step)][:-1]
-
-        try:
-            response = requests.get(_self.config.vars.adamodar_url)
-            if not response.ok:
-                raise FileNotFoundError("Could not requets the Adamodar Data")
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            elems = soup.find_all("td")
-
-            elems = [elem.text.strip() for elem in elems]
-            elems = [elem for elem in elems[elems.index("Country"):]]
-
-        except Exception as error:
-            raise OSError(error) from error
-        
-        countrys = clean_list(elems, 0)
-        adj_default_spread = clean_list(elems, 1)
-        equity_risk = clean_list(elems, 2)
-        country_risk_premium = clean_list(elems, 3)
-        corporate_tax_rate = clean_list(elems, 4)
-        moodys = clean_list(elems, 5)
-
-        df_adamodar = pd.DataFrame([countrys, adj_default_spread, 
-                                    equity_risk, country_risk_premium,
-                                    corporate_tax_rate, moodys]).T
-        
-        df_adamodar.columns = df_adamodar.iloc[0]
-        df_adamodar.drop(0, inplace=True)
-
-        for col in df_adamodar.columns.drop(["Country", "Moody's rating"]):
-            df_adamodar[f"{col} (%)"] = df_adamodar[col].str.replace("%", "").astype(float)
-            df_adamodar.drop(columns=col, inplace=True)
-
-        ordered_cols = df_adamodar.columns.drop("Moody's rating").tolist()
-        ordered_cols.append("Moody's rating")
-
-        df_adamodar = df_adamodar[ordered_cols]
-
-        return df_adamodar
-
-
     # Plot historical Dashboard
     @st.fragment()
     def generate_graphs(self) -> None:
@@ -106,7 +55,7 @@ class EmRisk:
             <h3 style = 'color: white'>Spreads de Default e Prêmios de Risco</h3>
         """, unsafe_allow_html=True)
 
-        risk = self.get_adamodar_data()
+        risk = self.utils.get_adamodar_data()
 
         st.dataframe(risk, hide_index=True)
 
@@ -6,9 +6,11 @@ import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 import warnings
-import altair as alt
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
 
+@Metrics.instrument(prefixes=("get_",))
 class GlobalExUS:
     """GlobalExUS"""
 
@@ -56,7 +58,7 @@ class GlobalExUS:
                         unsafe_allow_html=True)
 
 
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("yfinance")
     def get_data(_self):
 
         return _self.extract.get_global_exus_data(), _self.extract.get_adamodar_data()
@@ -6,15 +6,13 @@ import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 import warnings
-import altair as alt
-import requests
-import pandas_datareader.data as pdr
 from streamlit_echarts import st_echarts
 import numpy as np
-import requests
-from bs4 import BeautifulSoup
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
 
+@Metrics.instrument(prefixes=("get_",))
 class GlobalAct:
     """Global ex US Markets 
     Macro Activity Indicators"""
@@ -55,29 +53,41 @@ class GlobalAct:
                             _self.config.vars.logo_bequest), width=400)
         
 
-    @st.cache_resource(show_spinner=False)
-    def get_countries_pmi(_self, pmi_type):
-        """Gets Countries PMI Indexes"""
-
-        try:
-            response = requests.get(_self.config.vars.pmi_paises.replace("{type}", pmi_type), 
-                                    headers = _self.config.headers)
+    @CachePolicy.swr("scraper")
+    def get_countries_pmi(_self, pmi_types: tuple) -> list:
+        """Gets Countries PMI Indexes
+        for all types concurrently"""
+
+        # import heavy module on demand
+        from bs4 import BeautifulSoup
+
+        responses = _self.extract.http.get_many(
+            [_self.config.vars.pmi_paises.replace("{type}", pmi_type) 
+             for pmi_type in pmi_types],
+            headers = _self.config.headers
+        )
+
+        tables = []
+        for response in responses:
+
+            try:
+                if not response.is_success:
+                    st.error("Não foi possível acessar o site - Trading Economics")
+
+                soup = BeautifulSoup(response.content, "html.parser")
+                elems = soup.find_all("td")
+                data = pd.DataFrame(
+                    [[elems[i].text.strip() for i in range(j, len(elems), 5)] for j in range(5)]
+                ).T
+                data.drop(data.columns[-1], axis=1, inplace=True)
+                data.columns =["País", "Último", "Anterior", "Referência"]
+
+            except Exception as error:
+                raise OSError(error) from error
             
-            if not response.ok:
-                st.error("Não foi possível acessar o site - Trading Economics")
-
-            soup = BeautifulSoup(response.content, "html.parser")
-            elems = soup.find_all("td")
-            data = pd.DataFrame(
-                [[elems[i].text.strip() for i in range(j, len(elems), 5)] for j in range(5)]
-            ).T
-            data.drop(data.columns[-1], axis=1, inplace=True)
-            data.columns =["País", "Último", "Anterior", "Referência"]
-
-        except Exception as error:
-            raise OSError(error) from error
+            tables.append(data)
         
-        return data
+        return tables
 
     # Plot historical Dashboard
     @st.fragment()
@@ -157,11 +167,12 @@ class GlobalAct:
                 st.markdown(f"""
                         <h3 style='color: white; text-align: left'>PMI - Pontos</h3>
                         """, unsafe_allow_html=True)
+                pmi_tables = self.get_countries_pmi(tuple(pmi.keys()))
                 for index, col in enumerate(st.columns(3)):
                     col.markdown(f"""
                         <h5 style='color: white; text-align: left'>{list(pmi.values())[index]}</h5>
                         """, unsafe_allow_html=True)
-                    col.dataframe(self.get_countries_pmi(list(pmi.keys())[index]), hide_index=True)
+                    col.dataframe(pmi_tables[index], hide_index=True)
 
         else:
             
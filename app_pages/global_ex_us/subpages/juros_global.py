@@ -7,13 +7,13 @@ from datetime import datetime, timedelta
 import streamlit as st
 import warnings
 from streamlit_echarts import st_echarts
-import pandas_datareader.data as pdr
 from pandas.tseries.offsets import *
-from scipy import interpolate
-from bs4 import BeautifulSoup
-import requests
 import numpy as np
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
+
+@Metrics.instrument(prefixes=("get_",))
 class GlobalInt:
     """Juros Global ex US"""
 
@@ -43,28 +43,40 @@ class GlobalInt:
 
         warnings.filterwarnings('ignore')    
 
-    @st.cache_resource(show_spinner=False)
-    def get_world_interest_rates(_self, continent):
-        """Gets Worlds Interest Rates"""
+    @CachePolicy.swr("scraper")
+    def get_world_interest_rates(_self, continents: tuple) -> list:
+        """Gets Worlds Interest Rates
+        for all continents concurrently"""
 
-        try:
-            response = requests.get(_self.config.vars.juros_paises.replace("{continente}", continent),
-                         headers=_self.config.headers)
-            
-            if not response.ok:
-                st.error(f"Erro na requisição ao site: {_self.config.vars.juros_paises}")
-            
-            soup = BeautifulSoup(response.content, "html.parser")
-            elems = soup.find_all("td")
-            
-            df = pd.DataFrame([[elems[i].text.strip() for i in range(j, len(elems), 5)] for j in range(5)]).T
-            df.drop(df.columns[-1], axis=1, inplace=True)
-            df.columns = ["País", "Atual", "Anterior", "Referência"]
+        # import heavy module on demand
+        from bs4 import BeautifulSoup
+
+        responses = _self.extract.http.get_many(
+            [_self.config.vars.juros_paises.replace("{continente}", continent)
+             for continent in continents],
+            headers=_self.config.headers
+        )
 
-        except Exception as error:
-            raise OSError(error) from error
+        tables = []
+        for response in responses:
+
+            try:
+                if not response.is_success:
+                    st.error(f"Erro na requisição ao site: {_self.config.vars.juros_paises}")
+                
+                soup = BeautifulSoup(response.content, "html.parser")
+                elems = soup.find_all("td")
+                
+                df = pd.DataFrame([[elems[i].text.strip() for i in range(j, len(elems), 5)] for j in range(5)]).T
+                df.drop(df.columns[-1], axis=1, inplace=True)
+                df.columns = ["País", "Atual", "Anterior", "Referência"]
+
+            except Exception as error:
+                raise OSError(error) from error
+            
+            tables.append(df)
         
-        return df
+        return tables
     
 
     @st.fragment()
@@ -81,8 +93,7 @@ class GlobalInt:
         c1, c2, c3 = st.columns([2, .5, 1])
         coluna1, coluna2, coluna3 = c1.columns([4,2,4], vertical_alignment="center")
                 
-        juros = [self.get_world_interest_rates(continent)
-                 for continent in continents.values()]
+        juros = self.get_world_interest_rates(tuple(continents.values()))
     
         c1.markdown(
                 f"""
@@ -40,6 +40,46 @@ class MainLayout:
         return f"MainLayout Class, staging dir: {str(self.data_dir)}"
 
 
+    def render_metrics_panel(self):
+        """Renders the fetch metrics
+        Only shown to admin users"""
+
+        # import local modules
+        from src.metrics import Metrics
+        from src.chart_cache import ChartCache
+        from src.single_flight import SingleFlight
+        from src.warmup import Warmup
+
+        metrics = Metrics()
+        warmup = Warmup.current()
+
+        with st.expander("Métricas de coleta", icon=":material/monitoring:"):
+            if warmup is not None:
+                last_run = f"{warmup.last_run:%Y-%m-%d %H:%M}" if warmup.last_run else "em andamento"
+                st.caption(f"Pré-carregamento, última execução: {last_run}")
+                warmup_report = warmup.report()
+                if not warmup_report.empty:
+                    st.dataframe(warmup_report)
+                if warmup.last_error:
+                    st.caption(f"Falha do pré-carregamento: {warmup.last_error}")
+
+            report = metrics.report()
+            if report.empty:
+                st.caption("Nenhuma coleta registrada")
+                return
+
+            st.dataframe(report[["calls", "hits", "misses", "errors", "error_rate",
+                                 "mean_seconds", "max_seconds", "bytes", "last_error"]])
+            st.dataframe(metrics.hosts_report())
+            st.caption("Cache de gráficos")
+            st.json(ChartCache().stats())
+            st.caption("Coletas simultâneas")
+            st.json(SingleFlight.stats())
+
+            if st.button("Exportar métricas"):
+                st.caption(", ".join(metrics.export()))
+
+
     def render_page(self):
         """Renders current page"""
 
@@ -49,6 +89,9 @@ class MainLayout:
                             self.config.vars.icone_bequest), size="medium")
             st.write("#")
 
+            if st.session_state.get("username") in self.config.vars.admin_usernames:
+                self.render_metrics_panel()
+
         us_macro = st.Page("app_pages/usa/macro.py", title="Indicadores Macro", icon=":material/account_balance:", default=True)
         us_market = st.Page("app_pages/usa/markets.py", title="Indicadores de Mercado", icon=":material/finance_mode:")
         br_macro = st.Page("app_pages/brasil/macro_br.py", title="Indicadores Macro", icon=":material/savings:")
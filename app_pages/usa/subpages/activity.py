@@ -6,13 +6,13 @@ import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 import warnings
-import altair as alt
-import requests
-import pandas_datareader.data as pdr
 from streamlit_echarts import st_echarts
 import numpy as np
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
 
+@Metrics.instrument(prefixes=("get_",))
 class UsAct:
     """US Macro Activity Indicators"""
 
@@ -24,11 +24,13 @@ class UsAct:
         from src.iface_extract import Extract
         from src.indicators import Indicators
         from app_pages.utils import Utils
+        from src.pyramid import SeriesPyramid
 
         self.config = Config()
         self.extract = Extract()
         self.indicators = Indicators()
         self.utils = Utils()
+        self.pyramid = SeriesPyramid()
 
         self.data_dir = self.config.vars.data_dir
         self.start = datetime(2000, 1, 1)
@@ -60,29 +62,22 @@ class UsAct:
                             _self.config.vars.logo_bequest), width=400)
         
     # Data Extraction
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("fred")
     def get_usa_macro_act_indicators(_self, ids: list) -> pd.DataFrame | list:
         """Download USA Macro Activity
           Indicators"""
 
-        ind_list = []
+        us_act_data = _self.extract.get_fred_data(ids)
 
-        for id in ids:
-            try:
-                ind_series = pdr.DataReader(id, "fred", _self.start, _self.end)
-                ind_list.append(ind_series)
-            except Exception as error:
-                raise OSError(error) from error
-
-        return ind_list
+        return [us_act_data[[id]].dropna() for id in ids]
 
         
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("gdp_now_atlanta")
     def get_recent_gdp_forecasts(_self) -> pd.DataFrame:
         """Gets recent forecasts
         for GDP Now"""
 
-        recent_gdp = pd.read_excel(_self.config.vars.gdp_atlanta, 
+        recent_gdp = _self.extract.downloads.read_excel(_self.config.vars.gdp_atlanta, 
                                    sheet_name="TrackingHistory", header=None)
         dates = recent_gdp.iloc[0]
         dates.dropna(inplace=True)
@@ -98,22 +93,22 @@ class UsAct:
         return df_gdp, cur_fc
     
 
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("gdp_now_ny")
     def get_ny_gdp_forecasts(_self) -> pd.DataFrame:
         """Gets NY FED gdp nowcast"""
         
-        recent_gdp = pd.read_excel(_self.config.vars.gdp_ny, sheet_name="Forecasts By Quarter", skiprows=5)
+        recent_gdp = _self.extract.downloads.read_excel(_self.config.vars.gdp_ny, sheet_name="Forecasts By Quarter", skiprows=5)
         recent_gdp = recent_gdp[["Forecast Date", "2025Q1"]].dropna()
         recent_gdp.set_index("Forecast Date", inplace=True)
         recent_gdp.index = pd.to_datetime(recent_gdp.index)
 
         return recent_gdp
     
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("dsge")
     def get_dsge(_self) -> pd.DataFrame:
         """gets NY FED DGSE Model"""
 
-        dsge_model = pd.read_excel(_self.config.vars.url_dsge, 
+        dsge_model = _self.extract.downloads.read_excel(_self.config.vars.url_dsge, 
                                    sheet_name="Output Growth (4Q)", 
                                    skiprows=5)
         
@@ -142,11 +137,12 @@ class UsAct:
                     index=0
                     )
                 
-                us_act_ind = self.get_usa_macro_act_indicators(ids=self.hist_ind_ids[1:])
-                us_act_ind.insert(0, self.utils.get_gdp("USA", self.hist_ind_ids[0]))
-                us_macro_act_data = us_act_ind[self.us_macro_act_hist.get(indicator_filter)]
-                if coluna2.toggle("Anual", value=True):
-                    us_macro_act_data = us_macro_act_data.resample("Y").first()
+                us_act_ind = [self.utils.get_gdp("USA", self.hist_ind_ids[0]),
+                              *self.get_usa_macro_act_indicators(ids=self.hist_ind_ids[1:])]
+                us_macro_act_raw = us_act_ind[self.us_macro_act_hist.get(indicator_filter)]
+                # every level is built once, the toggles only look them up
+                level = "Y" if coluna2.toggle("Anual", value=True) else "D"
+                us_macro_act_data = self.pyramid.get(us_macro_act_raw, level)
                 
             c1, c2, c3 = st.columns([6, .3, 3], vertical_alignment="center")
             
@@ -160,7 +156,7 @@ class UsAct:
             if coluna3.toggle("Variação Percentual"):
                 formatter = "%"
                 if indicator_filter != "PIB Real - FMI":
-                    us_macro_act_data = round(us_macro_act_data.pct_change().dropna(), 3) * 100
+                    us_macro_act_data = self.pyramid.get(us_macro_act_raw, level, change=True)
                 options = self.utils.bar_chart_dict(us_macro_act_data, title=indicator_filter)
             
             # c1.write("#")
@@ -215,8 +211,8 @@ class UsAct:
                 formatter = "%"
                 if "Varejo" in indicator_filter:
                     formatter = ""
-                    us_macro_act_forecast = us_macro_act_forecast.resample("Y")
-                    us_macro_act_forecast = us_macro_act_forecast.first().pct_change().dropna() * 100
+                    us_macro_act_forecast = self.pyramid.get(us_macro_act_forecast, "Y", change=True,
+                                                             decimals=None)
                 options = self.utils.bar_chart_dict(us_macro_act_forecast, title=indicator_filter)
 
             with c1.container():
@@ -6,14 +6,13 @@ import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 import warnings
-import altair as alt
-import requests
-import pandas_datareader.data as pdr
 from streamlit_echarts import st_echarts
 import numpy as np
-from fredapi import Fred
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
 
+@Metrics.instrument(prefixes=("get_",))
 class UsFinCond:
     """US Market Financial Conditions"""
 
@@ -25,11 +24,13 @@ class UsFinCond:
         from src.iface_extract import Extract
         from src.indicators import Indicators
         from app_pages.utils import Utils
+        from src.pyramid import SeriesPyramid
 
         self.config = Config()
         self.extract = Extract()
         self.indicators = Indicators()
         self.utils = Utils()
+        self.pyramid = SeriesPyramid()
 
         self.data_dir = self.config.vars.data_dir
         self.start = datetime(2000, 1, 1)
@@ -41,8 +42,6 @@ class UsFinCond:
         self.us_mkt_fincond = dict(zip(list(self.ind.keys()), 
                                list(range(4))))
         
-        self.fred = Fred(api_key=self.config.vars.FRED_API_KEY)
-        
         
         warnings.filterwarnings('ignore')
 
@@ -60,26 +59,14 @@ class UsFinCond:
                             _self.config.vars.logo_bequest), width=300)
         
 
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("fred")
     def get_market_indicators(_self) -> pd.DataFrame | list:
         """Downloads USA Market
           Indicators"""
         
-        ind_list = []
-
-        for ind in _self.ind_ids:
-            try:
-                ind_series = _self.fred.get_series(ind,
-                                                  observation_start=_self.start, 
-                                                  observation_end=_self.end)
-                ind_series = ind_series.to_frame(name=ind)
-                ind_series.index.name = "Date"
-                ind_list.append(ind_series)
-
-            except Exception as error:
-                raise OSError(error) from error
-            
-        return ind_list
+        us_cond_data = _self.extract.get_fred_data(_self.ind_ids)
+
+        return [us_cond_data[[ind]].dropna() for ind in _self.ind_ids]
 
 
     @st.fragment()
@@ -99,8 +86,9 @@ class UsFinCond:
             
             us_cond_ind = self.get_market_indicators()
         us_mkt_cond_data = us_cond_ind[self.us_mkt_fincond.get(indicator_filter)]
-        if coluna2.toggle("Anual", key="fincond_toggle"):
-            us_mkt_cond_data = us_mkt_cond_data.resample("Y").first().dropna()
+        # long daily series render at the finest level that fits the chart
+        level = "Y" if coluna2.toggle("Anual", key="fincond_toggle") else "auto"
+        us_mkt_cond_data = self.pyramid.get(us_mkt_cond_data, level, dropna=True)
 
         c1, c2, c3 = st.columns([6, .3, 3], vertical_alignment="center")
         
@@ -6,15 +6,13 @@ import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 import warnings
-import altair as alt
-import requests
-import pandas_datareader.data as pdr
 from streamlit_echarts import st_echarts
 import numpy as np
-from bs4 import BeautifulSoup
-from fredapi import Fred
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
 
+@Metrics.instrument(prefixes=("get_",))
 class UsFFR:
     """US Macro Federal Funds Indicators"""
 
@@ -39,57 +37,43 @@ class UsFFR:
         self.ind = self.indicators.get_theme_dict("us_macro_ffr")
         self.ind_ids = self.indicators.get_ids_list("us_macro_ffr")
 
-        self.fred = Fred(self.config.vars.FRED_API_KEY)
-        
         warnings.filterwarnings('ignore')
        
         
     # Data Extraction
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("fred")
     def get_ffr_indicator(_self) -> pd.DataFrame | list:
         """Download USA Macro FFRate
           Indicators"""
             
-        try:
-            ind_series = pdr.DataReader(_self.ind_ids[0], "fred", _self.start, _self.end)
-        except Exception as error:
-            raise OSError(error) from error
+        ind_series = _self.extract.get_fred_data(_self.ind_ids[0])
 
         return ind_series
     
     
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("fred")
     def get_ffrate_target_limits(_self) -> pd.DataFrame | list:
         """Gets ffrate targets limits"""
         
         ind_list = ["DFEDTARU", "DFEDTARL"]
-        series_list = []
-
-        for ind in ind_list:
-            try:
-                ind_series = _self.fred.get_series(ind,
-                                                  observation_start=_self.start, 
-                                                  observation_end=_self.end)
-                ind_series = ind_series.to_frame(name=ind)
-                ind_series.index.name = "Date"
-                series_list.append(ind_series)
-
-            except Exception as error:
-                raise OSError(error) from error
-            
-        return series_list
+        targets = _self.extract.get_fred_data(ind_list)
+
+        return [targets[[ind]].dropna() for ind in ind_list]
     
-    @st.cache_resource(show_spinner=False)
+    @CachePolicy.swr("scraper")
     def get_meetings_list(_self):
         """Gets CME Group expectations
         about next FFRate"""
 
+        # import heavy module on demand
+        from bs4 import BeautifulSoup
+
         try:
 
-            response = requests.get(_self.config.vars.url_next_ffr_cme, 
-                                    headers=_self.config.headers)
+            response = _self.extract.http.get(_self.config.vars.url_next_ffr_cme, 
+                                              headers=dict(_self.config.headers))
             
-            if not response.ok:
+            if not response.is_success:
                 raise FileNotFoundError(f"Não foi possível requisitar o site: {_self.config.vars.url_next_ffr_cme}")
             
             soup = BeautifulSoup(response.content, "html.parser")
@@ -116,7 +100,7 @@ class UsFFR:
         return cme_expectations
 
 
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("scraper")
     def get_cme_expectations(_self, meeting: str):
 
         cme_expectations = _self.get_meetings_list()
@@ -139,9 +123,9 @@ class UsFFR:
         
         return values
     
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("files")
     def get_real_natural_rate(_self):
-        dsge_model = pd.read_excel(_self.config.vars.url_dsge, 
+        dsge_model = _self.extract.downloads.read_excel(_self.config.vars.url_dsge, 
                                    sheet_name="Real Natural Rate (Percent)", 
                                    skiprows=5)
         
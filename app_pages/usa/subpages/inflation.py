@@ -6,13 +6,13 @@ import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 import warnings
-import altair as alt
-import requests
-import pandas_datareader.data as pdr
 from streamlit_echarts import st_echarts
 import numpy as np
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
 
+@Metrics.instrument(prefixes=("get_",))
 class UsInf:
     """US Macro Inflation Indicators"""
 
@@ -24,11 +24,13 @@ class UsInf:
         from src.iface_extract import Extract
         from src.indicators import Indicators
         from app_pages.utils import Utils
+        from src.pyramid import SeriesPyramid
 
         self.config = Config()
         self.extract = Extract()
         self.indicators = Indicators()
         self.utils = Utils()
+        self.pyramid = SeriesPyramid()
 
         self.data_dir = self.config.vars.data_dir
         self.start = datetime(2000, 1, 1)
@@ -50,21 +52,14 @@ class UsInf:
        
         
     # Data Extraction
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("fred")
     def get_usa_macro_inf_indicators(_self, ids: list) -> pd.DataFrame | list:
         """Download USA Macro Inflation
           Indicators"""
 
-        ind_list = []
+        us_inf_data = _self.extract.get_fred_data(ids)
 
-        for id in ids:
-            try:
-                ind_series = pdr.DataReader(id, "fred", _self.start, _self.end)
-                ind_list.append(ind_series)
-            except Exception as error:
-                raise OSError(error) from error
-
-        return ind_list
+        return [us_inf_data[[id]].dropna() for id in ids]
 
 
     # Plot historical Dashboard
@@ -88,11 +83,9 @@ class UsInf:
                 
                 us_inf_ind = self.get_usa_macro_inf_indicators(ids=self.hist_ind_ids)
             us_macro_inf_data = us_inf_ind[self.us_macro_inf_hist.get(indicator_filter)]
-            if coluna2.toggle("Anual", value=True, key="inflation_toggle"):
-                us_macro_inf_data = us_macro_inf_data.resample("Y").first().dropna()
-            
-            if indicator_filter != "Núcleo da Inflação":
-                us_macro_inf_data = round(us_macro_inf_data.pct_change().dropna(), 3) * 100
+            level = "Y" if coluna2.toggle("Anual", value=True, key="inflation_toggle") else "D"
+            us_macro_inf_data = self.pyramid.get(us_macro_inf_data, level, dropna=True,
+                                                 change=indicator_filter != "Núcleo da Inflação")
             
             c1, c2, c3 = st.columns([6, .3, 3], vertical_alignment="center")
             
@@ -132,11 +125,11 @@ class UsInf:
                     index=0 
                     )
                 
-            us_inf_forecasts = self.get_usa_macro_inf_indicators(ids=self.for_ind_ids[1:])
-            us_inf_forecasts.insert(0, self.utils.get_gdp("USA", self.for_ind_ids[0], forward=True))
+            us_inf_forecasts = [self.utils.get_gdp("USA", self.for_ind_ids[0], forward=True),
+                                *self.get_usa_macro_inf_indicators(ids=self.for_ind_ids[1:])]
             us_macro_inf_forecast = us_inf_forecasts[self.us_macro_inf_for.get(indicator_filter)]
-            if coluna2.toggle("Anual", value=True, key="inflation_toggle"):
-                us_macro_inf_forecast = us_macro_inf_forecast.resample("Y").first().dropna()
+            level = "Y" if coluna2.toggle("Anual", value=True, key="inflation_toggle") else "D"
+            us_macro_inf_forecast = self.pyramid.get(us_macro_inf_forecast, level, dropna=True)
 
             if "Implícita" in indicator_filter:
                 us_macro_inf_forecast = us_macro_inf_forecast.interpolate()
@@ -6,14 +6,12 @@ import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 import warnings
-import altair as alt
-import requests
-import pandas_datareader.data as pdr
 from streamlit_echarts import st_echarts
-import yfinance as yf
-from fredapi import Fred
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
 
+@Metrics.instrument(prefixes=("get_",))
 class UsExtras:
     """US Market Financial Conditions"""
 
@@ -41,29 +39,27 @@ class UsExtras:
         self.us_mkt_extras = dict(zip(list(self.ind.keys()), 
                                list(range(3))))
         
-        self.fred = Fred(api_key=self.config.vars.FRED_API_KEY)
+        self.fred = self.extract.fred
         
         warnings.filterwarnings('ignore')
 
         
 
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("yfinance")
     def get_dxy_series(_self) -> pd.DataFrame:
             """Downloads dolar 
             index series"""
 
-            try:
-                dxy = yf.download(_self.ind_ids[1], start=_self.start, end=_self.end,
-                                          progress=False)["Close"]
-
-            except Exception as error:
-                raise OSError(error) from error
+            dxy = _self.extract.get_yf_data(_self.ind_ids[1])
             
             return dxy
 
     def get_mkt_returns(_self) -> pd.DataFrame:
         """Downloads ff mkt-rf returns"""
 
+        # import heavy module on demand
+        import pandas_datareader.data as pdr
+
         try:
             asset_series = pdr.DataReader(_self.ind_ids[0], 
                                           "famafrench", _self.start, _self.end)[0]["Mkt-RF"]
@@ -76,14 +72,11 @@ class UsExtras:
         return asset_series
     
 
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("yfinance")
     def get_vix_index(_self) -> pd.DataFrame:
         """Gets vix index"""
 
-        try:
-            data = yf.download(_self.ind_ids[-1], _self.start, _self.end, progress=False)["Close"]
-        except Exception as error:
-            raise OSError(error) from error
+        data = _self.extract.get_yf_data(_self.ind_ids[-1])
         
         return data
 
@@ -6,14 +6,13 @@ import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 import warnings
-import altair as alt
-import requests
-import pandas_datareader.data as pdr
 from streamlit_echarts import st_echarts
 import numpy as np
-import requests
-from bs4 import BeautifulSoup
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
+
+@Metrics.instrument(prefixes=("get_",))
 class SPMult:
     """S&P 500 Multiples"""
 
@@ -45,19 +44,27 @@ class SPMult:
         warnings.filterwarnings('ignore')        
 
     
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("scraper")
     def get_sp_multiples(_self) -> pd.DataFrame | tuple:
         """Scraps the S&P500
         multiples"""
 
+        # import heavy module on demand
+        from bs4 import BeautifulSoup
+
         multas_base_url = _self.config.vars.mult_base_url
         mults_dict = {mult: [] for mult in _self.config.vars.sp_mult_urls}
 
-        for mult in _self.config.vars.sp_mult_urls:
+        # the three tables are requested at once
+        responses = _self.extract.http.get_many(
+            [f"{multas_base_url}/{mult}" for mult in _self.config.vars.sp_mult_urls],
+            verify=False
+        )
+
+        for mult, response in zip(_self.config.vars.sp_mult_urls, responses):
 
             try:
-                response = requests.get(f"{multas_base_url}/{mult}", verify=False)
-                if not response.ok:
+                if not response.is_success:
                     raise FileNotFoundError(f"Unable to request the {mult}")
                 
                 soup = BeautifulSoup(response.content, "html.parser")
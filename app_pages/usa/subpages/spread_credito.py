@@ -6,14 +6,13 @@ import pandas as pd
 from datetime import datetime, timedelta
 import streamlit as st
 import warnings
-import altair as alt
-import requests
-import pandas_datareader.data as pdr
 from streamlit_echarts import st_echarts
 import numpy as np
-from fredapi import Fred
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
 
+@Metrics.instrument(prefixes=("get_",))
 class UsCredSpread:
     """US Market Credit Spread"""
 
@@ -25,11 +24,13 @@ class UsCredSpread:
         from src.iface_extract import Extract
         from src.indicators import Indicators
         from app_pages.utils import Utils
+        from src.pyramid import SeriesPyramid
 
         self.config = Config()
         self.extract = Extract()
         self.indicators = Indicators()
         self.utils = Utils()
+        self.pyramid = SeriesPyramid()
 
         self.data_dir = self.config.vars.data_dir
         self.start = datetime(2000, 1, 1)
@@ -41,14 +42,14 @@ class UsCredSpread:
         self.us_mkt_cred_spread = dict(zip(list(self.ind.keys()), 
                                list(range(2))))
         
-        self.fred = Fred(api_key=self.config.vars.FRED_API_KEY)
+        self.fred = self.extract.fred
         
         
         warnings.filterwarnings('ignore')
 
         
 
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("fred")
     def get_market_indicators(_self) -> pd.DataFrame | list:
         """Downloads USA Market
           Indicators"""
@@ -87,8 +88,9 @@ class UsCredSpread:
             
             us_spread_ind = self.get_market_indicators()
         us_mkt_spread_data = us_spread_ind[self.us_mkt_cred_spread.get(indicator_filter)]
-        if coluna2.toggle("Anual", value=True, key="cred_spread_toggle"):
-            us_mkt_spread_data = us_mkt_spread_data.resample("Y").first().dropna()
+        # long daily series render at the finest level that fits the chart
+        level = "Y" if coluna2.toggle("Anual", value=True, key="cred_spread_toggle") else "auto"
+        us_mkt_spread_data = self.pyramid.get(us_mkt_spread_data, level, dropna=True)
         
         us_mkt_spread_data = us_mkt_spread_data.interpolate()
 
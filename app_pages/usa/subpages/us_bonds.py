@@ -7,10 +7,12 @@ from datetime import datetime, timedelta
 import streamlit as st
 import warnings
 from streamlit_echarts import st_echarts
-import pandas_datareader.data as pdr
 from pandas.tseries.offsets import *
-from scipy import interpolate
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
+
+@Metrics.instrument(prefixes=("get_",))
 class BondsYields:
     """US Bonds Yields"""
 
@@ -40,24 +42,21 @@ class BondsYields:
         warnings.filterwarnings('ignore')
 
 
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("fred")
     def get_bonds_yields(_self, yields_list) -> pd.DataFrame | list:
         """Downloads the US Gov
           Bonds Yields"""
         
-        try:
-            yield_series = pdr.DataReader(yields_list, "fred", _self.start, _self.end)
-        except Exception as error:
-            raise OSError(error) from error
+        yield_series = _self.extract.get_fred_data(yields_list)
 
         return yield_series
     
 
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("files")
     def get_bonds_futures(_self):
 
-        data_24 = pd.read_csv(_self.config.vars.par_yield_curves_2024)
-        data_25 = pd.read_csv(_self.config.vars.par_yield_curves_2025)
+        data_24 = _self.extract.downloads.read_csv(_self.config.vars.par_yield_curves_2024)
+        data_25 = _self.extract.downloads.read_csv(_self.config.vars.par_yield_curves_2025)
 
         data = pd.concat([data_24, data_25], ignore_index=True)
         data.set_index("Date", inplace=True)
@@ -67,7 +66,7 @@ class BondsYields:
         return data
     
     
-    @st.cache_data(show_spinner=False)
+    @CachePolicy.swr("fred")
     def own_expectations(_self):
         
             lista_meetings = _self.ffr.get_meetings_list()
@@ -106,7 +105,8 @@ class BondsYields:
         
                 yields_data = self.get_bonds_yields(self.yields_list[1:-1]).interpolate()
 
-            options = self.utils.multiple_5series_echart(yields_data, title="Market Yields on U.S Treasuries")
+            options = self.utils.multiple_series_echart(yields_data, title="Market Yields on U.S Treasuries",
+                                                        names=["2 Anos", "5 Anos", "10 Anos", "20 Anos", "30 Anos"])
 
             with st.container():
                 st.html("<span class='column_graph'></span>")
@@ -147,11 +147,15 @@ class BondsYields:
                            "6 Meses": six_month_values,
                            "1 Ano": year_month_values})
             
-            options = self.utils.multiple_interest(df, title = "Curva de Juros Atual", 
-                                               smooth=True,
-                                              marker=True,
-                                              min_value=min_value,
-                                              max_value=max_value)
+            if -.50 < df["1 Ano"].round(3).min() < 0:
+                min_value -= 2
+
+            options = self.utils.multiple_series_echart(df, title = "Curva de Juros Atual", 
+                                                        names=["Atual", "1 mês", "3 meses", "6 meses", "1 ano"],
+                                                        x_column="Treasury",
+                                                        min_value=min_value,
+                                                        max_value=max_value,
+                                                        data_view=True)
             with st.container():
                 st.html("<span class='column_graph'></span>")
                 col,_ = st.columns([10,.05])
@@ -216,7 +220,10 @@ class BondsYields:
                 coluna1.warning("Por favor, preencha todos os valores antes de continuar.")
             else:
 
-                options = self.utils.multiple_3series_echart(edited_df, title="Curva de Juros - Expectativas")
+                options = self.utils.multiple_series_echart(edited_df, title="Curva de Juros - Expectativas",
+                                                            x_column="Dias Úteis",
+                                                            columns=["Cenário Positivo", "Cenário Neutro", "Cenário Negativo"],
+                                                            smooth=True)
                 with c2.container():
                     st.html("<span class='column_graph'></span>")
                     col,_ = st.columns([10,.05])
@@ -2,34 +2,103 @@
 import pandas as pd
 import streamlit as st
 import numpy as np
+from functools import lru_cache
 from src.iface_config import Config
+from src.iface_extract import Extract
 from datetime import datetime
 import requests
-from bcb import sgs
-from streamlit_echarts import st_echarts
+from streamlit_echarts import st_echarts, JsCode
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
+from src.chart_cache import ChartCache
 
+
+@Metrics.instrument(prefixes=(), names=("get_gdp", "get_bcb", "get_bcb_many",
+                                           "get_br_implied_inflation", "get_adamodar_data"))
 class Utils:
     """Utils functions"""
 
+    # dataset dimension holding the x axis
+    x_dimension = "_x"
+
     def __init__(self):
         
         self.config = Config()
+        self.extract = Extract()
         self.start = datetime(2000, 1, 1)
         self.end = datetime.today()
 
-    @st.cache_resource(show_spinner=False)
+    @staticmethod
+    def lttb_indices(y, max_points: int) -> np.ndarray:
+        """Largest Triangle Three Buckets
+        Return the positions to keep"""
+
+        size = len(y)
+        if max_points >= size or max_points < 3:
+            return np.arange(size)
+
+        x = np.arange(size, dtype=float)
+        y = np.asarray(y, dtype=float)
+        edges = np.linspace(1, size - 1, max_points - 1).astype(int)
+
+        selected = np.empty(max_points, dtype=int)
+        selected[0], selected[-1] = 0, size - 1
+        previous = 0
+
+        for bucket in range(max_points - 2):
+            start, end = edges[bucket], edges[bucket + 1]
+            # average point of the next bucket is the third vertex
+            next_end = edges[bucket + 2] if bucket + 2 < len(edges) else size
+            next_x = x[end:next_end].mean()
+            next_y = y[end:next_end].mean()
+
+            area = np.abs(
+                (x[previous] - next_x) * (y[start:end] - y[previous])
+                - (x[previous] - x[start:end]) * (next_y - y[previous])
+            )
+            previous = start + int(np.argmax(area))
+            selected[bucket + 1] = previous
+
+        return selected
+
+
+    def downsample(self, data: pd.DataFrame, max_points: int = None) -> pd.DataFrame:
+        """Reduces the chart to the point budget
+        keeping the extremes of every column"""
+
+        max_points = self.config.vars.chart_max_points if max_points is None else max_points
+        if not max_points or len(data) <= max_points:
+            return data
+
+        # the lines share the x axis, so the budget is split between them
+        column_points = max(max_points // len(data.columns), 3)
+
+        keep = set()
+        for column in data.columns:
+            values = data[column].interpolate(limit_direction="both").fillna(0).to_numpy()
+            keep.update(self.lttb_indices(values, column_points).tolist())
+            keep.update([int(np.argmin(values)), int(np.argmax(values))])
+
+        return data.iloc[sorted(keep)]
+
+
+    @ChartCache.memoize
     def echart_dict(_self, data,
                     title: str = "",
                     label_format: str = "",
                     marker: bool = False,
                     smooth: bool = False,
                     mean: bool = False,
-                    min_zoom = 0):
+                    min_zoom = 0,
+                    max_points: int = None):
         """Renders Java Script Graphics"""
 
+        full_mean = round(float(data[data.columns[0]].mean()), 3)
+        data = _self.downsample(data, max_points)
+
         # considering that most of the graphs are time series
-        x_data = data.index.strftime("%d/%m/%Y").tolist()
-        y_data = [round(value, 3) for value in data[data.columns[0]].tolist()]
+        dataset = _self.dataset(data[[data.columns[0]]])
+        y_data = [value for value in dataset["source"][str(data.columns[0])] if value is not None]
 
         min_value = int(min(y_data) - (.5 * abs(min(y_data))))
 
@@ -58,7 +127,7 @@ class Utils:
                         "backgroundColor": '#505765'
                     }
                 },
-                "formatter": f"{{c}}{label_format}"
+                "valueFormatter": _self.value_formatter(label_format)
             },
             "toolbox": {
                 "feature": {
@@ -71,10 +140,8 @@ class Utils:
                 {"show": True, "realtime": True, "start": min_zoom, "end": 100},
                 {"type": 'inside', "realtime": True, "start": min_zoom, "end": 100}
             ],
-            "xAxis": {
-                "type": 'category',
-                "data": x_data
-            },
+            "dataset": dataset,
+            "xAxis": _self.x_axis(data.index),
             "yAxis": [{
                 "type": "value",
                 "axisLabel": {"formatter": f"{{value}}{label_format}"},
@@ -89,14 +156,15 @@ class Utils:
                     "lineStyle": {
                         "color": _self.config.base_color
                     },
-                    "data": y_data
+                    "encode": _self.encode(data.columns[0])
                 }
             ]
         }
 
         if mean:
+            # computed on the full series, not on the downsampled one
             options["series"][0]["markLine"] = {
-                                            "data": [{"type": "average", "name": "Média"}],
+                                            "data": [{"yAxis": full_mean, "name": "Média"}],
                                                     "label": {
                                                     "position": "end",  
                                                     "offset": [-50, 20], 
@@ -107,18 +175,116 @@ class Utils:
         return options
 
 
-    @st.cache_resource(show_spinner=False)
-    def multiple_5series_echart(_self, data, title: str = ""):
-        """Renders Java Script Graphics"""
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def cached_time_axis(dates: bytes) -> tuple:
+        """Converts a date axis to epoch
+        milliseconds once per distinct index"""
 
-        # considering that most of the graphs are time series
-        x_data = data.index.strftime("%d/%m/%Y").tolist()
+        return tuple((np.frombuffer(dates, dtype="int64") // 1_000_000).tolist())
+
+
+    def x_axis_values(self, index) -> list:
+        """Gets the x axis values
+        Dates as epoch milliseconds"""
+
+        if not isinstance(index, pd.DatetimeIndex):
+            return index.tolist()
+
+        dates = index.tz_localize(None) if index.tz is not None else index
 
-        y_data_1 = [round(value, 3) for value in data[data.columns[0]].tolist()]
-        y_data_2 = [round(value, 3) for value in data[data.columns[1]].tolist()]
-        y_data_3 = [round(value, 3) for value in data[data.columns[2]].tolist()]
-        y_data_4 = [round(value, 3) for value in data[data.columns[3]].tolist()]
-        y_data_5 = [round(value, 3) for value in data[data.columns[4]].tolist()]
+        return list(self.cached_time_axis(dates.as_unit("ns").asi8.tobytes()))
+
+
+    def x_axis(self, index, **kwargs) -> dict:
+        """Gets a time axis for dates
+        and a category axis otherwise"""
+
+        if isinstance(index, pd.DatetimeIndex):
+            axis = {"type": "time", "axisLabel": {"formatter": "{dd}/{MM}/{yyyy}"}}
+        else:
+            axis = {"type": "category"}
+        axis.update(kwargs)
+
+        return axis
+
+
+    def value_formatter(self, label_format: str = "") -> str:
+        """Tooltip value formatter, string
+        templates do not read dataset rows"""
+
+        return JsCode(
+            f"function (value) {{ return value == null ? '-' : value + '{label_format}'; }}"
+        ).js_code
+
+
+    def dataset(self, data: pd.DataFrame, decimals: int = 3) -> dict:
+        """ECharts column oriented dataset
+        One key per column plus the x axis"""
+
+        source = {self.x_dimension: self.x_axis_values(data.index)}
+        source.update(zip(map(str, data.columns), self.series_values(data, decimals)))
+
+        return {"source": source}
+
+
+    def encode(self, column) -> dict:
+        """Maps a series to its
+        dataset column"""
+
+        return {"x": self.x_dimension, "y": str(column)}
+
+
+    def series_values(self, data: pd.DataFrame, decimals: int = 3) -> list:
+        """Rounds all the columns in one pass
+        Return one list per column, NaN as None"""
+
+        values = np.round(data.to_numpy(dtype=float), decimals)
+        columns = values.T.astype(object)
+        columns[np.isnan(values.T)] = None
+
+        return columns.tolist()
+
+
+    @ChartCache.memoize
+    def multiple_series_echart(_self, data,
+                               title: str = "",
+                               names: list = None,
+                               x_column: str = None,
+                               columns: list = None,
+                               label_format: str = "%",
+                               marker: bool = False,
+                               smooth: bool = False,
+                               min_value: float = None,
+                               max_value: float = None,
+                               data_view: bool = False,
+                               max_points: int = None):
+        """Renders Java Script Graphics
+        One line per column, any number of columns"""
+
+        if x_column is not None:
+            data = data.set_index(x_column)
+        if columns is not None:
+            data = data[columns]
+        if isinstance(data.index, pd.DatetimeIndex):
+            data = _self.downsample(data, max_points)
+
+        names = names or [str(column) for column in data.columns]
+
+        toolbox = {"dataZoom": {"yAxisIndex": 'none'}, "restore": {}}
+        if data_view:
+            toolbox["dataView"] = {"readOnly": False}
+        else:
+            toolbox["saveAsImage"] = {}
+
+        y_axis = {
+            "type": "value",
+            "axisLabel": {"formatter": f"{{value}}{label_format}"}
+        }
+        if min_value is not None:
+            y_axis["min"] = min_value
+        if max_value is not None:
+            y_axis["max"] = max_value
 
         options = {
 
@@ -141,82 +307,50 @@ class Utils:
                     "label": {
                         "backgroundColor": '#505765'
                     },
-                    "formatter": f"{{c}}%"
                 },
+                "valueFormatter": _self.value_formatter(label_format)
             },
             "legend": {
-                "data": ["2 Anos", "5 Anos", "10 Anos", "20 Anos", "30 Anos"],
+                "data": names,
                 "right": 140,
                 "top": 10
             },
             "toolbox": {
-                "feature": {
-                    "dataZoom": {"yAxisIndex": 'none'},
-                    "restore": {},
-                    "saveAsImage": {}
-                }
+                "feature": toolbox
             },
             "dataZoom": [
                 {"show": True, "realtime": True, "start": 0, "end": 100},
                 {"type": 'inside', "realtime": True, "start": 0, "end": 100}
             ],
-            "xAxis": {
-                "type": 'category',
-                "data": x_data
-            },
-            "yAxis": {
-                "type": "value",
-                "axisLabel": {
-                            "formatter": "{value}%"
-                        }
-            },
+            "animationDurationUpdate": 1000,
+            "dataset": _self.dataset(data),
+            "xAxis": _self.x_axis(data.index),
+            "yAxis": y_axis,
             "series": [
                 {
-                    "name": "2 Anos",
-                    "type": "line",
-                    "showSymbol": False,
-                    "emphasis": {"focus": "series"},
-                    "data": y_data_1
-                },
-                {
-                    "name": "5 Anos",
-                    "type": "line",
-                    "showSymbol": False,
-                    "emphasis": {"focus": "series"},
-                    "data": y_data_2
-                },
-                {
-                    "name": "10 Anos",
-                    "type": "line",
-                    "showSymbol": False,
-                    "emphasis": {"focus": "series"},
-                    "data": y_data_3
-                },
-                {
-                    "name": "20 Anos",
-                    "type": "line",
-                    "showSymbol": False,
-                    "emphasis": {"focus": "series"},
-                    "data": y_data_4
-                },
-                {
-                    "name": "30 Anos",
+                    "name": name,
                     "type": "line",
-                    "showSymbol": False,
+                    "showSymbol": marker,
+                    "smooth": smooth,
                     "emphasis": {"focus": "series"},
-                    "data": y_data_5
+                    "encode": _self.encode(column)
                 }
+                for name, column in zip(names, data.columns)
             ]
         }
 
         return options
-    
-    @st.cache_resource(show_spinner=False)
-    def bar_chart_dict(_self, data, title, min_zoom: int = 0, label_format: str = "%"):
+
+
+    @ChartCache.memoize
+    def bar_chart_dict(_self, data, title, min_zoom: int = 0, label_format: str = "%",
+                       max_points: int = None):
         """Renders Java Script Graphics"""
 
-        x_data = data.index.strftime("%d/%m/%Y").tolist()
-        y_data = [round(value, 3) for value in data[data.columns[0]].tolist()]
+        data = _self.downsample(data, max_points)
+
+        dataset = _self.dataset(data[[data.columns[0]]])
+        y_data = [value for value in dataset["source"][str(data.columns[0])] if value is not None]
 
         min_value = int(min(y_data) - (.5 * abs(min(y_data))))
         max_value = int(max(y_data) + (.5 * abs(max(y_data))))
@@ -235,7 +369,7 @@ class Utils:
                     "label": {
                         "backgroundColor": '#505765'
                     },
-                "formatter": f"{{c}}{label_format}"
+                "valueFormatter": _self.value_formatter(label_format)
             },
             "toolbox": {
                 "feature": {
@@ -258,15 +392,9 @@ class Utils:
                 "textStyle": {"color": "#FFFFFF"}
             },
             "backgroundColor": "#0E1117",
+            "dataset": dataset,
             "xAxis": [
-                {
-                    "type": "category",
-                    "boundaryGap": True,
-                    "data": x_data,
-                    "axisTick": {
-                        "alignWithLabel": True
-                    }
-                }
+                _self.x_axis(data.index, axisTick={"alignWithLabel": True})
             ],
             "yAxis": [
                 {
@@ -280,7 +408,7 @@ class Utils:
                 {
                     "name": "",
                     "type": "bar",
-                    "data": y_data,
+                    "encode": _self.encode(data.columns[0]),
                     "itemStyle": {
                         "barBorderRadius": [6, 6, 0, 0]
                     }
@@ -290,7 +418,7 @@ class Utils:
 
         return options
     
-    @st.cache_resource(show_spinner=False)
+    @ChartCache.memoize
     def simple_bar_chart_dict(_self, x, y, title):
         """Renders Java Script Graphics"""
 
@@ -365,7 +493,7 @@ class Utils:
 
         return options
     
-    @st.cache_resource(show_spinner=False)
+    @ChartCache.memoize
     def confint_chart(_self, data,
                       title: str = "",
                       label_format: str = "",
@@ -375,10 +503,8 @@ class Utils:
         """Renders Java Script Graphics"""
 
         # considering that most of the graphs are time series
-        x_data = data.index.strftime("%d/%m/%Y").tolist()
-        y_data = [round(value, 3) for value in data[data.columns[0]].tolist()]
-        lower_bound = np.array([round(value, 3) for value in data[data.columns[1]].tolist()])
-        upper_bound = np.array([round(value, 3) for value in data[data.columns[2]].tolist()])
+        dataset = _self.dataset(data[data.columns[:3]])
+        y_data = [value for value in dataset["source"][str(data.columns[0])] if value is not None]
 
 
         min_value = int(min(y_data) - (.5 * abs(min(y_data))))
@@ -389,10 +515,8 @@ class Utils:
             "title": {"text": title},
             "tooltip": {"trigger": "axis"},
             "backgroundColor": "#0E1117",
-            "xAxis": {
-                "type": "category",
-                "data": x_data,
-            },
+            "dataset": dataset,
+            "xAxis": _self.x_axis(data.index),
             "toolbox": {
                 "feature": {
                     "dataZoom": {"yAxisIndex": 'none'},
@@ -411,7 +535,7 @@ class Utils:
                 {
                     "name": r"Limite Superior (68% de Confiança)",
                     "type": "line",
-                    "data": upper_bound.tolist(),
+                    "encode": _self.encode(data.columns[2]),
                     "lineStyle": {"opacity": 0},
                     "areaStyle": {"color": "#ccc", "opacity": 0.2},
                     "stack": "confidence-band",
@@ -420,13 +544,13 @@ class Utils:
                 {
                     "name": "Média",
                     "type": "line",
-                    "data": y_data,
+                    "encode": _self.encode(data.columns[0]),
                     "showSymbol": False,
                 },
                 {
                     "name": r"Limite Inferior (68% de confiança)",
                     "type": "line",
-                    "data": lower_bound.tolist(),
+                    "encode": _self.encode(data.columns[1]),
                     "lineStyle": {"opacity": 0},
                     "areaStyle": {"color": "#ccc", "opacity": 0.2},
                     "stack": "confidence-band",
@@ -438,249 +562,135 @@ class Utils:
         return option
     
 
-    @st.cache_data(show_spinner=False)
     def get_gdp(_self, country: str, ind, forward=False):
-        """Gets IMF indicator"""
+        """Gets IMF indicator
+        of a country"""
 
-        url = f"{_self.config.vars.imf_gdp}/{ind}/"
+        # the matrix of every country is downloaded once per indicator
+        indicator = _self.extract.get_imf_data(ind)
+        if country not in indicator.columns:
+            raise OSError(f"No IMF data for {country} in {ind}")
+
+        data = indicator[[country]].rename(columns={country: "values"}).dropna()
+        if forward:
+            data = data[(data.index.year >= _self.end.year)]
+        else:
+            data = data[(data.index.year <= datetime.today().year) & (data.index.year >= _self.start.year)]
 
-        try:
-            response = requests.get(url)
-            if not response.ok:
-                print(f"Error in API requisition: {response.status_code}")
-            else:
-                response = response.json()
-                indicator = response["values"][ind]
-                dates = [year for year in indicator[country].keys()]
-                values = [value for value in indicator[country].values()]
-
-                data = pd.DataFrame({"Date": dates,
-                                     "values": values})
-                data.set_index("Date", inplace=True)
-                data.index = pd.to_datetime(data.index, format="%Y")
-                if forward: 
-                    data = data[(data.index.year >= _self.end.year)]
-                else:
-                    data = data[(data.index.year <= datetime.today().year) & (data.index.year >= _self.start.year)]
-                
-        except Exception as error:
-            raise OSError(error) from error
-        
         return data
-    
 
-    @st.cache_data(show_spinner=False)
+
+    @CachePolicy.swr("sgs")
     def get_bcb(_self, name, series: str):
         """Gets BCB Series"""
 
+        data = _self.extract.get_sgs_series(series)
+
+        # a renamed copy, the fetched frame is shared with other callers
+        return data.set_axis([name], axis=1)
+
+
+    @CachePolicy.swr("sgs")
+    def get_bcb_many(_self, series: dict) -> list:
+        """Gets many BCB Series, {name: code}
+        Return one frame per name, in order"""
+
+        data = _self.extract.get_sgs_data(list(series.values()))
+
+        return [data[code].set_axis([name], axis=1) for name, code in series.items()]
+
+
+    @CachePolicy.swr("scraper")
+    def get_br_implied_inflation(_self) -> pd.DataFrame:
+        """Scrap Implied Inflation
+        data for specific vertices"""
+
+        # import heavy module on demand
+        from bs4 import BeautifulSoup
+
+        url = _self.config.vars.url_anbima_inf
+
         try:
-            
-            data = sgs.get({name: series}, start=_self.start, end=_self.end)
-                
+            response = _self.extract.http.get(url)
+            if not response.is_success:
+                raise FileNotFoundError(f"Unable to request the AMBIMA web site")
+            soup = BeautifulSoup(response.content, "html.parser")
+
+            lista_elems = [elem.text for elem in soup.find_all("div", id="ETTJs")]
+            lista_elems = [elem.replace("\n", " ").replace("\t", " ") for elem in lista_elems]
+            lista_elems = lista_elems[0].split(" ")
+            lista_elems = [elem for elem in lista_elems if elem not in [" ", ""]]
+            lista_elems = lista_elems[lista_elems.index("Implícita") + 1:lista_elems.index("2.394") + 4]
+
+            lista_vertices = [int(lista_elems[i].replace(".", "")) for i in range(0, len(lista_elems) - 2, 4)]
+            lista_eetj_ntnb = [float(lista_elems[i].replace(",", ".")) for i in range(1, len(lista_elems) - 1, 4)]
+            lista_eetj_pre = [float(lista_elems[i].replace(",", ".")) for i in range(2, len(lista_elems), 4)]
+            lista_inf_implicita = [float(lista_elems[i].replace(",", ".")) for i in range(3, len(lista_elems) + 1, 4)]
+
         except Exception as error:
             raise OSError(error) from error
         
-        return data
-    
+        df_implicita = pd.DataFrame({"Vértice": lista_vertices,
+                                     "ETTJ PRE": lista_eetj_pre,
+                                     "ETTJ NTNB": lista_eetj_ntnb,
+                                     "Inflação Implicita": lista_inf_implicita})
 
-    def multiple_3series_echart(_self, data, title: str = ""):
-        """Renders Java Script Graphics"""
+        return df_implicita
 
-        # considering that most of the graphs are time series
-        x_data = data[data.columns[1]].tolist()
 
-        y_data_1 = [round(value, 3) for value in data[data.columns[2]].tolist()]
-        y_data_2 = [round(value, 3) for value in data[data.columns[3]].tolist()]
-        y_data_3 = [round(value, 3) for value in data[data.columns[4]].tolist()]
+    @CachePolicy.swr("scraper")
+    def get_adamodar_data(_self) -> pd.DataFrame:
+        """Scraps the adamodar 
+        Default Spreads and Risks data"""
 
-        options = {
+        # import heavy module on demand
+        from bs4 import BeautifulSoup
 
-            "color": _self.config.multiple_color,
-            "title": {
-                "text": title,
-                "textStyle": {"color": "#FFFFFF"}
-            },
-            "grid": {
-                "left": "0%", 
-                "right": "1%", 
-                "containLabel": True
-            },
-            "backgroundColor": "#0E1117",
-            "tooltip": {
-                "trigger": 'axis',
-                "axisPointer": {
-                    "type": 'cross',
-                    "animation": False,
-                    "label": {
-                        "backgroundColor": '#505765'
-                    },
-                    "formatter": f"{{c}}%"
-                },
-            },
-            "legend": {
-                "data": ["Cenário Positivo", "Cenário Neutro", "Cenário Negativo"],
-                "right": 140,
-                "top": 10
-            },
-            "toolbox": {
-                "feature": {
-                    "dataZoom": {"yAxisIndex": 'none'},
-                    "restore": {},
-                    "saveAsImage": {}
-                }
-            },
-            "dataZoom": [
-                {"show": True, "realtime": True, "start": 0, "end": 100},
-                {"type": 'inside', "realtime": True, "start": 0, "end": 100}
-            ],
-            "animationDurationUpdate": 1000,
-            "xAxis": {
-                "type": 'category',
-                "data": x_data
-            },
-            "yAxis": {
-                "type": "value",
-                "axisLabel": {
-                            "formatter": "{value}%"
-                        }
-            },
-            "series": [
-                {
-                    "name": "Cenário Positivo",
-                    "type": "line",
-                    "showSymbol": False,
-                    "smooth": True,
-                    "emphasis": {"focus": "series"},
-                    "data": y_data_1
-                },
-                {
-                    "name": "Cenário Neutro",
-                    "type": "line",
-                    "showSymbol": False,
-                    "smooth": True,
-                    "emphasis": {"focus": "series"},
-                    "data": y_data_2
-                },
-                {
-                    "name": "Cenário Negativo",
-                    "type": "line",
-                    "showSymbol": False,
-                    "smooth": True,
-                    "emphasis": {"focus": "series"},
-                    "data": y_data_3
-                },
-            ]
-        }
+        def clean_list(lst, begin, step = 6):
 
-        return options
-    
+            return [" ".join(lst[i].replace("\n", "").split()) for i in range(begin, len(lst) - (5 - begin), step)][:-1]
 
-    def multiple_4series_echart(_self, data, curva_real, title: str = ""):
-        """Renders Java Script Graphics"""
+        try:
+            response = _self.extract.http.get(_self.config.vars.adamodar_url)
+            if not response.is_success:
+                raise FileNotFoundError("Could not requets the Adamodar Data")
+            soup = BeautifulSoup(response.content, "html.parser")
 
-        # considering that most of the graphs are time series
-        x_data = data[data.columns[1]].tolist()
+            elems = soup.find_all("td")
 
-        y_data_1 = [round(value, 3) for value in data[data.columns[2]].tolist()]
-        y_data_2 = [round(value, 3) for value in data[data.columns[3]].tolist()]
-        y_data_3 = [round(value, 3) for value in data[data.columns[4]].tolist()]
+            elems = [elem.text.strip() for elem in elems]
+            elems = [elem for elem in elems[elems.index("Country"):]]
 
-        curva_real = round(curva_real, 2).values.tolist()
+        except Exception as error:
+            raise OSError(error) from error
+        
+        countrys = clean_list(elems, 0)
+        adj_default_spread = clean_list(elems, 1)
+        equity_risk = clean_list(elems, 2)
+        country_risk_premium = clean_list(elems, 3)
+        corporate_tax_rate = clean_list(elems, 4)
+        moodys = clean_list(elems, 5)
+
+        df_adamodar = pd.DataFrame([countrys, adj_default_spread, 
+                                    equity_risk, country_risk_premium,
+                                    corporate_tax_rate, moodys]).T
+        
+        df_adamodar.columns = df_adamodar.iloc[0]
+        df_adamodar.drop(0, inplace=True)
 
-        min_value = min([y_data_1, y_data_2, y_data_3])
-        max_value = max([y_data_1, y_data_2, y_data_3])
+        for col in df_adamodar.columns.drop(["Country", "Moody's rating"]):
+            df_adamodar[f"{col} (%)"] = df_adamodar[col].str.replace("%", "").astype(float)
+            df_adamodar.drop(columns=col, inplace=True)
 
-        options = {
+        ordered_cols = df_adamodar.columns.drop("Moody's rating").tolist()
+        ordered_cols.append("Moody's rating")
 
-            "color": _self.config.multiple_color,
-            "title": {
-                "text": title,
-                "textStyle": {"color": "#FFFFFF"}
-            },
-            "grid": {
-                "left": "0%", 
-                "right": "1%", 
-                "containLabel": True
-            },
-            "backgroundColor": "#0E1117",
-            "tooltip": {
-                "trigger": 'axis',
-                "axisPointer": {
-                    "type": 'cross',
-                    "animation": False,
-                    "label": {
-                        "backgroundColor": '#505765'
-                    },
-                    "formatter": f"{{c}}%"
-                },
-            },
-            "legend": {
-                "data": ["Positivo", "Neutro", "Negativo", "Curva DI"],
-                "right": 140,
-                "top": 10
-            },
-            "toolbox": {
-                "feature": {
-                    "dataZoom": {"yAxisIndex": 'none'},
-                    "restore": {},
-                    "saveAsImage": {}
-                }
-            },
-            "dataZoom": [
-                {"show": True, "realtime": True, "start": 0, "end": 100},
-                {"type": 'inside', "realtime": True, "start": 0, "end": 100}
-            ],
-            "animationDurationUpdate": 1000,
-            "xAxis": {
-                "type": 'category',
-                "data": x_data
-            },
-            "yAxis": {
-                "type": "value",
-                "axisLabel": {
-                            "formatter": "{value}%"
-                        }
-            },
-            "series": [
-                {
-                    "name": "Positivo",
-                    "type": "line",
-                    "showSymbol": False,
-                    "smooth": True,
-                    "emphasis": {"focus": "series"},
-                    "data": y_data_1
-                },
-                {
-                    "name": "Neutro",
-                    "type": "line",
-                    "showSymbol": False,
-                    "smooth": True,
-                    "emphasis": {"focus": "series"},
-                    "data": y_data_2
-                },
-                {
-                    "name": "Negativo",
-                    "type": "line",
-                    "showSymbol": False,
-                    "smooth": True,
-                    "emphasis": {"focus": "series"},
-                    "data": y_data_3
-                },
-                {
-                    "name": "Curva DI",
-                    "type": "line",
-                    "showSymbol": False,
-                    "smooth": True,
-                    "emphasis": {"focus": "series"},
-                    "data": curva_real
-                }
-            ]
-        }
+        df_adamodar = df_adamodar[ordered_cols]
 
-        return options
+        return df_adamodar
     
 
-    @st.cache_resource(show_spinner=False)
+    @ChartCache.memoize
     def bonds_echart_dict(_self, data,
                     title: str = "",
                     label_format: str = "",
@@ -762,220 +772,7 @@ class Utils:
 
         return options
     
-    def multiple_interest(_self, data,
-                    min_value: float,
-                    max_value: float,
-                    title: str = "",
-                    label_format: str = "",
-                    marker: bool = False,
-                    smooth: bool = False,
-                    mean: bool = False):
-        """Renders Java Script Graphics"""
-
-        # considering that most of the graphs are time series
-        x_data = data[data.columns[0]].tolist()
-        y_data_1 = [round(value, 3) for value in data[data.columns[1]].tolist()]
-        y_data_2 = [round(value, 3) for value in data[data.columns[2]].tolist()]
-        y_data_3 = [round(value, 3) for value in data[data.columns[3]].tolist()]
-        y_data_4 = [round(value, 3) for value in data[data.columns[4]].tolist()]
-        y_data_5 = [round(value, 3) for value in data[data.columns[5]].tolist()]
-
-        if -.50 < min(y_data_5) < 0:
-            min_value -= 2
-
-        options = {
-            "color": _self.config.multiple_color,
-            "grid": {
-                "left": "0%", 
-                "right": "1%", 
-                "containLabel": True
-            },
-            "title": {
-                "text": title,
-                "textStyle": {"color": "#FFFFFF"}
-            },
-            "backgroundColor": "#0E1117",
-            "tooltip": {
-                "trigger": 'axis',
-                "axisPointer": {
-                    "type": 'cross',
-                    "animation": False,
-                    "label": {
-                        "backgroundColor": '#505765',
-                    },
-                    "formatter": f"{{c}}%"
-                },
-            },
-            "legend": {
-                "data": ["Atual", "1 mês", "3 meses", "6 meses", "1 ano"],
-                "right": 140,
-                "top": 10
-            },
-            "toolbox": {
-                "feature": {
-                    "dataZoom": {"yAxisIndex": 'none'},
-                    "dataView": {"readOnly": False},
-                    "restore": {},
-                }
-            },
-            "dataZoom": [
-                {"show": True, "realtime": True, "start": 0, "end": 100},
-                {"type": 'inside', "realtime": True, "start": 0, "end": 100}
-            ],
-            "xAxis": {
-                "type": 'category',
-                "data": x_data
-            },
-            "yAxis": [{
-                "type": "value",
-                "axisLabel": {"formatter": f"{{value}}{label_format}"},
-                "min": min_value,
-                "max": max_value
-            }],
-            "series": [
-                {
-                    "name": "Atual",
-                    "type": "line",
-                    "showSymbol": False,
-                    "emphasis": {"focus": "series"},
-                    "data": y_data_1
-                },
-                {
-                    "name": "1 mês",
-                    "type": "line",
-                    "showSymbol": False,
-                    "emphasis": {"focus": "series"},
-                    "data": y_data_2
-                },
-                {
-                    "name": "3 meses",
-                    "type": "line",
-                    "showSymbol": False,
-                    "emphasis": {"focus": "series"},
-                    "data": y_data_3
-                },
-                {
-                    "name": "6 meses",
-                    "type": "line",
-                    "showSymbol": False,
-                    "emphasis": {"focus": "series"},
-                    "data": y_data_4
-                },
-                {
-                    "name": "1 ano",
-                    "type": "line",
-                    "showSymbol": False,
-                    "emphasis": {"focus": "series"},
-                    "data": y_data_5
-                }
-            ]
-        }
-
-        return options
-    
-
-    def multiple_interest_br(_self, data,
-                    min_value: float,
-                    max_value: float,
-                    title: str = "",
-                    label_format: str = "",
-                    marker: bool = False,
-                    smooth: bool = False,
-                    mean: bool = False):
-        """Renders Java Script Graphics"""
-
-        # considering that most of the graphs are time series
-        x_data = data[data.columns[0]].tolist()
-        y_data_1 = [round(value, 3) for value in data[data.columns[1]].tolist()]
-        y_data_2 = [round(value, 3) for value in data[data.columns[2]].tolist()]
-        y_data_3 = [round(value, 3) for value in data[data.columns[3]].tolist()]
-        y_data_4 = [round(value, 3) for value in data[data.columns[4]].tolist()]
-
-        options = {
-            "color": _self.config.multiple_color,
-            "grid": {
-                "left": "0%", 
-                "right": "1%", 
-                "containLabel": True
-            },
-            "title": {
-                "text": title,
-                "textStyle": {"color": "#FFFFFF"}
-            },
-            "backgroundColor": "#0E1117",
-            "tooltip": {
-                "trigger": 'axis',
-                "axisPointer": {
-                    "type": 'cross',
-                    "animation": False,
-                    "label": {
-                        "backgroundColor": '#505765',
-                    },
-                    "formatter": f"{{c}}%"
-                },
-            },
-            "legend": {
-                "data": ["Atual", "1 mês", "3 meses", "6 meses", "1 ano"],
-                "right": 140,
-                "top": 10
-            },
-            "toolbox": {
-                "feature": {
-                    "dataZoom": {"yAxisIndex": 'none'},
-                    "dataView": {"readOnly": False},
-                    "restore": {},
-                }
-            },
-            "dataZoom": [
-                {"show": True, "realtime": True, "start": 0, "end": 100},
-                {"type": 'inside', "realtime": True, "start": 0, "end": 100}
-            ],
-            "xAxis": {
-                "type": 'category',
-                "data": x_data
-            },
-            "yAxis": [{
-                "type": "value",
-                "axisLabel": {"formatter": f"{{value}}{label_format}"},
-                "min": min_value,
-                "max": max_value
-            }],
-            "series": [
-                {
-                    "name": "Atual",
-                    "type": "line",
-                    "showSymbol": False,
-                    "emphasis": {"focus": "series"},
-                    "data": y_data_1
-                },
-                {
-                    "name": "1 mês",
-                    "type": "line",
-                    "showSymbol": False,
-                    "emphasis": {"focus": "series"},
-                    "data": y_data_2
-                },
-                {
-                    "name": "3 meses",
-                    "type": "line",
-                    "showSymbol": False,
-                    "emphasis": {"focus": "series"},
-                    "data": y_data_3
-                },
-                {
-                    "name": "6 meses",
-                    "type": "line",
-                    "showSymbol": False,
-                    "emphasis": {"focus": "series"},
-                    "data": y_data_4
-                }
-            ]
-        }
-
-        return options
-
-
-    @st.cache_resource(show_spinner=False)
+    @ChartCache.memoize
     def no_time_echart(_self, data,
                     title: str = "",
                     label_format: str = "",
@@ -1064,7 +861,7 @@ class Utils:
 
         return options
     
-    @st.cache_resource(show_spinner=False)
+    @ChartCache.memoize
     def focus_echart(_self, data,
                     # min_value: float,
                     max_value: float,
@@ -1074,9 +871,7 @@ class Utils:
 
 
         anos = list(range(_self.end.year, _self.end.year + 5))
-        x_data = data.index.strftime("%Y-%m-%d").tolist()
-        
-        y_data = [data[f"Mediana_{ano}"].tolist() for ano in anos]
+        columns = [f"Mediana_{ano}" for ano in anos]
 
         if np.min(data.values[data.values != None]) != 0:
             min_value = np.min(data.values[data.values != None])
@@ -1103,8 +898,8 @@ class Utils:
                     "label": {
                         "backgroundColor": '#505765',
                     },
-                    "formatter": f"{{c}}%"
                 },
+                "valueFormatter": _self.value_formatter("%")
             },
             "legend": {
                 "data": [str(ano) for ano in anos],
@@ -1122,10 +917,8 @@ class Utils:
                 {"show": True, "realtime": True, "start": 90, "end": 100},
                 {"type": 'inside', "realtime": True, "start": 90, "end": 100}
             ],
-            "xAxis": {
-                "type": 'category',
-                "data": x_data
-            },
+            "dataset": _self.dataset(data[columns]),
+            "xAxis": _self.x_axis(data.index),
             "yAxis": [
                 {
                     "type": "value",
@@ -1142,7 +935,7 @@ class Utils:
                     "showSymbol": False,
                     "emphasis": {"focus": "series"},
                     "connectNulls": True,
-                    "data": y_data[i]
+                    "encode": _self.encode(columns[i])
                 } for i in range(5)
             ]
         }
@@ -1151,7 +944,7 @@ class Utils:
     
 
 
-    @st.cache_resource(show_spinner=False)
+    @ChartCache.memoize
     def bar_line_chart_dict(_self, data, title, min_zoom: int = 0, label_format: str = "%"):
         """Renders Java Script Graphics"""
 
@@ -1159,10 +952,11 @@ class Utils:
             data
             .groupby(data.index.year)[data.columns[0]]
             .apply(lambda x: x.cumsum()).reset_index(level=0, drop=True)
-        )/10).tolist()
+        )/10)
 
-        x_data = data.index.strftime("%d/%m/%Y").tolist()
-        y_data = [round(value, 3) for value in data[data.columns[0]].tolist()]
+        dataset = _self.dataset(pd.DataFrame({"Fluxo": data[data.columns[0]],
+                                              "Acumulado": y_acumulado}))
+        y_data = [value for value in dataset["source"]["Fluxo"] if value is not None]
 
         min_value = int(min(y_data) - (.5 * abs(min(y_data))))
         max_value = int(max(y_data) + (.5 * abs(max(y_data))))
@@ -1181,7 +975,7 @@ class Utils:
                     "label": {
                         "backgroundColor": '#505765'
                     },
-                "formatter": f"{{c}}{label_format}"
+                "valueFormatter": _self.value_formatter(label_format)
             },
             "legend": {
                 "data": [
@@ -1215,15 +1009,9 @@ class Utils:
                 "textStyle": {"color": "#FFFFFF"}
             },
             "backgroundColor": "#0E1117",
+            "dataset": dataset,
             "xAxis": [
-                {
-                    "type": "category",
-                    "boundaryGap": True,
-                    "data": x_data,
-                    "axisTick": {
-                        "alignWithLabel": True
-                    }
-                }
+                _self.x_axis(data.index, axisTick={"alignWithLabel": True})
             ],
             "yAxis": [
                 {
@@ -1237,7 +1025,7 @@ class Utils:
                 {
                     "name": "Fluxo",
                     "type": "bar",
-                    "data": y_data,
+                    "encode": _self.encode("Fluxo"),
                     "itemStyle": {
                         "barBorderRadius": [6, 6, 0, 0]
                     }
@@ -1250,7 +1038,7 @@ class Utils:
                 "lineStyle": {
                     "color": "#2b58de"
                 },
-                "data": y_acumulado
+                "encode": _self.encode("Acumulado")
                 }
             ]
         }
@@ -1258,7 +1046,7 @@ class Utils:
         return options
     
 
-    @st.cache_resource(show_spinner=False)
+    @ChartCache.memoize
     def multiple_pe_chart(_self, data,
                           legend: list,
                           max_value = None,
@@ -1267,8 +1055,7 @@ class Utils:
                           label_format: str = ""):
         """Renders Java Script Graphics"""
 
-        x_data = data.index.strftime("%Y-%m-%d").tolist()        
-        y_data = [data[col].tolist() for col in data.columns]
+        dataset = _self.dataset(data)
 
         if not max_value:
             max_value = 50
@@ -1293,8 +1080,8 @@ class Utils:
                     "label": {
                         "backgroundColor": '#505765',
                     },
-                    "formatter": f"{{c}}"
                 },
+                "valueFormatter": _self.value_formatter()
             },
             "legend": {
                 "data": legend,
@@ -1312,10 +1099,8 @@ class Utils:
                 {"show": True, "realtime": True, "start": 0, "end": 100},
                 {"type": 'inside', "realtime": True, "start": 0, "end": 100}
             ],
-            "xAxis": {
-                "type": 'category',
-                "data": x_data
-            },
+            "dataset": dataset,
+            "xAxis": _self.x_axis(data.index),
             "yAxis": [{
                 "type": "value",
                 "axisLabel": {"formatter": f"{{value}}{label_format}"},
@@ -1329,7 +1114,7 @@ class Utils:
                     "showSymbol": False,
                     "emphasis": {"focus": "series"},
                     "connectNulls": True,
-                    "data": y_data[i]
+                    "encode": _self.encode(data.columns[i])
                 } for i in range(len(data.columns))
             ]
         }
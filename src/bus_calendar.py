@@ -0,0 +1,87 @@
+# -*- coding: UTF-8 -*-
+"""Import modules"""
+
+from threading import Lock
+import pandas as pd
+import numpy as np
+
+
+class BusCalendar:
+    """ANBIMA Business Days Calendar Interface"""
+
+    _calendar = None
+    _lock = Lock()
+
+    def __init__(self) -> None:
+        """Initializes instance"""
+
+        # import local modules
+        from src.iface_config import Config
+        from src.download_cache import DownloadCache
+        from src.store import SeriesStore
+
+        self.config = Config()
+        self.downloads = DownloadCache()
+        self.store = SeriesStore("calendar")
+
+    def __repr__(self) -> str:
+        """BusCalendar Class Basic
+        Representation"""
+
+        return f"BusCalendar Class, store dir: {str(self.store.store_dir)}"
+
+    def __str__(self) -> str:
+        """BusCalendar Class
+        Print Representation"""
+
+        return f"BusCalendar Class, store dir: {str(self.store.store_dir)}"
+
+
+    def download_anbima_holidays(self, start=None) -> pd.DataFrame:
+        """Downloads ANBIMA National
+        Holidays"""
+
+        try:
+            data_anbima = self.downloads.read_excel(self.config.vars.anbima_holidays)[:-9]
+            data_anbima["Data"] = pd.to_datetime(data_anbima["Data"], format=r"%Y-%m-%d")
+            data_anbima = pd.DataFrame({"holiday": True}, 
+                                       index=pd.DatetimeIndex(data_anbima["Data"], name="Data"))
+
+        except Exception as error:
+            raise OSError(error) from error
+
+        return data_anbima
+
+
+    def get_anbima_holidays(self) -> list:
+        """Gets the persisted ANBIMA
+        National Holidays"""
+
+        holidays = self.store.update("anbima_holidays", self.download_anbima_holidays, "files")
+
+        return holidays.index.to_list()
+
+
+    def get_calendar(self) -> np.busdaycalendar:
+        """Gets the business days calendar
+        Holidays are loaded once per process"""
+
+        with BusCalendar._lock:
+            if BusCalendar._calendar is None:
+                holidays = np.array(self.get_anbima_holidays(), dtype="datetime64[D]")
+                BusCalendar._calendar = np.busdaycalendar(holidays=holidays)
+
+        return BusCalendar._calendar
+
+
+    def count(self, start, end) -> np.ndarray:
+        """Counts business days between start and end,
+        both included, for arrays of dates at once"""
+
+        start = np.asarray(pd.to_datetime(start), dtype="datetime64[D]")
+        end = np.asarray(pd.to_datetime(end), dtype="datetime64[D]")
+
+        bus_days = np.busday_count(start, end + np.timedelta64(1, "D"),
+                                   busdaycal=self.get_calendar())
+
+        return np.maximum(bus_days, 0)
@@ -0,0 +1,232 @@
+# -*- coding: UTF-8 -*-
+"""Import modules"""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from copy import deepcopy
+from functools import wraps, partial
+from threading import Lock
+from time import time
+import re
+import warnings
+
+
+class CachePolicy:
+    """Per Source TTL and Stale-While-Revalidate Interface"""
+
+    _entries = {}
+    _refreshing = set()
+    _ttls = {}
+    _pool = None
+    _lock = Lock()
+    # set by the warm-up, refreshes run inline instead of in the background
+    _blocking = ContextVar("cache_policy_blocking", default=False)
+
+    units = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+    def __init__(self) -> None:
+        """Initializes instance"""
+
+        # import local modules
+        from src.iface_config import Config
+        from src.indicators import Indicators
+        from src.shared_cache import SharedCache
+        from src.single_flight import SingleFlight
+
+        self.config = Config()
+        self.indicators = Indicators()
+        self.shared = SharedCache()
+        self.single_flight = SingleFlight()
+        self.source_ttl = self.config.vars.source_ttl
+        self.default_ttl = self.config.vars.store_max_age_hours * 3600
+
+        with CachePolicy._lock:
+            if CachePolicy._pool is None:
+                CachePolicy._pool = ThreadPoolExecutor(
+                    max_workers=self.config.vars.swr_max_workers,
+                    thread_name_prefix="revalidate"
+                )
+
+    def __repr__(self) -> str:
+        """CachePolicy Class Basic
+        Representation"""
+
+        return f"CachePolicy Class, cached entries: {len(CachePolicy._entries)}"
+
+    def __str__(self) -> str:
+        """CachePolicy Class
+        Print Representation"""
+
+        return f"CachePolicy Class, cached entries: {len(CachePolicy._entries)}"
+
+
+    def parse_ttl(self, ttl) -> float:
+        """Converts 30m, 12h, 7d or
+        seconds into seconds"""
+
+        if isinstance(ttl, (int, float)):
+            return float(ttl)
+
+        match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhdw])\s*", str(ttl))
+        if match is None:
+            raise ValueError(f"Invalid ttl: {ttl}")
+
+        return float(match.group(1)) * self.units[match.group(2)]
+
+
+    def ttl(self, name: str) -> float:
+        """Gets the ttl of an indicator, its
+        own ttl first, then its source default"""
+
+        if name not in CachePolicy._ttls:
+            meta = self.indicators.all_dict.get(name, {})
+            ttl = meta.get("ttl") or self.source_ttl.get(meta.get("source") or name)
+            CachePolicy._ttls[name] = self.parse_ttl(ttl) if ttl else self.default_ttl
+
+        return CachePolicy._ttls[name]
+
+
+    def is_stale(self, name: str, age: float) -> bool:
+        """Checks an age in seconds
+        against the ttl of name"""
+
+        return age > self.ttl(name)
+
+
+    def revalidate(self, key, refresh) -> None:
+        """Runs refresh in the background, at most
+        once at a time per key across replicas"""
+
+        if CachePolicy._blocking.get():
+            with self.shared.lease(repr(key)):
+                refresh()
+            return
+
+        with CachePolicy._lock:
+            if key in CachePolicy._refreshing:
+                return
+            CachePolicy._refreshing.add(key)
+
+        def run() -> None:
+            # already off the request path, stale layers below refresh inline
+            token = CachePolicy._blocking.set(True)
+            try:
+                # another replica already refreshing it, its result is adopted later
+                with self.shared.lease(repr(key), wait=False) as acquired:
+                    if acquired:
+                        refresh()
+            except Exception as error:
+                # the stale copy stays, next access tries again
+                warnings.warn(f"Refresh of {key} failed: {error}")
+            finally:
+                CachePolicy._blocking.reset(token)
+                with CachePolicy._lock:
+                    CachePolicy._refreshing.discard(key)
+
+        CachePolicy._pool.submit(run)
+
+
+    def load(self, key, compute) -> tuple:
+        """Gets an entry from the shared cache,
+        one replica computes it on a miss"""
+
+        with CachePolicy._lock:
+            entry = CachePolicy._entries.get(key)
+        if entry is not None:
+            return entry
+
+        shared_key = repr(key)
+        entry = self.shared.get(shared_key)
+        if entry is None:
+            with self.shared.lease(shared_key):
+                # another replica may have stored it while this one waited
+                entry = self.shared.get(shared_key)
+                if entry is None:
+                    entry = (compute(), time())
+                    self.shared.set(shared_key, *entry)
+
+        # shared hits become local too, reruns never read sqlite again
+        with CachePolicy._lock:
+            CachePolicy._entries[key] = entry
+
+        return entry
+
+
+    def refresh(self, name: str, key, compute) -> None:
+        """Replaces a stale entry, adopting the
+        shared one when a replica refreshed it"""
+
+        shared_key = repr(key)
+        stored_at = self.shared.stored_at(shared_key)
+        entry = None
+        if stored_at is not None and not self.is_stale(name, time() - stored_at):
+            entry = self.shared.get(shared_key)
+
+        if entry is None:
+            entry = (compute(), time())
+            self.shared.set(shared_key, *entry)
+
+        with CachePolicy._lock:
+            CachePolicy._entries[key] = entry
+
+
+    def get(self, name: str, key, compute):
+        """Gets a copy of a memoized value, computing on
+        miss and serving stale values while refreshing"""
+
+        with CachePolicy._lock:
+            entry = CachePolicy._entries.get(key)
+
+        if entry is None:
+            # one cold computation per key, the other sessions wait for it
+            entry = self.single_flight.do(("memo", key), self.load, key, compute)
+
+        value, stored_at = entry
+        if self.is_stale(name, time() - stored_at):
+            self.revalidate(key, partial(self.refresh, name, key, compute))
+
+        # like st.cache_data, callers may change what they get
+        return deepcopy(value)
+
+
+    @classmethod
+    def swr(cls, name: str):
+        """Method decorator, memoizes per arguments
+        with the ttl of an indicator or source"""
+
+        def decorate(func):
+            @wraps(func)
+            def cached(instance, *args, **kwargs):
+                # like st.cache_data with _self, the instance is not part of the key
+                key = (func.__qualname__, repr(args), repr(sorted(kwargs.items())))
+                return cls().get(name, key, partial(func, instance, *args, **kwargs))
+            return cached
+
+        return decorate
+
+
+    @classmethod
+    def run_blocking(cls, func, *args, **kwargs):
+        """Calls func refreshing stale
+        data inline, for the warm-up"""
+
+        token = cls._blocking.set(True)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            cls._blocking.reset(token)
+
+
+    @classmethod
+    def clear(cls, shared: bool = False) -> None:
+        """Drops every memoized value, the
+        shared ones too when shared is set"""
+
+        with cls._lock:
+            cls._entries.clear()
+
+        if shared:
+            # import local module
+            from src.shared_cache import SharedCache
+
+            SharedCache().clear()
@@ -0,0 +1,160 @@
+# -*- coding: UTF-8 -*-
+"""Import modules"""
+
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+from hashlib import blake2b
+import json
+import numpy as np
+import pandas as pd
+
+
+class ChartCache:
+    """Memory Bounded Chart Options Cache Interface"""
+
+    _entries = OrderedDict()
+    _size = 0
+    _stats = {"hits": 0, "misses": 0, "evictions": 0}
+    _lock = Lock()
+
+    def __init__(self) -> None:
+        """Initializes instance"""
+
+        # import local module
+        from src.iface_config import Config
+
+        self.config = Config()
+        self.max_bytes = self.config.vars.chart_cache_mb * 2**20
+        self.max_entries = self.config.vars.chart_cache_max_entries
+
+    def __repr__(self) -> str:
+        """ChartCache Class Basic
+        Representation"""
+
+        return f"ChartCache Class, entries: {len(ChartCache._entries)}, bytes: {ChartCache._size}"
+
+    def __str__(self) -> str:
+        """ChartCache Class
+        Print Representation"""
+
+        return f"ChartCache Class, entries: {len(ChartCache._entries)}, bytes: {ChartCache._size}"
+
+
+    @classmethod
+    def fingerprint(cls, value):
+        """Cheap version of an argument, frames give
+        their shape and a digest of values and labels"""
+
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            frame = value.to_frame() if isinstance(value, pd.Series) else value
+            # a digest of every value and label, equal keys mean equal frames
+            digest = blake2b(digest_size=16)
+            digest.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+            digest.update(repr((list(frame.columns), list(map(str, frame.dtypes)),
+                                list(frame.index.names))).encode("utf-8"))
+            return (type(value).__name__, frame.shape, digest.hexdigest())
+
+        if isinstance(value, (pd.Index, np.ndarray)):
+            return cls.fingerprint(pd.Series(np.asarray(value)))
+
+        if isinstance(value, (list, tuple)):
+            return (type(value).__name__, tuple(cls.fingerprint(item) for item in value))
+
+        if isinstance(value, dict):
+            return ("dict", tuple((str(key), cls.fingerprint(item)) for key, item in value.items()))
+
+        return repr(value)
+
+
+    @staticmethod
+    def measure(options) -> int:
+        """Gets the size of the options,
+        as the json sent to the browser"""
+
+        return len(json.dumps(options, default=str))
+
+
+    def get(self, key):
+        """Gets the options of a key
+        Return None on a miss"""
+
+        with ChartCache._lock:
+            entry = ChartCache._entries.get(key)
+            if entry is None:
+                ChartCache._stats["misses"] += 1
+                return None
+            ChartCache._entries.move_to_end(key)
+            ChartCache._stats["hits"] += 1
+
+        return entry[0]
+
+
+    def put(self, key, options) -> None:
+        """Stores the options of a key, evicting
+        the least recently used over the ceiling"""
+
+        size = self.measure(options)
+        if size > self.max_bytes:
+            # larger than the whole cache, never kept
+            return
+
+        with ChartCache._lock:
+            previous = ChartCache._entries.pop(key, None)
+            if previous is not None:
+                ChartCache._size -= previous[1]
+            ChartCache._entries[key] = (options, size)
+            ChartCache._size += size
+
+            while (ChartCache._size > self.max_bytes
+                   or len(ChartCache._entries) > self.max_entries):
+                _, (_, evicted) = ChartCache._entries.popitem(last=False)
+                ChartCache._size -= evicted
+                ChartCache._stats["evictions"] += 1
+
+
+    def stats(self) -> dict:
+        """Gets hits, misses, evictions,
+        hit rate and memory in use"""
+
+        with ChartCache._lock:
+            stats = dict(ChartCache._stats)
+            stats["entries"] = len(ChartCache._entries)
+            stats["bytes"] = ChartCache._size
+
+        calls = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / calls, 3) if calls else 0.0
+        stats["max_bytes"] = self.max_bytes
+
+        return stats
+
+
+    @classmethod
+    def memoize(cls, func):
+        """Method decorator, caches chart options by
+        the fingerprint of the arguments, not the instance"""
+
+        @wraps(func)
+        def cached(instance, *args, **kwargs):
+            cache = cls()
+            key = (func.__qualname__, cls.fingerprint(args),
+                   cls.fingerprint(dict(sorted(kwargs.items()))))
+
+            options = cache.get(key)
+            if options is None:
+                options = func(instance, *args, **kwargs)
+                cache.put(key, options)
+
+            return options
+
+        return cached
+
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drops every
+        cached chart"""
+
+        with cls._lock:
+            cls._entries.clear()
+            cls._size = 0
@@ -0,0 +1,184 @@
+# -*- coding: UTF-8 -*-
+"""Import modules"""
+
+from collections import OrderedDict
+from threading import Lock
+import numpy as np
+import pandas as pd
+
+
+class Derived:
+    """Derived Indicators Engine Interface"""
+
+    _results = OrderedDict()
+    _lock = Lock()
+
+    def __init__(self) -> None:
+        """Initializes instance"""
+
+        # import local modules
+        from src.iface_config import Config
+        from src.indicators import Indicators
+
+        self.config = Config()
+        self.indicators = Indicators()
+        self.max_entries = self.config.vars.derived_cache_max_entries
+
+        self.ops = {
+            "compound": self.compound,
+            "real_rate": self.real_rate,
+            "yoy": self.yoy,
+            "pct_change": self.pct_change,
+            "spread": self.spread,
+            "resample": self.resample,
+        }
+
+    def __repr__(self) -> str:
+        """Derived Class Basic
+        Representation"""
+
+        return f"Derived Class, memoized results: {len(Derived._results)}"
+
+    def __str__(self) -> str:
+        """Derived Class
+        Print Representation"""
+
+        return f"Derived Class, memoized results: {len(Derived._results)}"
+
+
+    def compound(self, data: pd.DataFrame, window: int = None, rule: str = None) -> pd.DataFrame:
+        """Compounds percent rates over a rolling window
+        or per resample period, as sums of logs"""
+
+        logs = np.log1p(data / 100)
+        if rule is not None:
+            logs = logs.resample(rule).sum()
+        else:
+            # a running sum, no python callback per window
+            logs = logs.rolling(window).sum()
+
+        return np.expm1(logs) * 100
+
+
+    def real_rate(self, nominal: pd.DataFrame, inflation: pd.DataFrame) -> pd.DataFrame:
+        """Deflates a percent rate by a
+        percent inflation, dates in common"""
+
+        rates = pd.merge(nominal, inflation, left_index=True, right_index=True,
+                         how="inner").dropna()
+        real = ((1 + rates.iloc[:, 0] / 100) / (1 + rates.iloc[:, 1] / 100) - 1) * 100
+
+        return real.to_frame(name=nominal.columns[0])
+
+
+    def yoy(self, data: pd.DataFrame, periods: int = 12) -> pd.DataFrame:
+        """Percent change against
+        periods observations before"""
+
+        return data.pct_change(periods).dropna() * 100
+
+
+    def pct_change(self, data: pd.DataFrame, decimals: int = None) -> pd.DataFrame:
+        """Percent change against the previous
+        observation, rounded before scaling"""
+
+        change = data.pct_change().dropna()
+        if decimals is not None:
+            change = change.round(decimals)
+
+        return change * 100
+
+
+    def spread(self, left: pd.DataFrame, right: pd.DataFrame) -> pd.DataFrame:
+        """Difference of two series
+        on their dates in common"""
+
+        rates = pd.merge(left, right, left_index=True, right_index=True, how="inner")
+        spread = rates.iloc[:, 0] - rates.iloc[:, 1]
+
+        return spread.to_frame(name=f"{left.columns[0]} - {right.columns[0]}")
+
+
+    def resample(self, data: pd.DataFrame, rule: str = "YE", how: str = "first",
+                 dropna: bool = False) -> pd.DataFrame:
+        """Changes the frequency keeping the first, last
+        or mean value, or compounding percent rates"""
+
+        if how == "compound":
+            data = self.compound(data, rule=rule)
+        else:
+            data = getattr(data.resample(rule), how)()
+
+        return data.dropna() if dropna else data
+
+
+    def memoize(self, key, compute):
+        """Gets a result computed for the same inputs
+        before, the least recently used go first"""
+
+        with Derived._lock:
+            if key in Derived._results:
+                Derived._results.move_to_end(key)
+                return Derived._results[key]
+
+        result = compute()
+
+        with Derived._lock:
+            Derived._results[key] = result
+            while len(Derived._results) > self.max_entries:
+                Derived._results.popitem(last=False)
+
+        return result
+
+
+    def apply(self, op: str, *data, **params) -> pd.DataFrame:
+        """Runs one operation, memoized by
+        the version of its input series"""
+
+        # import local module
+        from src.chart_cache import ChartCache
+
+        key = (op, ChartCache.fingerprint(data), ChartCache.fingerprint(dict(sorted(params.items()))))
+
+        return self.memoize(key, lambda: self.ops[op](*data, **params))
+
+
+    def run_steps(self, name: str, inputs: dict) -> pd.DataFrame:
+        """Runs the steps declared under derived in
+        indicators.yaml, each one reads named frames"""
+
+        frames = dict(inputs)
+        result = None
+        for step in self.indicators.all_dict[name]["derived"]:
+            params = {key: value for key, value in step.items()
+                      if key not in ("op", "input", "as")}
+            names = step.get("input", "_")
+            names = [names] if isinstance(names, str) else names
+            # _ is the result of the step before
+            result = self.ops[step["op"]](*[frames[item] for item in names], **params)
+            frames["_"] = result
+            if "as" in step:
+                frames[step["as"]] = result
+
+        return result
+
+
+    def evaluate(self, name: str, **inputs) -> pd.DataFrame:
+        """Computes a derived indicator, once
+        per version of its input series"""
+
+        # import local module
+        from src.chart_cache import ChartCache
+
+        key = (name, ChartCache.fingerprint(dict(sorted(inputs.items()))))
+
+        return self.memoize(key, lambda: self.run_steps(name, inputs))
+
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drops every
+        memoized result"""
+
+        with cls._lock:
+            cls._results.clear()
@@ -0,0 +1,183 @@
+# -*- coding: UTF-8 -*-
+"""Import modules"""
+
+from os import path, makedirs, replace, getpid, utime
+from functools import partial
+from time import time
+from hashlib import sha1
+from io import BytesIO
+from threading import Lock, get_ident
+import json
+import pandas as pd
+
+
+class DownloadCache:
+    """Conditional GET Download Cache Interface"""
+
+    _parsed = {}
+    _lock = Lock()
+
+    def __init__(self) -> None:
+        """Initializes instance"""
+
+        # import local modules
+        from src.iface_config import Config
+        from src.iface_http import AsyncHttp
+        from src.cache_policy import CachePolicy
+        from src.single_flight import SingleFlight
+
+        self.config = Config()
+        self.http = AsyncHttp()
+        self.policy = CachePolicy()
+        self.single_flight = SingleFlight()
+        self.data_dir = self.config.vars.data_dir
+        self.cache_dir = path.join(self.data_dir, self.config.vars.download_dir)
+
+        makedirs(self.cache_dir, exist_ok=True)
+
+    def __repr__(self) -> str:
+        """DownloadCache Class Basic
+        Representation"""
+
+        return f"DownloadCache Class, cache dir: {str(self.cache_dir)}"
+
+    def __str__(self) -> str:
+        """DownloadCache Class
+        Print Representation"""
+
+        return f"DownloadCache Class, cache dir: {str(self.cache_dir)}"
+
+
+    def file_paths(self, url: str) -> tuple:
+        """Gets the body and
+        validators files of an url"""
+
+        name = sha1(url.encode("utf-8")).hexdigest()
+
+        return (path.join(self.cache_dir, f"{name}.bin"),
+                path.join(self.cache_dir, f"{name}.json"))
+
+
+    def load_meta(self, url: str) -> dict:
+        """Reads the stored validators
+        Return empty dict if missing"""
+
+        body_file, meta_file = self.file_paths(url)
+        if not (path.exists(body_file) and path.exists(meta_file)):
+            return {}
+
+        with open(meta_file, encoding="utf-8") as file:
+            return json.load(file)
+
+
+    def save(self, url: str, content: bytes, meta: dict) -> None:
+        """Writes the body and its
+        validators replacing old files"""
+
+        for file, data in zip(self.file_paths(url),
+                              [content, json.dumps(meta).encode("utf-8")]):
+            # unique per thread, concurrent saves of one url never share it
+            temp_file = f"{file}.{getpid()}.{get_ident()}.tmp"
+            try:
+                with open(temp_file, "wb") as tmp:
+                    tmp.write(data)
+                replace(temp_file, file)
+            except Exception as error:
+                raise OSError(error) from error
+
+
+    def fetch(self, url: str, source: str = "files") -> tuple:
+        """Serves the stored copy, revalidating it in
+        the background once older than the source ttl"""
+
+        meta = self.load_meta(url)
+        if not meta:
+            # concurrent first reads share one download
+            return self.single_flight.do(("download", url), self.download, url)
+
+        body_file, meta_file = self.file_paths(url)
+        if self.policy.is_stale(source, time() - path.getmtime(meta_file)):
+            self.policy.revalidate(("downloads", url), partial(self.download, url))
+
+        with open(body_file, "rb") as file:
+            content = file.read()
+
+        return content, meta["sha1"]
+
+
+    def download(self, url: str) -> tuple:
+        """Revalidates the stored copy
+        Return the body and its version"""
+
+        meta = self.load_meta(url)
+        body_file, meta_file = self.file_paths(url)
+
+        headers = dict(self.config.headers)
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            response = self.http.get(url, headers=headers)
+            if response.status_code != 304 and not response.is_success:
+                raise OSError(f"Unable to download {url}: {response.status_code}")
+        except Exception as error:
+            # a stale copy is better than no data
+            if not meta:
+                raise OSError(error) from error
+            response = None
+
+        if response is not None and response.status_code != 304:
+            content = response.content
+            meta = {
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "sha1": sha1(content).hexdigest()
+            }
+            self.save(url, content, meta)
+            return content, meta["sha1"]
+
+        if response is not None:
+            # not modified, the copy counts as fresh again
+            utime(meta_file)
+
+        with open(body_file, "rb") as file:
+            content = file.read()
+
+        return content, meta["sha1"]
+
+
+    def read(self, url: str, reader, **kwargs) -> pd.DataFrame:
+        """Parses the downloaded file once
+        per version, reader(buffer, **kwargs)"""
+
+        content, version = self.fetch(url)
+        key = (url, reader.__name__, repr(sorted(kwargs.items())))
+
+        with DownloadCache._lock:
+            cached = DownloadCache._parsed.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1].copy()
+
+        data = reader(BytesIO(content), **kwargs)
+
+        with DownloadCache._lock:
+            DownloadCache._parsed[key] = (version, data)
+
+        return data.copy()
+
+
+    def read_excel(self, url: str, **kwargs) -> pd.DataFrame:
+        """Reads a cached
+        excel workbook"""
+
+        return self.read(url, pd.read_excel, **kwargs)
+
+
+    def read_csv(self, url: str, **kwargs) -> pd.DataFrame:
+        """Reads a cached
+        csv file"""
+
+        return self.read(url, pd.read_csv, **kwargs)
@@ -1,7 +1,6 @@
 # -*- coding: UTF-8 -*-
 """Import modules"""
 
-import pandas_datareader.data as pdr
 from datetime import datetime
 import google.generativeai as genai
 import warnings
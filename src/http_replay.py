@@ -0,0 +1,319 @@
+# -*- coding: UTF-8 -*-
+"""Import modules"""
+
+from os import path, makedirs, replace, getpid
+from hashlib import sha1
+from io import BytesIO
+from threading import Thread, Lock, Event
+from email.message import Message
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import urllib.request
+import urllib.response
+import urllib.error
+import json
+import requests
+import httpx
+
+
+class HttpReplay:
+    """Record/Replay HTTP Transport Interface"""
+
+    # query params that carry credentials, never part of the key nor saved
+    secret_params = ("api_key", "apikey", "token", "key")
+    # the body is stored decoded, these would no longer hold
+    dropped_headers = ("content-encoding", "transfer-encoding", "content-length",
+                       "connection", "set-cookie")
+
+    _installed = None
+    _originals = {}
+    _lock = Lock()
+
+    def __init__(self) -> None:
+        """Initializes instance"""
+
+        # import local module
+        from src.iface_config import Config
+
+        self.config = Config()
+        self.mode = self.config.vars.http_replay
+        self.replay_dir = path.join(self.config.vars.data_dir,
+                                    self.config.vars.http_replay_dir)
+        self.port = self.config.vars.http_replay_port
+
+        makedirs(self.replay_dir, exist_ok=True)
+
+    def __repr__(self) -> str:
+        """HttpReplay Class Basic
+        Representation"""
+
+        return f"HttpReplay Class, mode: {self.mode}, dir: {str(self.replay_dir)}"
+
+    def __str__(self) -> str:
+        """HttpReplay Class
+        Print Representation"""
+
+        return f"HttpReplay Class, mode: {self.mode}, dir: {str(self.replay_dir)}"
+
+
+    def clean_url(self, url: str) -> str:
+        """Drops credentials and sorts the
+        query so equal requests match"""
+
+        parts = urlsplit(str(url))
+        query = sorted((name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                       if name.lower() not in self.secret_params)
+
+        return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path,
+                           urlencode(query), ""))
+
+
+    def key(self, method: str, url: str, body: bytes = None) -> str:
+        """Gets the recording
+        name of a request"""
+
+        raw = f"{method.upper()} {self.clean_url(url)}".encode("utf-8")
+        if body:
+            raw += b"\n" + body
+
+        return sha1(raw).hexdigest()
+
+
+    def file_paths(self, key: str) -> tuple:
+        """Gets the body and
+        meta files of a recording"""
+
+        return (path.join(self.replay_dir, f"{key}.bin"),
+                path.join(self.replay_dir, f"{key}.json"))
+
+
+    def save(self, method: str, url: str, body: bytes, status: int,
+             headers, content: bytes) -> None:
+        """Writes one recorded
+        response replacing old files"""
+
+        meta = {
+            "method": method.upper(),
+            "url": self.clean_url(url),
+            "status": status,
+            "headers": {name: value for name, value in dict(headers).items()
+                        if name.lower() not in self.dropped_headers},
+        }
+
+        for file, data in zip(self.file_paths(self.key(method, url, body)),
+                              [content, json.dumps(meta, indent=2).encode("utf-8")]):
+            temp_file = f"{file}.{getpid()}.tmp"
+            try:
+                with open(temp_file, "wb") as tmp:
+                    tmp.write(data)
+                replace(temp_file, file)
+            except Exception as error:
+                raise OSError(error) from error
+
+
+    def load(self, method: str, url: str, body: bytes = None) -> tuple:
+        """Reads one recorded response
+        Return status, headers and content"""
+
+        body_file, meta_file = self.file_paths(self.key(method, url, body))
+        if not (path.exists(body_file) and path.exists(meta_file)):
+            raise OSError(f"No recording for {method.upper()} {self.clean_url(url)}")
+
+        with open(meta_file, encoding="utf-8") as file:
+            meta = json.load(file)
+        with open(body_file, "rb") as file:
+            content = file.read()
+
+        return meta["status"], meta["headers"], content
+
+
+    def requests_send(self, adapter, request, **kwargs) -> requests.Response:
+        """requests transport, every
+        Session ends up here"""
+
+        body = request.body.encode("utf-8") if isinstance(request.body, str) else request.body
+
+        if self.mode == "record":
+            response = HttpReplay._originals["requests"](adapter, request, **kwargs)
+            self.save(request.method, request.url, body, response.status_code,
+                      response.headers, response.content)
+            return response
+
+        status, headers, content = self.load(request.method, request.url, body)
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers = requests.structures.CaseInsensitiveDict(headers)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response._content = content
+        response.url = request.url
+        response.request = request
+        response.reason = "Replayed"
+        response.connection = adapter
+
+        return response
+
+
+    def httpx_response(self, request: httpx.Request) -> httpx.Response:
+        """Builds a replayed
+        httpx response"""
+
+        status, headers, content = self.load(request.method, str(request.url),
+                                             request.content or None)
+
+        return httpx.Response(status, headers=headers, content=content, request=request)
+
+
+    def httpx_send(self, transport, request: httpx.Request) -> httpx.Response:
+        """httpx sync transport"""
+
+        if self.mode == "record":
+            response = HttpReplay._originals["httpx"](transport, request)
+            content = response.read()
+            self.save(request.method, str(request.url), request.content or None,
+                      response.status_code, response.headers, content)
+            return httpx.Response(response.status_code, content=content, request=request,
+                                  headers={name: value for name, value in response.headers.items()
+                                           if name.lower() not in self.dropped_headers})
+
+        return self.httpx_response(request)
+
+
+    async def httpx_async_send(self, transport, request: httpx.Request) -> httpx.Response:
+        """httpx async transport, used
+        by the scrapers fan-out"""
+
+        if self.mode == "record":
+            response = await HttpReplay._originals["httpx_async"](transport, request)
+            content = await response.aread()
+            self.save(request.method, str(request.url), request.content or None,
+                      response.status_code, response.headers, content)
+            return httpx.Response(response.status_code, content=content, request=request,
+                                  headers={name: value for name, value in response.headers.items()
+                                           if name.lower() not in self.dropped_headers})
+
+        return self.httpx_response(request)
+
+
+    def urllib_open(self, opener, url, data=None, *args, **kwargs):
+        """urllib transport, used by
+        fredapi and pandas readers"""
+
+        full_url = getattr(url, "full_url", url)
+        method = url.get_method() if hasattr(url, "get_method") else ("POST" if data else "GET")
+
+        if self.mode == "record":
+            response = HttpReplay._originals["urllib"](opener, url, data, *args, **kwargs)
+            content = response.read()
+            self.save(method, full_url, data, response.status, response.headers, content)
+            status, headers = response.status, dict(response.headers)
+        else:
+            status, headers, content = self.load(method, full_url, data)
+
+        message = Message()
+        for name, value in headers.items():
+            if name.lower() not in self.dropped_headers:
+                message[name] = value
+
+        if status >= 400:
+            raise urllib.error.HTTPError(full_url, status, "Replayed", message, BytesIO(content))
+
+        return urllib.response.addinfourl(BytesIO(content), message, full_url, status)
+
+
+    def install(self) -> bool:
+        """Routes requests, httpx and urllib
+        through the recordings, once per process"""
+
+        if self.mode not in ("record", "replay"):
+            return False
+
+        replay = self
+        with HttpReplay._lock:
+            if HttpReplay._installed is not None:
+                return HttpReplay._installed == self.mode
+
+            HttpReplay._originals = {
+                "requests": requests.adapters.HTTPAdapter.send,
+                "httpx": httpx.HTTPTransport.handle_request,
+                "httpx_async": httpx.AsyncHTTPTransport.handle_async_request,
+                "urllib": urllib.request.OpenerDirector.open,
+            }
+
+            def requests_send(adapter, request, **kwargs):
+                return replay.requests_send(adapter, request, **kwargs)
+
+            def httpx_send(transport, request):
+                return replay.httpx_send(transport, request)
+
+            async def httpx_async_send(transport, request):
+                return await replay.httpx_async_send(transport, request)
+
+            def urllib_open(opener, url, data=None, *args, **kwargs):
+                return replay.urllib_open(opener, url, data, *args, **kwargs)
+
+            requests.adapters.HTTPAdapter.send = requests_send
+            httpx.HTTPTransport.handle_request = httpx_send
+            httpx.AsyncHTTPTransport.handle_async_request = httpx_async_send
+            urllib.request.OpenerDirector.open = urllib_open
+            HttpReplay._installed = self.mode
+
+        return True
+
+
+    def uninstall(self) -> None:
+        """Restores the
+        live transports"""
+
+        with HttpReplay._lock:
+            if HttpReplay._installed is None:
+                return
+
+            requests.adapters.HTTPAdapter.send = HttpReplay._originals["requests"]
+            httpx.HTTPTransport.handle_request = HttpReplay._originals["httpx"]
+            httpx.AsyncHTTPTransport.handle_async_request = HttpReplay._originals["httpx_async"]
+            urllib.request.OpenerDirector.open = HttpReplay._originals["urllib"]
+            HttpReplay._installed = None
+
+
+    def serve(self, host: str = "127.0.0.1", port: int = None) -> ThreadingHTTPServer:
+        """Serves the recordings over http,
+        GET /<original url> answers the recording"""
+
+        replay = self
+
+        class ReplayHandler(BaseHTTPRequestHandler):
+            """Replay Request Handler"""
+
+            def do_GET(self) -> None:
+                """Answers one
+                recorded url"""
+
+                try:
+                    status, headers, content = replay.load("GET", self.path.lstrip("/"))
+                except OSError as error:
+                    self.send_error(404, str(error))
+                    return
+
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format, *args) -> None:
+                """Keeps the
+                server quiet"""
+
+        server = ThreadingHTTPServer((host, port or self.port), ReplayHandler)
+        Thread(target=server.serve_forever, name="http-replay", daemon=True).start()
+
+        return server
+
+
+if __name__ == "__main__":
+    replay = HttpReplay()
+    replay_server = replay.serve()
+    print(f"serving {replay_server.server_address} from {replay.replay_dir}")
+    Event().wait()
@@ -4,13 +4,15 @@
 from os import environ
 from os.path import join, dirname
 from dataclasses import dataclass, field
+from threading import Lock
+from types import MappingProxyType
 from dotenv import load_dotenv
 from yaml import load
 from yaml.loader import SafeLoader
 from streamlit import secrets
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Variables:
     """ Variables dataclass """
     
@@ -31,8 +33,8 @@ class Variables:
     url_anbima_inf: str
     di_future: str
     anbima_holidays: str
-    imf_gdp: str
-    imf_cpi: str
+    imf_api: str
+    sgs_url: str
 
     url_ouro: str
     url_dsge: str
@@ -41,17 +43,13 @@ class Variables:
     par_yield_curves_2024: str
     par_yield_curves_2025: str
 
-    imf_gdp: str
-    imf_cpi: str
     prod_industrial_url: str
     vendas_varejo_url: str
     relatorio_inflacao_url: str
     cds_5anos: str
     taxas_juros: str
-    ipca_focus: str
-    pib_focus: str
-    selic_focus: str
-    cambio_focus: str
+    focus_api: str
+    focus_indicators: MappingProxyType
 
     url_b3_flows: str
 
@@ -71,14 +69,65 @@ class Variables:
 
     FRED_API_KEY: str
     AV_API_KEY: str
+
+    fred_max_workers: int
+    store_dir: str
+    store_max_age_hours: float
+    download_dir: str
+    source_ttl: MappingProxyType
+    swr_max_workers: int
+    sgs_window_years: int
+    shared_cache: str
+    shared_cache_file: str
+    shared_cache_lease_seconds: float
+    shared_cache_max_age_days: float
+    shared_cache_max_mb: float
+    di_selenium_fallback: bool
+    warmup_max_workers: int
+    warmup_interval_hours: float
+    warmup_pages: tuple
+    http_timeout: float
+    http_max_connections: int
+    http_max_per_host: int
+    http_replay: str
+    http_replay_dir: str
+    http_replay_port: int
+    chart_max_points: int
+    chart_cache_mb: float
+    chart_cache_max_entries: int
+    derived_cache_max_entries: int
+    pyramid_max_series: int
+    import_budget_ms: float
+    lazy_modules: tuple
+    metrics_dir: str
+    admin_usernames: tuple
+    bench_dir: str
+    bench_timeout: float
+    bench_tolerance: float
     
-    sp_mult_urls: list = field(default_factory=list)
+    sp_mult_urls: tuple = field(default_factory=tuple)
 
 class Config:
 
-    """Configuration Interface"""
+    """Configuration Interface
+    One shared instance per process"""
+
+    _instance = None
+    _lock = Lock()
+
+    def __new__(cls):
+        """Returns the shared
+        instance, loading it once"""
 
-    def __init__(self) -> None:
+        with cls._lock:
+            if cls._instance is None:
+                instance = super().__new__(cls)
+                instance.load()
+                cls._instance = instance
+
+        return cls._instance
+
+    def load(self) -> None:
         """Load instance Variables"""
         data = {}
         with open(join(dirname(__file__), "config.yaml"), encoding="utf-8") as file:
@@ -96,11 +145,11 @@ class Config:
 
                 mult_base_url=data.get("mult_base_url"),
 
-                sp_mult_urls = [
+                sp_mult_urls = (
                     data.get("url_sp_ey"),
                     data.get("url_sp_pe"),
                     data.get("url_sp_pb")
-                    ],
+                    ),
                 url_estimate_ey=data.get("url_estimate_ey"),
                 url_estimate_pe=data.get("url_estimate_pe"),
                 url_estimate_eps=data.get("url_estimate_eps"),
@@ -121,8 +170,8 @@ class Config:
                 
                 di_future=data.get("di_future"),
                 
-                imf_gdp=data.get("imf_gdp"),
-                imf_cpi=data.get("imf_cpi"),
+                imf_api=data.get("imf_api"),
+                sgs_url=data.get("sgs_url"),
                 
                 url_ouro=data.get("url_ouro"),
 
@@ -131,10 +180,8 @@ class Config:
                 relatorio_inflacao_url=data.get("relatorio_inflacao_url"),
                 cds_5anos=data.get("cds_5anos"),
                 taxas_juros=data.get("taxas_juros"),
-                ipca_focus=data.get("ipca_focus"),
-                pib_focus=data.get("pib_focus"),
-                selic_focus=data.get("selic_focus"),
-                cambio_focus=data.get("cambio_focus"),
+                focus_api=data.get("focus_api"),
+                focus_indicators=MappingProxyType(data.get("focus_indicators", {})),
 
                 url_b3_flows=data.get("url_b3_flows"),
 
@@ -154,20 +201,56 @@ class Config:
                 pl_ibov=data.get("pl_ibov"),
 
                 FRED_API_KEY=secrets["general"]["FRED_API_KEY"],
-                AV_API_KEY=secrets["general"]["AV_API_KEY"]
+                AV_API_KEY=secrets["general"]["AV_API_KEY"],
+
+                fred_max_workers=data.get("fred_max_workers", 8),
+                store_dir=data.get("store_dir", "store"),
+                store_max_age_hours=data.get("store_max_age_hours", 12),
+                download_dir=data.get("download_dir", "downloads"),
+                source_ttl=MappingProxyType(data.get("source_ttl", {})),
+                swr_max_workers=data.get("swr_max_workers", 2),
+                sgs_window_years=data.get("sgs_window_years", 10),
+                shared_cache=environ.get("SHARED_CACHE", data.get("shared_cache", "sqlite")),
+                shared_cache_file=data.get("shared_cache_file", "shared_cache.sqlite"),
+                shared_cache_lease_seconds=data.get("shared_cache_lease_seconds", 120),
+                shared_cache_max_age_days=data.get("shared_cache_max_age_days", 365),
+                shared_cache_max_mb=data.get("shared_cache_max_mb", 256),
+                di_selenium_fallback=data.get("di_selenium_fallback", False),
+                warmup_max_workers=data.get("warmup_max_workers", 4),
+                warmup_interval_hours=data.get("warmup_interval_hours", 6),
+                warmup_pages=tuple(data.get("warmup_pages", ())),
+                http_timeout=data.get("http_timeout", 30),
+                http_max_connections=data.get("http_max_connections", 20),
+                http_max_per_host=data.get("http_max_per_host", 4),
+                http_replay=environ.get("HTTP_REPLAY", data.get("http_replay", "off")),
+                http_replay_dir=data.get("http_replay_dir", "replay"),
+                http_replay_port=data.get("http_replay_port", 8765),
+                chart_max_points=data.get("chart_max_points", 1500),
+                chart_cache_mb=data.get("chart_cache_mb", 64),
+                chart_cache_max_entries=data.get("chart_cache_max_entries", 512),
+                derived_cache_max_entries=data.get("derived_cache_max_entries", 256),
+                pyramid_max_series=data.get("pyramid_max_series", 128),
+                import_budget_ms=data.get("import_budget_ms", 1500),
+                lazy_modules=tuple(data.get("lazy_modules", ())),
+                metrics_dir=data.get("metrics_dir", "metrics"),
+                admin_usernames=tuple(data.get("admin_usernames", ())),
+                bench_dir=data.get("bench_dir", "bench"),
+                bench_timeout=data.get("bench_timeout", 180),
+                bench_tolerance=data.get("bench_tolerance", 0.2)
         )
         self.base_color = "#fba725"
-        self.multiple_color = ["#dd4f00", "#983f4a", "#ffae42", "#ffffff", "#ffba6a"]
+        self.multiple_color = ("#dd4f00", "#983f4a", "#ffae42", "#ffffff", "#ffba6a")
 
-        self.app_names = ["Leonardo Quaranta", "Matheus Marinho", 
-                          "Gabriel Basso", "Eliseu Batista", "Augusto Alves"]
+        self.app_names = ("Leonardo Quaranta", "Matheus Marinho", 
+                          "Gabriel Basso", "Eliseu Batista", "Augusto Alves")
         
-        self.app_usernames = ["leoquaranta", "mmarinho", 
-                              "gbasso", "eliseubat", "augalves"]
+        self.app_usernames = ("leoquaranta", "mmarinho", 
+                              "gbasso", "eliseubat", "augalves")
         
-        self.headers = {
+        # read only, shared by every page
+        self.headers = MappingProxyType({
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
+            })
         
 
     def __repr__(self) -> str:
@@ -2,36 +2,55 @@
 """Import modules"""
 
 from os import path, makedirs, system
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial
+from urllib.parse import quote
 import pandas as pd
-import pandas_datareader.data as pdr
-from datetime import datetime
-from bs4 import BeautifulSoup
-import requests
-import yfinance as yf
-from alpha_vantage.timeseries import TimeSeries
+from datetime import datetime, timedelta
 
 import warnings
 from fredapi import Fred
+from src.metrics import Metrics
+from src.cache_policy import CachePolicy
 
+
+@Metrics.instrument(exclude=("get_av_tseries",))
 class Extract:
     """Extract Interface"""
 
+    _fred = None
+    _fred_pool = None
+
     def __init__(self) -> None:
         """Initializes instance"""
 
         # import local module
         from src.iface_config import Config
         from src.indicators import Indicators
+        from src.store import SeriesStore
+        from src.iface_http import AsyncHttp
+        from src.download_cache import DownloadCache
 
         self.config = Config()
         self.indicators = Indicators()
+        self.store = SeriesStore()
+        self.http = AsyncHttp()
+        self.downloads = DownloadCache()
         self.data_dir = self.config.vars.data_dir
         self.start = datetime(2000, 1, 1)
         self.end = datetime.today()
 
-        self.fred = Fred(api_key=self.config.vars.FRED_API_KEY)
-        self.av_tseries = TimeSeries(key=self.config.vars.AV_API_KEY, 
-                             output_format="pandas")
+        # one FRED client and pool per process, shared by every page
+        if Extract._fred is None:
+            Extract._fred = Fred(api_key=self.config.vars.FRED_API_KEY)
+        self.fred = Extract._fred
+        if Extract._fred_pool is None:
+            Extract._fred_pool = ThreadPoolExecutor(
+                max_workers=self.config.vars.fred_max_workers,
+                thread_name_prefix="fred"
+            )
+        self.av_tseries = None
 
         warnings.filterwarnings('ignore')
 
@@ -46,54 +65,269 @@ class Extract:
         Print Representation"""
 
         return f"Extract Class, staging dir: {str(self.data_dir)}"
-    
-    
 
 
-    
+    def get_av_tseries(self):
+        """Gets the Alpha Vantage client
+        Only built on the fallback path"""
 
+        # import heavy module on demand
+        from alpha_vantage.timeseries import TimeSeries
 
-    
+        if self.av_tseries is None:
+            self.av_tseries = TimeSeries(key=self.config.vars.AV_API_KEY, 
+                                         output_format="pandas")
+
+        return self.av_tseries
+
+
+    def download_fred_series(self, ind: str, start: datetime = None) -> pd.DataFrame:
+        """Downloads a FRED series
+        from start until today"""
+
+        try:
+            series = self.fred.get_series(ind,
+                                          observation_start=start or self.start,
+                                          observation_end=self.end)
+        except Exception as error:
+            raise OSError(error) from error
+
+        series.index.name = "Date"
+
+        return series.to_frame(name=str(ind))
+
+
+    def get_fred_series(self, ind: str) -> pd.Series:
+        """Gets a FRED series from the store
+        downloading only new observations"""
+
+        series = self.store.update(ind, partial(self.download_fred_series, ind), "fred")[str(ind)]
+        series.name = ind
+
+        return series
+
+
+    def get_fred_data(self, ids: list | str = None, theme: str = None) -> pd.DataFrame:
+        """Downloads FRED series concurrently
+        Return one date aligned DataFrame"""
+
+        if theme is not None:
+            ids = self.indicators.get_ids_list(theme, source="fred")
+        if isinstance(ids, str):
+            ids = [ids]
+        if not ids:
+            raise OSError("No FRED ids to download")
+
+        # bounded by the shared pool, one request per series,
+        # the context carries the caller metrics into the workers
+        futures = [Extract._fred_pool.submit(copy_context().run, self.get_fred_series, ind)
+                   for ind in ids]
+        df_final = pd.concat([future.result() for future in futures], axis=1)
+        df_final.index.name = "Date"
+
+        return df_final
+
+
+    def download_yf_series(self, ticker: str, start: datetime = None) -> pd.DataFrame:
+        """Downloads a yfinance close
+        series from start until today"""
+
+        # import heavy module on demand
+        import yfinance as yf
+
+        try:
+            close = yf.download(ticker, start=start or self.start, 
+                                end=self.end, progress=False)["Close"]
+        except Exception as error:
+            raise OSError(error) from error
+
+        close = close.squeeze("columns").to_frame(name=ticker)
+        close.index.name = "Date"
+
+        return close
+
+
+    def get_yf_data(self, tickers: list | str) -> pd.DataFrame:
+        """Gets yfinance close series from the
+        store downloading only new observations"""
+
+        if isinstance(tickers, str):
+            tickers = [tickers]
+
+        df_final = pd.concat([
+            self.store.update(ticker, partial(self.download_yf_series, ticker), "yfinance")
+            for ticker in tickers
+        ], axis=1)
+
+        return df_final
+
+
+    def sgs_windows(self, start: datetime, end: datetime) -> list:
+        """Splits a date range into the
+        longest windows SGS answers"""
+
+        years = self.config.vars.sgs_window_years
+        windows = []
+        while start <= end:
+            # SGS refuses ranges above ten years on daily series
+            stop = min(start + pd.DateOffset(years=years) - timedelta(days=1), end)
+            windows.append((start, stop))
+            start = stop + timedelta(days=1)
+
+        return windows
+
+
+    def download_sgs_many(self, starts: dict) -> dict:
+        """Downloads many BCB SGS series, {code: start},
+        every window of every code concurrently"""
+
+        windows = [
+            (code, self.config.vars.sgs_url.format(code=code,
+                                                   start=f"{first:%d/%m/%Y}",
+                                                   end=f"{last:%d/%m/%Y}"))
+            for code, start in starts.items()
+            for first, last in self.sgs_windows(pd.Timestamp(start or self.start),
+                                                pd.Timestamp(self.end))
+        ]
+
+        try:
+            responses = self.http.get_many([url for _, url in windows],
+                                           headers=dict(self.config.headers))
+        except Exception as error:
+            raise OSError(error) from error
+
+        rows = {code: [] for code in starts}
+        for (code, url), response in zip(windows, responses):
+            # windows before the first observation have no data
+            if response.status_code == 404:
+                continue
+            if not response.is_success:
+                raise OSError(f"Unable to download {url}: {response.status_code}")
+            rows[code] += response.json()
+
+        data = {}
+        for code, values in rows.items():
+            series = pd.DataFrame(values, columns=["data", "valor"])
+            series.index = pd.to_datetime(series["data"], format="%d/%m/%Y")
+            series.index.name = "Date"
+            data[code] = series[["valor"]].astype(float).rename(columns={"valor": str(code)})
+            data[code] = data[code][~data[code].index.duplicated(keep="last")]
+
+        return data
+
+
+    def download_sgs_series(self, code: int, start: datetime = None) -> pd.DataFrame:
+        """Downloads a BCB SGS
+        series from start until today"""
+
+        return self.download_sgs_many({code: start})[code]
+
+
+    def get_sgs_series(self, code: int) -> pd.DataFrame:
+        """Gets a BCB SGS series from the
+        store downloading only new observations"""
+
+        return self.store.update(code, partial(self.download_sgs_series, code), "sgs")
+
+
+    def get_sgs_data(self, codes: list) -> dict:
+        """Gets many BCB SGS series from the store,
+        new observations of all in one batch"""
+
+        return self.store.update_many(list(codes), self.download_sgs_many, "sgs")
+
+
+    def download_imf_indicator(self, ind: str, start: datetime = None) -> pd.DataFrame:
+        """Downloads an IMF DataMapper indicator
+        for every country, one row per year"""
+
+        # each WEO vintage revises the whole history, start is not used
+        url = f"{self.config.vars.imf_api}/{ind}"
+
+        try:
+            response = self.http.get(url, headers=dict(self.config.headers))
+            if not response.is_success:
+                raise OSError(f"Unable to download {url}: {response.status_code}")
+            values = response.json()["values"][ind]
+        except Exception as error:
+            raise OSError(error) from error
+
+        data = pd.DataFrame(values)
+        data.index = pd.to_datetime(data.index, format="%Y")
+        data.index.name = "Date"
+
+        return data.sort_index().astype(float)
+
+
+    @CachePolicy.swr("imf")
+    def get_imf_data(self, ind: str) -> pd.DataFrame:
+        """Gets the year by country matrix of an
+        IMF indicator, one download for every country"""
+
+        return self.store.update(f"imf_{ind}", partial(self.download_imf_indicator, ind), "imf")
+
+
+    def download_focus_many(self, starts: dict) -> dict:
+        """Downloads the Focus annual expectations, {key: start},
+        only the rows from start on, every indicator concurrently"""
+
+        names = {key: str(key).removeprefix("focus_") for key in starts}
+        urls = []
+        for key, start in starts.items():
+            odata_filter = (f"Indicador eq '{self.config.vars.focus_indicators[names[key]]}' "
+                            f"and baseCalculo eq 0")
+            if start is not None:
+                odata_filter += f" and Data ge '{start:%Y-%m-%d}'"
+            urls.append(self.config.vars.focus_api.format(filter=quote(odata_filter)))
+
+        try:
+            responses = self.http.get_many(urls, headers=dict(self.config.headers))
+        except Exception as error:
+            raise OSError(error) from error
+
+        data = {}
+        for key, url, response in zip(starts, urls, responses):
+            if not response.is_success:
+                raise OSError(f"Unable to download {url}: {response.status_code}")
+
+            rows = pd.DataFrame(response.json()["value"],
+                                columns=["Data", "DataReferencia", "Mediana"])
+            rows["Data"] = pd.to_datetime(rows["Data"])
+            # one row per survey date, one column per reference year
+            matrix = rows.pivot_table(index="Data", columns="DataReferencia",
+                                      values="Mediana", aggfunc="last")
+            matrix.columns = matrix.columns.astype(str)
+            data[key] = matrix
+
+        return data
+
+
+    @CachePolicy.swr("projecoes_focus")
+    def get_focus_mirror(self) -> dict:
+        """Gets the local Focus mirror, {name: survey date by
+        reference year}, new surveys of all in one batch"""
+
+        keys = [f"focus_{name}" for name in self.config.vars.focus_indicators]
+        mirror = self.store.update_many(keys, self.download_focus_many, "focus")
+
+        return {key.removeprefix("focus_"): data for key, data in mirror.items()}
 
-    
-    
 
-            
-        
     def get_emerging_data(self) -> pd.DataFrame | list:
         """Download Emerging
         Markets Data"""
 
-        ind_list = []
-        for ind in self.indicators.get_ids_list("emerging_markets"):
-            try:
-                indicator_series = self.fred.get_series(ind,
-                                                        observation_start=self.start, 
-                                                        observation_end=self.end)
-                indicator_series = indicator_series.to_frame(name=ind)
-                indicator_series.index.name = "Date"
-                ind_list.append(indicator_series)
-            except Exception as error:
-                raise OSError(error) from error
-            
-        df_final = pd.concat(ind_list, axis=1)
-            
-        return df_final
+        return self.get_fred_data(theme="em_mkt_spread_cred")
 
 
     def get_emb_series(self) -> pd.DataFrame:
         """Downloads EMB etf
         series"""
 
-        emb = None
-        
-        try:
-            emb = yf.download(self.indicators.get_ids_list("emb"), start=self.start, end=self.end)["Close"]
-        except Exception as error:
-            raise OSError(error) from error
+        emb = self.get_yf_data(self.indicators.get_ids_list("emb"))
         
         if emb is None or emb.empty:
-            emb, metadata = self.av_tseries.get_daily(self.config.vars.emb,
+            emb, metadata = self.get_av_tseries().get_daily(self.config.vars.emb,
                                              outputsize="full")
             emb.sort_index(inplace=True)
             emb = emb["4. close"]
@@ -105,17 +339,8 @@ class Extract:
         """Downloads VXEEMCLS index
         series"""
         
-        try:
-            for ind in self.indicators.get_ids_list("vxeem"):
-                vxeem = self.fred.get_series(ind,
-                                        observation_start=self.start, 
-                                        observation_end=self.end)
-                vxeem = vxeem.to_frame()
-                vxeem.dropna(inplace=True)
-                vxeem.index.name="Date"
-
-        except Exception as error:
-                raise OSError(error) from error
+        vxeem = self.get_fred_data(self.indicators.get_ids_list("em_mkt_extras")[-1:])
+        vxeem.dropna(inplace=True)
 
         return vxeem
     
@@ -124,15 +349,10 @@ class Extract:
         """Download Global 
         ex US data"""
 
-        try:
-            spdw = yf.download(self.indicators.get_ids_list("global_ex_us"), 
-                        start=self.start, end=self.end)["Close"]
-
-        except Exception as error:
-            raise OSError(error) from error
+        spdw = self.get_yf_data(self.indicators.get_ids_list("global_ex_us"))
         
         if len(spdw) == 0:
-            spdw, metadata = self.av_tseries.get_daily("SPDW", outputsize="full")
+            spdw, metadata = self.get_av_tseries().get_daily("SPDW", outputsize="full")
             spdw.sort_index(inplace=True)
             spdw = spdw["4. close"]
 
@@ -0,0 +1,103 @@
+# -*- coding: UTF-8 -*-
+"""Import modules"""
+
+import asyncio
+from threading import Thread, Lock
+import httpx
+
+
+class AsyncHttp:
+    """Async HTTP Fan-out Interface"""
+
+    _loop = None
+    _clients = {}
+    _semaphores = {}
+    _lock = Lock()
+
+    def __init__(self) -> None:
+        """Initializes instance"""
+
+        # import local module
+        from src.iface_config import Config
+
+        self.config = Config()
+        self.timeout = self.config.vars.http_timeout
+        self.max_connections = self.config.vars.http_max_connections
+        self.max_per_host = self.config.vars.http_max_per_host
+
+        # one event loop per process, the clients keep their pools there
+        with AsyncHttp._lock:
+            if AsyncHttp._loop is None:
+                AsyncHttp._loop = asyncio.new_event_loop()
+                Thread(target=AsyncHttp._loop.run_forever,
+                       name="async-http", daemon=True).start()
+
+    def __repr__(self) -> str:
+        """AsyncHttp Class Basic
+        Representation"""
+
+        return f"AsyncHttp Class, max connections: {str(self.max_connections)}"
+
+    def __str__(self) -> str:
+        """AsyncHttp Class
+        Print Representation"""
+
+        return f"AsyncHttp Class, max connections: {str(self.max_connections)}"
+
+
+    def get_client(self, verify: bool) -> httpx.AsyncClient:
+        """Gets the pooled client
+        Only called inside the loop"""
+
+        if verify not in AsyncHttp._clients:
+            AsyncHttp._clients[verify] = httpx.AsyncClient(
+                verify=verify,
+                timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(max_connections=self.max_connections),
+                follow_redirects=True
+            )
+
+        return AsyncHttp._clients[verify]
+
+
+    async def fetch(self, url: str, headers: dict, verify: bool) -> httpx.Response:
+        """Requests one url respecting
+        the per host limit"""
+
+        host = httpx.URL(url).host
+        if host not in AsyncHttp._semaphores:
+            AsyncHttp._semaphores[host] = asyncio.Semaphore(self.max_per_host)
+
+        async with AsyncHttp._semaphores[host]:
+            return await self.get_client(verify).get(url, headers=headers)
+
+
+    async def fetch_all(self, urls: list, headers: dict, verify: bool) -> list:
+        """Requests all the
+        urls concurrently"""
+
+        return await asyncio.gather(*[self.fetch(url, headers, verify)
+                                      for url in urls])
+
+
+    def get_many(self, urls: list, headers: dict = None, verify: bool = True) -> list:
+        """Requests the urls concurrently
+        Return the responses in order"""
+
+        future = asyncio.run_coroutine_threadsafe(
+            self.fetch_all(urls, headers, verify), AsyncHttp._loop
+        )
+
+        try:
+            responses = future.result()
+        except Exception as error:
+            raise OSError(error) from error
+
+        return responses
+
+
+    def get(self, url: str, headers: dict = None, verify: bool = True) -> httpx.Response:
+        """Requests a single url
+        through the shared pool"""
+
+        return self.get_many([url], headers, verify)[0]
@@ -0,0 +1,105 @@
+# -*- coding: UTF-8 -*-
+"""Import modules"""
+
+from os import path
+from glob import glob
+import subprocess
+import sys
+import pandas as pd
+
+
+class ImportBudget:
+    """Import Time Budget Interface"""
+
+    # offline scripts, never imported by a page
+    scripts = ("src.generate", "src.import_budget", "src.page_bench")
+
+    def __init__(self) -> None:
+        """Initializes instance"""
+
+        # import local module
+        from src.iface_config import Config
+
+        self.config = Config()
+        self.root_dir = path.dirname(path.dirname(path.abspath(__file__)))
+        self.budget_ms = self.config.vars.import_budget_ms
+        self.lazy_modules = self.config.vars.lazy_modules
+
+    def __repr__(self) -> str:
+        """ImportBudget Class Basic
+        Representation"""
+
+        return f"ImportBudget Class, budget: {str(self.budget_ms)} ms"
+
+    def __str__(self) -> str:
+        """ImportBudget Class
+        Print Representation"""
+
+        return f"ImportBudget Class, budget: {str(self.budget_ms)} ms"
+
+
+    def get_modules(self) -> list:
+        """Lists the subpages and the
+        interfaces the pages import"""
+
+        files = sorted(glob(path.join(self.root_dir, "app_pages", "**", "subpages", "*.py"),
+                            recursive=True))
+        files += [path.join(self.root_dir, "app_pages", "utils.py"),
+                  path.join(self.root_dir, "app_pages", "main.py")]
+        files += sorted(glob(path.join(self.root_dir, "src", "*.py")))
+
+        modules = []
+        for file in files:
+            name = path.relpath(file, self.root_dir)[:-3].replace(path.sep, ".")
+            if not name.endswith("__init__") and name not in self.scripts:
+                modules.append(name)
+
+        return modules
+
+
+    def measure(self, module: str) -> dict:
+        """Imports a module in a fresh interpreter
+        Return its cumulative time and heavy imports"""
+
+        try:
+            result = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                cwd=self.root_dir, capture_output=True, text=True, check=False
+            )
+        except Exception as error:
+            raise OSError(error) from error
+
+        total_us = 0
+        heavy = set()
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, cumulative, name = line.split("|")
+            if not cumulative.strip().isdigit():
+                continue
+            if name.strip() == module and name.startswith(" " + module):
+                total_us = int(cumulative)
+            if name.strip().split(".")[0] in self.lazy_modules:
+                heavy.add(name.strip().split(".")[0])
+
+        return {"module": module,
+                "ms": round(total_us / 1000, 1),
+                "heavy": ", ".join(sorted(heavy)),
+                "ok": result.returncode == 0 and not heavy and total_us / 1000 <= self.budget_ms,
+                "error": result.stderr.strip().splitlines()[-1] if result.returncode else ""}
+
+
+    def report(self) -> pd.DataFrame:
+        """Measures every module
+        Return one row per module"""
+
+        report = pd.DataFrame([self.measure(module) for module in self.get_modules()])
+
+        return report.set_index("module").sort_values("ms", ascending=False)
+
+
+if __name__ == "__main__":
+    budget = ImportBudget()
+    import_report = budget.report()
+    print(import_report.to_string())
+    sys.exit(0 if import_report["ok"].all() else 1)
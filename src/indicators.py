@@ -1,25 +1,39 @@
 # -*- coding: UTF-8 -*-
 """Import modules"""
 
-from os import environ
 from os.path import join, dirname
-from dataclasses import dataclass, field
-from dotenv import load_dotenv
+from threading import Lock
 from yaml import load
 from yaml.loader import SafeLoader
-from streamlit import secrets
 
 
 
 class Indicators:
 
-    """Indicators IDS Interface"""
+    """Indicators IDS Interface
+    One shared catalog per process"""
 
-    def __init__(self) -> None:
+    _instance = None
+    _lock = Lock()
+
+    def __new__(cls):
+        """Returns the shared
+        catalog, loading it once"""
+
+        with cls._lock:
+            if cls._instance is None:
+                instance = super().__new__(cls)
+                instance.load()
+                cls._instance = instance
+
+        return cls._instance
+
+    def load(self) -> None:
         """Load instance Variables"""
         
         indicators = {}
         ids = {}
+        sources = {}
 
         with open(join(dirname(__file__), "indicators.yaml"), encoding="utf-8") as file:
             data=load(file, Loader=SafeLoader)
@@ -33,10 +47,12 @@ class Indicators:
         
         for indicator in data:
             ids[indicator] = data[indicator]["id"]
+            sources[indicator] = data[indicator].get("source")
 
         self.all_dict = data
         self.indicators = indicators
         self.ids = ids
+        self.sources = sources
 
         self.groups = {
             "us_macro_act_hist": [
@@ -213,36 +229,44 @@ class Indicators:
             ],
         }
 
+        # themes are resolved once, pages only copy them
+        self.theme_dicts = {
+            theme: {
+                name: value for id, dic in self.indicators.items()
+                for name, value in dic.items() if id in members
+            } for theme, members in self.groups.items()
+        }
+        self.theme_ids = {
+            theme: [(ind, id) for ind, id in self.ids.items() if ind in members]
+            for theme, members in self.groups.items()
+        }
+
 
     def get_theme_dict(self, theme_name: str) -> dict:
         """Gets a theme
         Return the correct dict"""
 
-        return {
-            name: value for id, dic in self.indicators.items() 
-            for name, value in dic.items() if id in self.groups[theme_name]
-            }
+        return {name: dict(value)
+                for name, value in self.theme_dicts[theme_name].items()}
     
 
-    def get_ids_list(self, theme_name: str):
+    def get_ids_list(self, theme_name: str, source: str = None):
         """Gets a theme
         Return the ids"""
         
 
-        return [id for ind, id in self.ids.items()
-                if ind in self.groups[theme_name]]
+        return [id for ind, id in self.theme_ids[theme_name]
+                if source is None or self.sources[ind] == source]
 
     
     def __repr__(self) -> str:
         """ Basic class
         representation """
 
-        return str(self.vars)
+        return f"Indicators Class, indicators: {len(self.ids)}"
     
     def __str__(self) -> str:
         """ Print
         representation """
 
-        return str(self.vars)
-    
-ind = Indicators()
\ No newline at end of file
+        return f"Indicators Class, indicators: {len(self.ids)}"
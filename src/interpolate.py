@@ -1,30 +1,47 @@
 # -*- coding: UTF-8 -*-
 """Import modules"""
 
-from os import path, system
+from os import path, system, listdir
+from io import StringIO
+from threading import Lock
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from scipy import interpolate
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
+from lxml import html as lxml_html
 import warnings
-import holidays
 from functools import reduce
+from src.metrics import Metrics
+from src.single_flight import SingleFlight
 
 
+@Metrics.instrument(prefixes=(), names=("get_di_table", "download_di_table",
+                                           "get_di_tables", "download_di_tables"))
 class Interpolate:
     """Interpolate Interface"""
 
+    # SistemaPregao1.asp layout, browsers add the tbody
+    di_table_xpath = "/html/body/div/div[2]/form[1]/table[3]/{tbody}tr[3]/td[3]/table"
+    di_index_xpath = "/html/body/div/div[2]/form[1]/table[3]/{tbody}tr[3]/td[1]/table"
+
+    _driver = None
+    _driver_lock = Lock()
+
     def __init__(self) -> None:
         """Initializes instance"""
 
         # import local module
         from src.iface_config import Config
+        from src.download_cache import DownloadCache
+        from src.iface_http import AsyncHttp
+        from src.bus_calendar import BusCalendar
+        from src.store import SeriesStore
 
         self.config = Config()
+        self.di_store = SeriesStore("di1")
+        self.downloads = DownloadCache()
+        self.http = AsyncHttp()
+        self.calendar = BusCalendar()
+        self.selenium_fallback = self.config.vars.di_selenium_fallback
         self.data_dir = self.config.vars.data_dir
         self.start = datetime(2000, 1, 1)
         self.end = datetime.today()
@@ -46,6 +63,9 @@ class Interpolate:
     @staticmethod
     def ajustar_para_dia_util(data_hora, pais='BR'):
 
+        # import heavy module on demand
+        import holidays
+
         feriados = holidays.country_holidays(pais)
 
         feriados.update({
@@ -60,35 +80,94 @@ class Interpolate:
 
         return data_hora.replace(hour=11, minute=0, second=0)
 
-    def get_di_table(self, date, mercadoria: str = "DI1") -> pd.DataFrame:
-        """Get the CDI table 
-        for given date"""
+    def find_di_element(self, tree, xpath: str):
+        """Finds a BMF table with
+        or without the tbody tag"""
 
-        url = self.config.vars.di_future.replace(r"{data_di}", date).replace(r"{mercadoria}", mercadoria)
-        chrome_options = webdriver.ChromeOptions()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--disable-gpu")  
-        chrome_options.add_argument("--no-sandbox")
-        try:
-            driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()),
-                                  options=chrome_options)
+        for tbody in ["", "tbody/"]:
+            elements = tree.xpath(xpath.replace("{tbody}", tbody))
+            if elements:
+                return elements[0]
+
+        raise OSError("DI table not found in the BMF page")
+
+
+    def parse_di_html(self, content: bytes) -> tuple:
+        """Finds the BMF tables in a page
+        Return the table and index html"""
+
+        tree = lxml_html.fromstring(content)
+        html_table = lxml_html.tostring(self.find_di_element(tree, self.di_table_xpath), 
+                                        encoding="unicode")
+        html_index = lxml_html.tostring(self.find_di_element(tree, self.di_index_xpath), 
+                                        encoding="unicode")
+
+        return html_table, html_index
+
+
+    def get_di_html(self, url: str) -> tuple:
+        """Requests the BMF page
+        Return the table and index html"""
+
+        response = self.http.get(url, headers=self.config.headers)
+        if not response.is_success:
+            raise OSError(f"Unable to request the BMF page: {response.status_code}")
+
+        return self.parse_di_html(response.content)
+
+
+    def get_driver(self):
+        """Gets the shared
+        headless Chrome driver"""
+
+        # imported here, the browser is only an opt-in fallback
+        from selenium import webdriver
+        from webdriver_manager.chrome import ChromeDriverManager
+        from selenium.webdriver.chrome.service import Service
+
+        if Interpolate._driver is None:
+            chrome_options = webdriver.ChromeOptions()
+            chrome_options.add_argument("--headless")
+            chrome_options.add_argument("--disable-gpu")  
+            chrome_options.add_argument("--no-sandbox")
+            Interpolate._driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()),
+                                                   options=chrome_options)
+
+        return Interpolate._driver
+
+
+    def get_di_html_selenium(self, url: str) -> tuple:
+        """Renders the BMF page on Chrome
+        Return the table and index html"""
+
+        with Interpolate._driver_lock:
+            driver = self.get_driver()
             driver.get(url)
             driver.implicitly_wait(5)
 
-            local_table = "/html/body/div/div[2]/form[1]/table[3]/tbody/tr[3]/td[3]/table"
-            local_index = "/html/body/div/div[2]/form[1]/table[3]/tbody/tr[3]/td[1]/table"
-
-            element_table = driver.find_element("xpath", local_table)
-            element_index = driver.find_element("xpath", local_index)
+            element_table = driver.find_element("xpath", self.di_table_xpath.replace("{tbody}", "tbody/"))
+            element_index = driver.find_element("xpath", self.di_index_xpath.replace("{tbody}", "tbody/"))
 
             html_table = element_table.get_attribute("outerHTML")
             html_index = element_index.get_attribute("outerHTML")
 
-            table = pd.read_html(html_table)[0]
-            index = pd.read_html(html_index)[0]
+        return html_table, html_index
+
 
-            driver.quit()
+    def di_url(self, date: str, mercadoria: str = "DI1") -> str:
+        """Gets the BMF page url
+        of a settlement date"""
 
+        return self.config.vars.di_future.replace(r"{data_di}", date).replace(r"{mercadoria}", mercadoria)
+
+
+    def read_di_table(self, html_table: str, html_index: str) -> pd.Series:
+        """Reads the BMF tables into the
+        rates per maturity date"""
+
+        try:
+            table = pd.read_html(StringIO(html_table))[0]
+            index = pd.read_html(StringIO(html_index))[0]
         except Exception as error:
             raise OSError(error) from error
 
@@ -123,19 +202,123 @@ class Interpolate:
 
         return table
 
-    def get_anbima_holidays(self) -> pd.DataFrame:
-        """Gets ANBIMA National
-        Holidays"""
 
-        try:
-            data_anbima = pd.read_excel(self.config.vars.anbima_holidays)[:-9]
-            data_anbima["Data"] = pd.to_datetime(data_anbima["Data"], format=r"%Y-%m-%d")
-            data_anbima = data_anbima[data_anbima["Data"] >= self.end]["Data"].to_list()
+    def download_di_table(self, date, mercadoria: str = "DI1") -> pd.Series:
+        """Scraps the CDI table 
+        for given date"""
+
+        url = self.di_url(date, mercadoria)
 
+        try:
+            try:
+                html = self.get_di_html(url)
+            except Exception:
+                if not self.selenium_fallback:
+                    raise
+                html = self.get_di_html_selenium(url)
         except Exception as error:
             raise OSError(error) from error
 
-        return data_anbima
+        return self.read_di_table(*html)
+
+
+    def download_di_tables(self, dates: list, mercadoria: str = "DI1") -> list:
+        """Scraps the CDI tables of
+        many dates in one batch"""
+
+        urls = [self.di_url(date, mercadoria) for date in dates]
+        responses = self.http.get_many(urls, headers=self.config.headers)
+
+        tables = []
+        for url, response in zip(urls, responses):
+            try:
+                try:
+                    if not response.is_success:
+                        raise OSError(f"Unable to request the BMF page: {response.status_code}")
+                    html = self.parse_di_html(response.content)
+                except Exception:
+                    if not self.selenium_fallback:
+                        raise
+                    html = self.get_di_html_selenium(url)
+            except Exception as error:
+                raise OSError(error) from error
+            tables.append(self.read_di_table(*html))
+
+        return tables
+
+
+    def di_store_key(self, date: str, mercadoria: str = "DI1") -> str:
+        """Gets the store key
+        of a settlement date"""
+
+        return f"{mercadoria}_{datetime.strptime(date, r'%d/%m/%Y'):%Y-%m-%d}"
+
+
+    def get_di_table(self, date, mercadoria: str = "DI1") -> pd.Series:
+        """Get the CDI table for given date
+        Past tables never change, only scrap once"""
+
+        if not isinstance(date, str):
+            date = datetime.strftime(date, format=r"%d/%m/%Y")
+
+        key = self.di_store_key(date, mercadoria)
+        stored = self.di_store.load(key)
+        if stored is not None:
+            return stored["rate"]
+
+        # sessions asking for the same settlement wait for one scrap
+        table = SingleFlight.do(("di_table", key), self.download_di_table, date, mercadoria)
+        self.store_di_table(key, table)
+
+        return table
+
+
+    def store_di_table(self, key: str, table: pd.Series) -> None:
+        """Persists a scraped table, an empty one
+        means the session was not published yet"""
+
+        if not table.empty:
+            table.index.name = "VENCTO"
+            self.di_store.save(key, table.to_frame(name="rate"))
+
+
+    def get_di_tables(self, dates: list, mercadoria: str = "DI1") -> list:
+        """Gets the CDI tables of many dates, the
+        ones not stored yet scraped in one batch"""
+
+        dates = [date if isinstance(date, str) 
+                 else datetime.strftime(date, format=r"%d/%m/%Y")
+                 for date in dates]
+        keys = [self.di_store_key(date, mercadoria) for date in dates]
+
+        tables = {}
+        for key in keys:
+            stored = self.di_store.load(key)
+            if stored is not None:
+                tables[key] = stored["rate"]
+
+        missing = [(key, date) for key, date in zip(keys, dates) if key not in tables]
+        if missing:
+            downloaded = self.download_di_tables([date for _, date in missing], mercadoria)
+            for (key, _), table in zip(missing, downloaded):
+                self.store_di_table(key, table)
+                tables[key] = table
+
+        return [tables[key] for key in keys]
+
+
+    def get_stored_dates(self, mercadoria: str = "DI1") -> list:
+        """Lists the settlement dates
+        available without a scrap"""
+
+        prefix = f"{mercadoria}_"
+
+        return sorted(
+            datetime.strptime(file[len(prefix):-len(".parquet")], r"%Y-%m-%d")
+            for file in listdir(self.di_store.store_dir)
+            if file.startswith(prefix) and file.endswith(".parquet")
+        )
+
 
     def interpolate(self, interp_days):
         """Interpolate DI Interest Rate
@@ -151,27 +334,42 @@ class Interpolate:
 
         headers = ["atual", "1_mes", "3_meses", "6_meses"]
 
+        return self.get_curves(lista_datas, interp_days, headers)
+
+
+    @SingleFlight.shared
+    def get_curves(self, lista_datas: list, interp_days, headers: list = None) -> pd.DataFrame:
+        """Interpolates the DI curves of any
+        dates, one column per date"""
+
+        # import heavy module on demand
+        from scipy import interpolate
+
+        lista_datas = [date if isinstance(date, str) 
+                       else datetime.strftime(date, format=r"%d/%m/%Y")
+                       for date in lista_datas]
+        headers = headers or lista_datas
+
         lista_dfs = []
 
-        for i, date in enumerate(lista_datas):
+        # the curves not stored yet are scraped concurrently
+        di_tables = self.get_di_tables(lista_datas)
 
-            holidays = self.get_anbima_holidays()
-            di_table = self.get_di_table(date)
-            bus_days_list = []
+        # business days of every vertex of every curve in one call
+        ref_dates = np.concatenate([
+            np.repeat(np.datetime64(datetime.strptime(date, r"%d/%m/%Y"), "D"), len(di_table))
+            for date, di_table in zip(lista_datas, di_tables)
+        ])
+        maturities = np.concatenate([di_table.index.values for di_table in di_tables])
 
-            for day in di_table.index:
-                try:
-                    bus_days = len(
-                        pd.date_range(
-                            date,
-                            day,
-                            freq=pd.tseries.offsets.CustomBusinessDay(holidays=holidays),
-                        )
-                    )
-                    bus_days_list.append(bus_days)
-
-                except Exception as error:
-                    raise OSError(error) from error
+        try:
+            bus_days = self.calendar.count(ref_dates, maturities)
+        except Exception as error:
+            raise OSError(error) from error
+
+        bus_days_lists = np.split(bus_days, np.cumsum([len(di_table) for di_table in di_tables])[:-1])
+
+        for i, (di_table, bus_days_list) in enumerate(zip(di_tables, bus_days_lists)):
 
             rates = list(di_table.values)
 
@@ -0,0 +1,309 @@
+# -*- coding: UTF-8 -*-
+"""Import modules"""
+
+from os import path, makedirs, replace, getpid
+from contextvars import ContextVar
+from datetime import datetime
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+from urllib.parse import urlparse
+import urllib.request
+import json
+import requests
+import httpx
+import pandas as pd
+
+
+class Metrics:
+    """Fetch Instrumentation Interface"""
+
+    _methods = {}
+    _hosts = {}
+    _lock = Lock()
+    _hooked = False
+    # upstream traffic of the running tracked call, crosses into the async loop
+    _frame = ContextVar("metrics_frame", default=None)
+
+    def __init__(self) -> None:
+        """Initializes instance"""
+
+        # import local module
+        from src.iface_config import Config
+
+        self.config = Config()
+        self.metrics_dir = path.join(self.config.vars.data_dir, self.config.vars.metrics_dir)
+
+        makedirs(self.metrics_dir, exist_ok=True)
+
+    def __repr__(self) -> str:
+        """Metrics Class Basic
+        Representation"""
+
+        return f"Metrics Class, tracked methods: {len(Metrics._methods)}"
+
+    def __str__(self) -> str:
+        """Metrics Class
+        Print Representation"""
+
+        return f"Metrics Class, tracked methods: {len(Metrics._methods)}"
+
+
+    @classmethod
+    def instrument(cls, prefixes: tuple = ("get_", "download_"), names: tuple = (),
+                   exclude: tuple = ()):
+        """Class decorator, tracks the methods
+        starting with prefixes or listed in names"""
+
+        def decorate(klass):
+            for name, attr in list(vars(klass).items()):
+                if name in exclude or isinstance(attr, (staticmethod, classmethod, property)):
+                    continue
+                if not (name in names or name.startswith(prefixes)) or not hasattr(attr, "__get__"):
+                    continue
+                setattr(klass, name, cls.wrap(f"{klass.__name__}.{name}", klass, attr))
+            cls.install()
+            return klass
+
+        return decorate
+
+
+    @classmethod
+    def wrap(cls, key: str, klass, attr):
+        """Wraps one method, cached
+        functions keep their cache"""
+
+        @wraps(attr)
+        def tracked(instance, *args, **kwargs):
+            return cls.call(key, attr.__get__(instance, klass), *args, **kwargs)
+
+        return tracked
+
+
+    @classmethod
+    def call(cls, key: str, func, *args, **kwargs):
+        """Runs a tracked call and records
+        time, upstream traffic and errors"""
+
+        frame = {"requests": 0, "bytes": 0}
+        parent = cls._frame.get()
+        token = cls._frame.set(frame)
+        error = None
+        started = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            elapsed = perf_counter() - started
+            cls._frame.reset(token)
+
+            with cls._lock:
+                stats = cls._methods.setdefault(key, {
+                    "calls": 0, "hits": 0, "errors": 0, "seconds": 0.0,
+                    "max_seconds": 0.0, "requests": 0, "bytes": 0, "last_error": ""
+                })
+                stats["calls"] += 1
+                # nothing went upstream, served by a cache or the store
+                stats["hits"] += frame["requests"] == 0 and error is None
+                stats["seconds"] += elapsed
+                stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+                stats["requests"] += frame["requests"]
+                stats["bytes"] += frame["bytes"]
+                if error is not None:
+                    stats["errors"] += 1
+                    stats["last_error"] = f"{type(error).__name__}: {error}"[:200]
+                if parent is not None:
+                    parent["requests"] += frame["requests"]
+                    parent["bytes"] += frame["bytes"]
+
+
+    @classmethod
+    def count_upstream(cls, url, size: int) -> None:
+        """Counts one upstream response
+        for its host and the running call"""
+
+        host = urlparse(str(url)).netloc or str(url)
+        frame = cls._frame.get()
+
+        with cls._lock:
+            stats = cls._hosts.setdefault(host, {"requests": 0, "bytes": 0})
+            stats["requests"] += 1
+            stats["bytes"] += size
+            if frame is not None:
+                frame["requests"] += 1
+                frame["bytes"] += size
+
+
+    @staticmethod
+    def response_size(response, stream: bool = False) -> int:
+        """Gets the body size, from the header
+        when the body was not read yet"""
+
+        if not stream:
+            try:
+                return len(response.content)
+            except Exception:
+                pass
+
+        return int(response.headers.get("Content-Length") or 0)
+
+
+    @classmethod
+    def install(cls) -> None:
+        """Hooks requests, httpx and urllib
+        once per process"""
+
+        with cls._lock:
+            if cls._hooked:
+                return
+            cls._hooked = True
+
+        session_send = requests.Session.send
+        client_send = httpx.Client.send
+        async_send = httpx.AsyncClient.send
+        urlopen = urllib.request.urlopen
+
+        def tracked_session_send(session, request, **kwargs):
+            response = session_send(session, request, **kwargs)
+            cls.count_upstream(request.url, cls.response_size(response, kwargs.get("stream", False)))
+            return response
+
+        def tracked_client_send(client, request, **kwargs):
+            response = client_send(client, request, **kwargs)
+            cls.count_upstream(request.url, cls.response_size(response, kwargs.get("stream", False)))
+            return response
+
+        async def tracked_async_send(client, request, **kwargs):
+            response = await async_send(client, request, **kwargs)
+            cls.count_upstream(request.url, cls.response_size(response, kwargs.get("stream", False)))
+            return response
+
+        def tracked_urlopen(url, *args, **kwargs):
+            response = urlopen(url, *args, **kwargs)
+            cls.count_upstream(getattr(url, "full_url", url), cls.response_size(response, True))
+            return response
+
+        requests.Session.send = tracked_session_send
+        httpx.Client.send = tracked_client_send
+        httpx.AsyncClient.send = tracked_async_send
+        urllib.request.urlopen = tracked_urlopen
+
+
+    def upstream_requests(self) -> int:
+        """Gets the upstream requests
+        of all hosts so far"""
+
+        with Metrics._lock:
+            return sum(stats["requests"] for stats in Metrics._hosts.values())
+
+
+    def report(self) -> pd.DataFrame:
+        """Gets the stats of
+        each tracked method"""
+
+        with Metrics._lock:
+            report = pd.DataFrame({key: dict(stats) for key, stats in Metrics._methods.items()}).T
+
+        if report.empty:
+            return report
+
+        report["misses"] = report["calls"] - report["hits"]
+        report["mean_seconds"] = (report["seconds"] / report["calls"]).astype(float).round(3)
+        report["error_rate"] = (report["errors"] / report["calls"]).astype(float).round(3)
+        report.index.name = "method"
+
+        return report.sort_values("seconds", ascending=False)
+
+
+    def hosts_report(self) -> pd.DataFrame:
+        """Gets the requests and
+        bytes of each upstream host"""
+
+        with Metrics._lock:
+            report = pd.DataFrame({host: dict(stats) for host, stats in Metrics._hosts.items()}).T
+
+        if not report.empty:
+            report.index.name = "host"
+            report = report.sort_values("bytes", ascending=False)
+
+        return report
+
+
+    def to_prometheus(self) -> str:
+        """Writes the prometheus
+        text exposition file"""
+
+        with Metrics._lock:
+            methods = {key: dict(stats) for key, stats in Metrics._methods.items()}
+            hosts = {host: dict(stats) for host, stats in Metrics._hosts.items()}
+
+        lines = []
+        for name, field, kind, label, data in [
+            ("dashboard_fetch_calls_total", "calls", "counter", "method", methods),
+            ("dashboard_fetch_hits_total", "hits", "counter", "method", methods),
+            ("dashboard_fetch_errors_total", "errors", "counter", "method", methods),
+            ("dashboard_fetch_seconds_total", "seconds", "counter", "method", methods),
+            ("dashboard_fetch_max_seconds", "max_seconds", "gauge", "method", methods),
+            ("dashboard_fetch_bytes_total", "bytes", "counter", "method", methods),
+            ("dashboard_upstream_requests_total", "requests", "counter", "host", hosts),
+            ("dashboard_upstream_bytes_total", "bytes", "counter", "host", hosts),
+        ]:
+            lines.append(f"# TYPE {name} {kind}")
+            lines += [f'{name}{{{label}="{key}"}} {stats[field]}' for key, stats in data.items()]
+
+        # import local modules
+        from src.chart_cache import ChartCache
+        from src.single_flight import SingleFlight
+
+        for field, value in ChartCache().stats().items():
+            kind = "counter" if field in ("hits", "misses", "evictions") else "gauge"
+            suffix = "_total" if kind == "counter" else ""
+            lines.append(f"# TYPE dashboard_chart_cache_{field}{suffix} {kind}")
+            lines.append(f"dashboard_chart_cache_{field}{suffix} {value}")
+
+        for field, value in SingleFlight.stats().items():
+            kind = "gauge" if field == "in_flight" else "counter"
+            suffix = "_total" if kind == "counter" else ""
+            lines.append(f"# TYPE dashboard_single_flight_{field}{suffix} {kind}")
+            lines.append(f"dashboard_single_flight_{field}{suffix} {value}")
+
+        file = path.join(self.metrics_dir, "metrics.prom")
+        temp_file = f"{file}.{getpid()}.tmp"
+        try:
+            with open(temp_file, "w", encoding="utf-8") as output:
+                output.write("\n".join(lines) + "\n")
+            replace(temp_file, file)
+        except Exception as error:
+            raise OSError(error) from error
+
+        return file
+
+
+    def to_jsonl(self) -> str:
+        """Appends one line per method
+        to the jsonl history"""
+
+        now = datetime.now().isoformat(timespec="seconds")
+        with Metrics._lock:
+            rows = [{"time": now, "method": key, **stats}
+                    for key, stats in Metrics._methods.items()]
+            rows += [{"time": now, "host": host, **stats}
+                     for host, stats in Metrics._hosts.items()]
+
+        file = path.join(self.metrics_dir, "metrics.jsonl")
+        try:
+            with open(file, "a", encoding="utf-8") as output:
+                output.writelines(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+        except Exception as error:
+            raise OSError(error) from error
+
+        return file
+
+
+    def export(self) -> tuple:
+        """Writes the prometheus file
+        and appends the jsonl history"""
+
+        return self.to_prometheus(), self.to_jsonl()
@@ -0,0 +1,230 @@
+# -*- coding: UTF-8 -*-
+"""Import modules"""
+
+from os import path, makedirs, listdir, environ
+from datetime import datetime
+from time import perf_counter
+import subprocess
+import tracemalloc
+import json
+import sys
+import pandas as pd
+import streamlit as st
+
+
+class PageBench:
+    """st.Page Render Benchmark Interface"""
+
+    # same pages MainLayout.render_page registers
+    pages = (
+        "app_pages/usa/macro.py",
+        "app_pages/usa/markets.py",
+        "app_pages/brasil/macro_br.py",
+        "app_pages/brasil/markets_br.py",
+        "app_pages/em_mkts/macro_em.py",
+        "app_pages/em_mkts/markets_em.py",
+        "app_pages/global_ex_us/global_macro.py",
+        "app_pages/global_ex_us/global_markets.py",
+        "app_pages/commodities/comm.py",
+    )
+
+    def __init__(self) -> None:
+        """Initializes instance"""
+
+        # import local modules
+        from src.iface_config import Config
+        from src.metrics import Metrics
+
+        self.config = Config()
+        self.metrics = Metrics()
+        self.root_dir = path.dirname(path.dirname(path.abspath(__file__)))
+        self.bench_dir = path.join(self.config.vars.data_dir, self.config.vars.bench_dir)
+        self.timeout = self.config.vars.bench_timeout
+        self.tolerance = self.config.vars.bench_tolerance
+
+        makedirs(self.bench_dir, exist_ok=True)
+
+    def __repr__(self) -> str:
+        """PageBench Class Basic
+        Representation"""
+
+        return f"PageBench Class, bench dir: {str(self.bench_dir)}"
+
+    def __str__(self) -> str:
+        """PageBench Class
+        Print Representation"""
+
+        return f"PageBench Class, bench dir: {str(self.bench_dir)}"
+
+
+    def clear_caches(self) -> None:
+        """Drops the in memory caches
+        The on disk store is kept"""
+
+        # import local modules
+        from src.download_cache import DownloadCache
+        from src.cache_policy import CachePolicy
+        from src.chart_cache import ChartCache
+
+        st.cache_data.clear()
+        st.cache_resource.clear()
+        # process local only, the shared cache belongs to the replicas
+        CachePolicy.clear()
+        ChartCache.clear()
+        with DownloadCache._lock:
+            DownloadCache._parsed.clear()
+
+
+    def run_once(self, app, tab: str = None) -> dict:
+        """Runs the page script once
+        Return time, calls and peak memory"""
+
+        requests_before = self.metrics.upstream_requests()
+
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        started = perf_counter()
+        try:
+            if tab is None:
+                app.run(timeout=self.timeout)
+            else:
+                app.radio[0].set_value(tab).run(timeout=self.timeout)
+        finally:
+            elapsed = perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        calls = self.metrics.upstream_requests() - requests_before
+
+        return {"seconds": round(elapsed, 3),
+                "calls": calls,
+                "peak_mb": round(peak / 2**20, 1),
+                "exceptions": len(app.exception)}
+
+
+    def bench_page(self, page: str) -> list:
+        """Renders every tab of a page
+        cold and then warm"""
+
+        # import heavy module on demand
+        from streamlit.testing.v1 import AppTest
+
+        app = AppTest.from_file(path.join(self.root_dir, page), default_timeout=self.timeout)
+
+        self.clear_caches()
+        first = self.run_once(app)
+        tabs = list(app.radio[0].options) if len(app.radio) else [None]
+
+        results = []
+        for tab in tabs:
+            if tab == tabs[0]:
+                cold = first
+            else:
+                self.clear_caches()
+                cold = self.run_once(app, tab)
+            warm = self.run_once(app, tab)
+
+            results.append({
+                "page": page,
+                "tab": tab or "",
+                "cold_s": cold["seconds"],
+                "warm_s": warm["seconds"],
+                "cold_calls": cold["calls"],
+                "warm_calls": warm["calls"],
+                "peak_mb": max(cold["peak_mb"], warm["peak_mb"]),
+                "exceptions": cold["exceptions"] + warm["exceptions"],
+            })
+
+        return results
+
+
+    def get_commit(self) -> str:
+        """Gets the current commit
+        Return unknown outside git"""
+
+        try:
+            commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                                    cwd=self.root_dir, capture_output=True,
+                                    text=True, check=True).stdout.strip()
+        except Exception:
+            commit = "unknown"
+
+        return commit
+
+
+    def run(self) -> dict:
+        """Benchmarks all the pages
+        and saves the results as json"""
+
+        # import local module
+        from src.http_replay import HttpReplay
+
+        # with http_replay set to replay the run needs no network
+        HttpReplay().install()
+        self.metrics.install()
+
+        rows = [row for page in self.pages for row in self.bench_page(page)]
+
+        results = {"commit": self.get_commit(),
+                   "date": datetime.now().isoformat(timespec="seconds"),
+                   "python": sys.version.split()[0],
+                   "streamlit": st.__version__,
+                   "tabs": rows}
+
+        file = path.join(self.bench_dir, f"pages_{results['commit']}.json")
+        try:
+            with open(file, "w", encoding="utf-8") as output:
+                json.dump(results, output, ensure_ascii=False, indent=2)
+        except Exception as error:
+            raise OSError(error) from error
+
+        return results
+
+
+    def load_previous(self, commit: str) -> dict | None:
+        """Reads the latest results of
+        another commit, None if missing"""
+
+        files = [path.join(self.bench_dir, file) for file in listdir(self.bench_dir)
+                 if file.startswith("pages_") and file != f"pages_{commit}.json"]
+        if not files:
+            return None
+
+        with open(max(files, key=path.getmtime), encoding="utf-8") as file:
+            return json.load(file)
+
+
+    def compare(self, previous: dict, current: dict) -> pd.DataFrame:
+        """Compares two runs per tab
+        Flags times above the tolerance"""
+
+        keys = ["page", "tab"]
+        before = pd.DataFrame(previous["tabs"]).set_index(keys)
+        after = pd.DataFrame(current["tabs"]).set_index(keys)
+
+        report = after[["cold_s", "warm_s", "cold_calls", "peak_mb"]].join(
+            before[["cold_s", "warm_s", "cold_calls", "peak_mb"]], rsuffix="_before", how="left"
+        )
+        for column in ["cold_s", "warm_s"]:
+            report[f"{column}_change"] = (report[column] / report[f"{column}_before"] - 1).round(3)
+
+        report["regression"] = ((report["cold_s_change"] > self.tolerance) |
+                                (report["warm_s_change"] > self.tolerance) |
+                                (report["cold_calls"] > report["cold_calls_before"]))
+
+        return report
+
+
+if __name__ == "__main__":
+    # cold runs fetch for real, never served by or written to the replicas' cache
+    environ["SHARED_CACHE"] = "off"
+    bench = PageBench()
+    current = bench.run()
+    print(pd.DataFrame(current["tabs"]).set_index(["page", "tab"]).to_string())
+
+    previous = bench.load_previous(current["commit"])
+    if previous is not None:
+        comparison = bench.compare(previous, current)
+        print(f"\nagainst {previous['commit']}:")
+        print(comparison.to_string())
+        sys.exit(1 if comparison["regression"].any() else 0)
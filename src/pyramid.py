@@ -0,0 +1,114 @@
+# -*- coding: UTF-8 -*-
+"""Import modules"""
+
+from collections import OrderedDict
+from threading import Lock
+
+
+class SeriesPyramid:
+    """Multi Resolution Series Interface"""
+
+    # D is the series as given, the others resample by the current pandas aliases
+    levels = ("D", "W", "M", "Q", "Y")
+    rules = {"W": "W", "M": "ME", "Q": "QE", "Y": "YE"}
+
+    _pyramids = OrderedDict()
+    _lock = Lock()
+
+    def __init__(self) -> None:
+        """Initializes instance"""
+
+        # import local modules
+        from src.iface_config import Config
+        from src.derived import Derived
+
+        self.config = Config()
+        self.derived = Derived()
+        self.max_series = self.config.vars.pyramid_max_series
+        self.max_points = self.config.vars.chart_max_points
+
+    def __repr__(self) -> str:
+        """SeriesPyramid Class Basic
+        Representation"""
+
+        return f"SeriesPyramid Class, series: {len(SeriesPyramid._pyramids)}"
+
+    def __str__(self) -> str:
+        """SeriesPyramid Class
+        Print Representation"""
+
+        return f"SeriesPyramid Class, series: {len(SeriesPyramid._pyramids)}"
+
+
+    def build(self, data, how: str = "first", decimals: int = 3, dropna: bool = False) -> dict:
+        """Aggregates every level and its percent
+        change at once, {level: {"level", "change"}}"""
+
+        pyramid = {}
+        for level in self.levels:
+            if level == "D":
+                values = data
+            else:
+                # only resampled levels drop their empty periods
+                values = self.derived.resample(data, rule=self.rules[level], how=how, dropna=dropna)
+            pyramid[level] = {"level": values,
+                              "change": self.derived.pct_change(values, decimals)}
+
+        return pyramid
+
+
+    def get_pyramid(self, data, how: str = "first", decimals: int = 3,
+                    dropna: bool = False) -> dict:
+        """Gets the pyramid of a series version,
+        built on its first use"""
+
+        # import local module
+        from src.chart_cache import ChartCache
+
+        key = (ChartCache.fingerprint(data), how, decimals, dropna)
+
+        with SeriesPyramid._lock:
+            if key in SeriesPyramid._pyramids:
+                SeriesPyramid._pyramids.move_to_end(key)
+                return SeriesPyramid._pyramids[key]
+
+        pyramid = self.build(data, how, decimals, dropna)
+
+        with SeriesPyramid._lock:
+            SeriesPyramid._pyramids[key] = pyramid
+            while len(SeriesPyramid._pyramids) > self.max_series:
+                SeriesPyramid._pyramids.popitem(last=False)
+
+        return pyramid
+
+
+    def auto_level(self, pyramid: dict) -> str:
+        """Gets the finest level that fits
+        the chart point budget"""
+
+        for level in self.levels:
+            if not self.max_points or len(pyramid[level]["level"]) <= self.max_points:
+                return level
+
+        return self.levels[-1]
+
+
+    def get(self, data, level: str = "D", change: bool = False, how: str = "first",
+            decimals: int = 3, dropna: bool = False):
+        """Gets one level of a series, auto picks the
+        finest one that fits the chart budget"""
+
+        pyramid = self.get_pyramid(data, how, decimals, dropna)
+        if level == "auto":
+            level = self.auto_level(pyramid)
+
+        return pyramid[level]["change" if change else "level"]
+
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drops every
+        built pyramid"""
+
+        with cls._lock:
+            cls._pyramids.clear()
@@ -0,0 +1,244 @@
+# -*- coding: UTF-8 -*-
+"""Import modules"""
+
+from os import path, makedirs, getpid
+from contextlib import contextmanager, closing
+from socket import gethostname
+from threading import Lock, get_ident
+from time import time, sleep
+import sqlite3
+import pickle
+import warnings
+
+
+class SharedCache:
+    """Cross Process Cache Interface"""
+
+    # how often a replica waiting on another one's fetch looks again
+    poll_seconds = 0.25
+    # how often a replica purges old entries after a write
+    purge_seconds = 600
+
+    _created = set()
+    _purged_at = {}
+    _lock = Lock()
+
+    def __init__(self) -> None:
+        """Initializes instance"""
+
+        # import local module
+        from src.iface_config import Config
+
+        self.config = Config()
+        self.backend = self.config.vars.shared_cache
+        self.lease_seconds = self.config.vars.shared_cache_lease_seconds
+        self.max_age = self.config.vars.shared_cache_max_age_days * 86400
+        self.max_bytes = self.config.vars.shared_cache_max_mb * 2**20
+        self.file = path.join(self.config.vars.data_dir, self.config.vars.shared_cache_file)
+        self.owner = f"{gethostname()}:{getpid()}"
+
+        if self.enabled:
+            makedirs(path.dirname(self.file) or ".", exist_ok=True)
+            self.create()
+
+    def __repr__(self) -> str:
+        """SharedCache Class Basic
+        Representation"""
+
+        return f"SharedCache Class, backend: {self.backend}, file: {str(self.file)}"
+
+    def __str__(self) -> str:
+        """SharedCache Class
+        Print Representation"""
+
+        return f"SharedCache Class, backend: {self.backend}, file: {str(self.file)}"
+
+
+    @property
+    def enabled(self) -> bool:
+        """Checks if the
+        backend is on"""
+
+        return self.backend == "sqlite"
+
+
+    def connect(self) -> sqlite3.Connection:
+        """Opens a connection, one per call
+        so threads and processes never share one"""
+
+        # no WAL, its shared memory index does not work on network volumes
+        return sqlite3.connect(self.file, timeout=30, isolation_level=None)
+
+
+    def create(self) -> None:
+        """Creates the tables
+        once per process"""
+
+        with SharedCache._lock:
+            if self.file in SharedCache._created:
+                return
+            SharedCache._created.add(self.file)
+
+        try:
+            with closing(self.connect()) as conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS entries "
+                             "(key TEXT PRIMARY KEY, value BLOB, stored_at REAL)")
+                conn.execute("CREATE TABLE IF NOT EXISTS leases "
+                             "(key TEXT PRIMARY KEY, owner TEXT, expires REAL)")
+        except Exception as error:
+            raise OSError(error) from error
+
+
+    def get(self, key: str) -> tuple | None:
+        """Reads one entry
+        Return (value, stored_at) or None"""
+
+        if not self.enabled:
+            return None
+
+        with closing(self.connect()) as conn:
+            row = conn.execute("SELECT value, stored_at FROM entries WHERE key = ?",
+                               (key,)).fetchone()
+
+        if row is None or time() - row[1] > self.max_age:
+            # expired ones are deleted by the next purge
+            return None
+
+        try:
+            return pickle.loads(row[0]), row[1]
+        except Exception:
+            # written by an older release, treated as a miss
+            return None
+
+
+    def stored_at(self, key: str) -> float | None:
+        """Gets when an entry was written,
+        without loading its value"""
+
+        if not self.enabled:
+            return None
+
+        with closing(self.connect()) as conn:
+            row = conn.execute("SELECT stored_at FROM entries WHERE key = ?", (key,)).fetchone()
+
+        return None if row is None else row[0]
+
+
+    def set(self, key: str, value, stored_at: float = None) -> bool:
+        """Writes one entry, values that
+        do not pickle stay process local"""
+
+        if not self.enabled:
+            return False
+
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return False
+
+        with closing(self.connect()) as conn:
+            conn.execute("INSERT OR REPLACE INTO entries (key, value, stored_at) VALUES (?, ?, ?)",
+                         (key, blob, stored_at or time()))
+
+        with SharedCache._lock:
+            due = time() - SharedCache._purged_at.get(self.file, 0) > self.purge_seconds
+            if due:
+                SharedCache._purged_at[self.file] = time()
+        if due:
+            self.purge()
+
+        return True
+
+
+    def purge(self) -> None:
+        """Deletes expired entries, then the
+        oldest ones over the size cap"""
+
+        if not self.enabled:
+            return
+
+        with closing(self.connect()) as conn:
+            conn.execute("DELETE FROM entries WHERE stored_at < ?", (time() - self.max_age,))
+            conn.execute("DELETE FROM leases WHERE expires < ?", (time(),))
+            # the newest entries that fit, by running total of their sizes
+            conn.execute("DELETE FROM entries WHERE key IN ("
+                         "SELECT key FROM (SELECT key, SUM(LENGTH(value)) OVER "
+                         "(ORDER BY stored_at DESC, key) AS total FROM entries) "
+                         "WHERE total > ?)", (self.max_bytes,))
+
+
+    def acquire(self, key: str) -> bool:
+        """Takes the fetch lease of a key,
+        False while another one holds it"""
+
+        now = time()
+        owner = f"{self.owner}:{get_ident()}"
+
+        with closing(self.connect()) as conn:
+            # IMMEDIATE takes the write lock, read and claim are atomic across processes
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT owner, expires FROM leases WHERE key = ?",
+                                   (key,)).fetchone()
+                if row is not None and row[0] != owner and row[1] > now:
+                    conn.execute("ROLLBACK")
+                    return False
+                conn.execute("INSERT OR REPLACE INTO leases (key, owner, expires) VALUES (?, ?, ?)",
+                             (key, owner, now + self.lease_seconds))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+        return True
+
+
+    def release(self, key: str) -> None:
+        """Gives the fetch
+        lease of a key back"""
+
+        with closing(self.connect()) as conn:
+            conn.execute("DELETE FROM leases WHERE key = ? AND owner = ?",
+                         (key, f"{self.owner}:{get_ident()}"))
+
+
+    @contextmanager
+    def lease(self, key: str, wait: bool = True):
+        """Holds the fetch lease of a key, waits for
+        it or yields False at once when wait is off"""
+
+        if not self.enabled:
+            yield True
+            return
+
+        # a crashed holder frees the key once its lease expires
+        deadline = time() + self.lease_seconds
+        acquired = self.acquire(key)
+        while not acquired and wait and time() < deadline:
+            sleep(self.poll_seconds)
+            acquired = self.acquire(key)
+
+        if not acquired and wait:
+            # past the deadline the holder's lease has run out, it is taken over
+            acquired = self.acquire(key)
+        if not acquired and wait:
+            # another waiter took it over first, the caller fetches on its own
+            warnings.warn(f"Lease of {key} still held after {self.lease_seconds}s, "
+                          "fetching without it")
+
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                self.release(key)
+
+
+    def clear(self) -> None:
+        """Drops every
+        shared entry"""
+
+        if not self.enabled:
+            return
+
+        with closing(self.connect()) as conn:
+            conn.execute("DELETE FROM entries")
@@ -0,0 +1,86 @@
+# -*- coding: UTF-8 -*-
+"""Import modules"""
+
+from functools import wraps
+from threading import Lock, Event, get_ident
+
+
+class SingleFlight:
+    """Concurrent Call De-duplication Interface"""
+
+    _calls = {}
+    _stats = {"leaders": 0, "followers": 0}
+    _lock = Lock()
+
+    def __repr__(self) -> str:
+        """SingleFlight Class Basic
+        Representation"""
+
+        return f"SingleFlight Class, in flight: {len(SingleFlight._calls)}"
+
+    def __str__(self) -> str:
+        """SingleFlight Class
+        Print Representation"""
+
+        return f"SingleFlight Class, in flight: {len(SingleFlight._calls)}"
+
+
+    @classmethod
+    def do(cls, key, func, *args, **kwargs):
+        """Runs func once per key at a time, concurrent
+        callers wait and get the same result or error"""
+
+        with cls._lock:
+            call = cls._calls.get(key)
+            leader = call is None
+            if leader:
+                call = {"event": Event(), "thread": get_ident(), "result": None, "error": None}
+                cls._calls[key] = call
+                cls._stats["leaders"] += 1
+            elif call["thread"] != get_ident():
+                cls._stats["followers"] += 1
+
+        if not leader:
+            if call["thread"] == get_ident():
+                # re-entrant call of the leader, waiting would deadlock
+                return func(*args, **kwargs)
+            call["event"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            return call["result"]
+
+        try:
+            call["result"] = func(*args, **kwargs)
+            return call["result"]
+        except Exception as error:
+            call["error"] = error
+            raise
+        finally:
+            with cls._lock:
+                cls._calls.pop(key, None)
+            call["event"].set()
+
+
+    @classmethod
+    def shared(cls, func):
+        """Method decorator, concurrent calls with
+        equal arguments share one execution"""
+
+        @wraps(func)
+        def deduped(instance, *args, **kwargs):
+            key = (func.__qualname__, repr(args), repr(sorted(kwargs.items())))
+            return cls.do(key, func, instance, *args, **kwargs)
+
+        return deduped
+
+
+    @classmethod
+    def stats(cls) -> dict:
+        """Gets how many calls ran and
+        how many waited on another one"""
+
+        with cls._lock:
+            stats = dict(cls._stats)
+            stats["in_flight"] = len(cls._calls)
+
+        return stats
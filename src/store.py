@@ -0,0 +1,202 @@
+# -*- coding: UTF-8 -*-
+"""Import modules"""
+
+from os import path, makedirs, replace, getpid
+from datetime import datetime, timedelta
+from functools import partial
+from threading import get_ident
+import re
+import pandas as pd
+
+
+class SeriesStore:
+    """Local Time Series Store Interface"""
+
+    def __init__(self, namespace: str = "series") -> None:
+        """Initializes instance"""
+
+        # import local modules
+        from src.iface_config import Config
+        from src.cache_policy import CachePolicy
+        from src.single_flight import SingleFlight
+
+        self.config = Config()
+        self.policy = CachePolicy()
+        self.single_flight = SingleFlight()
+        self.data_dir = self.config.vars.data_dir
+        self.store_dir = path.join(self.data_dir,
+                                   self.config.vars.store_dir,
+                                   namespace)
+        self.max_age = timedelta(hours=self.config.vars.store_max_age_hours)
+
+        makedirs(self.store_dir, exist_ok=True)
+
+    def __repr__(self) -> str:
+        """SeriesStore Class Basic
+        Representation"""
+
+        return f"SeriesStore Class, store dir: {str(self.store_dir)}"
+
+    def __str__(self) -> str:
+        """SeriesStore Class
+        Print Representation"""
+
+        return f"SeriesStore Class, store dir: {str(self.store_dir)}"
+
+
+    def file_path(self, key) -> str:
+        """Gets the parquet file
+        of an indicator id"""
+
+        name = re.sub(r"[^A-Za-z0-9_.\-]", "_", str(key))
+
+        return path.join(self.store_dir, f"{name}.parquet")
+
+
+    def load(self, key) -> pd.DataFrame | None:
+        """Reads a stored series
+        Return None if missing"""
+
+        file = self.file_path(key)
+        if not path.exists(file):
+            return None
+
+        try:
+            data = pd.read_parquet(file)
+        except Exception as error:
+            raise OSError(error) from error
+
+        return data
+
+
+    def save(self, key, data: pd.DataFrame) -> None:
+        """Writes a series
+        replacing the stored file"""
+
+        file = self.file_path(key)
+        # unique per thread, concurrent saves of one key never share it
+        temp_file = f"{file}.{getpid()}.{get_ident()}.tmp"
+
+        try:
+            data.to_parquet(temp_file)
+            # atomic swap, readers never see a partial file
+            replace(temp_file, file)
+        except Exception as error:
+            raise OSError(error) from error
+
+
+    def last_date(self, key) -> datetime | None:
+        """Gets the last
+        stored observation"""
+
+        data = self.load(key)
+        if data is None or data.empty:
+            return None
+
+        return data.index[-1]
+
+
+    def is_fresh(self, key, source: str = None) -> bool:
+        """Checks if the series was refreshed inside
+        the source ttl, or max_age without one"""
+
+        file = self.file_path(key)
+        if not path.exists(file):
+            return False
+
+        updated = datetime.fromtimestamp(path.getmtime(file))
+        if source is not None:
+            return not self.policy.is_stale(source, (datetime.now() - updated).total_seconds())
+
+        return datetime.now() - updated < self.max_age
+
+
+    def update(self, key, fetch, source: str = None) -> pd.DataFrame:
+        """Gets a stored series, fetch(start) -> DataFrame,
+        stale series are served while they refresh"""
+
+        stored = self.load(key)
+        if stored is None:
+            # concurrent first reads share one download
+            return self.single_flight.do(("store", self.store_dir, str(key)),
+                                         self.refresh, key, fetch)
+
+        if not self.is_fresh(key, source):
+            self.policy.revalidate((self.store_dir, str(key)), partial(self.refresh, key, fetch))
+
+        return stored
+
+
+    def refresh(self, key, fetch) -> pd.DataFrame:
+        """Appends the observations after
+        the last stored date"""
+
+        stored = self.load(key)
+
+        start = None
+        if stored is not None and not stored.empty:
+            # the last stored date is requested again to catch revisions
+            start = stored.index[-1]
+
+        try:
+            new_data = fetch(start)
+        except Exception as error:
+            if stored is None:
+                raise OSError(error) from error
+            return stored
+
+        return self.merge(key, stored, new_data)
+
+
+    def merge(self, key, stored: pd.DataFrame | None, new_data: pd.DataFrame) -> pd.DataFrame:
+        """Saves the new observations over
+        the stored ones, the new win"""
+
+        if stored is not None:
+            new_data = pd.concat([stored, new_data])
+            new_data = new_data[~new_data.index.duplicated(keep="last")]
+
+        new_data = new_data.sort_index()
+        self.save(key, new_data)
+
+        return new_data
+
+
+    def update_many(self, keys: list, fetch_many, source: str = None) -> dict:
+        """Gets stored series, fetch_many({key: start}) -> {key: DataFrame},
+        the missing ones in one batch, the stale ones in the background"""
+
+        stored = {key: self.load(key) for key in keys}
+
+        missing = [key for key, data in stored.items() if data is None]
+        if missing:
+            stored.update(self.single_flight.do(
+                ("store", self.store_dir, tuple(map(str, missing))),
+                self.refresh_many, missing, fetch_many
+            ))
+
+        stale = [key for key in keys if key not in missing and not self.is_fresh(key, source)]
+        if stale:
+            self.policy.revalidate((self.store_dir, tuple(map(str, stale))),
+                                   partial(self.refresh_many, stale, fetch_many))
+
+        return stored
+
+
+    def refresh_many(self, keys: list, fetch_many) -> dict:
+        """Appends the observations after the last
+        stored date of every key in one batch"""
+
+        stored = {key: self.load(key) for key in keys}
+        # the last stored date is requested again to catch revisions
+        starts = {key: data.index[-1] if data is not None and not data.empty else None
+                  for key, data in stored.items()}
+
+        try:
+            new_data = fetch_many(starts)
+        except Exception as error:
+            if any(data is None for data in stored.values()):
+                raise OSError(error) from error
+            return stored
+
+        return {key: self.merge(key, stored[key], new_data[key]) for key in keys}
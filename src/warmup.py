@@ -0,0 +1,205 @@
+# -*- coding: UTF-8 -*-
+"""Import modules"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from threading import Thread, Lock
+from datetime import datetime
+from time import sleep
+import importlib
+import warnings
+import pandas as pd
+
+
+class Warmup:
+    """Background Store Warm-up Interface"""
+
+    # the started one, read by the admin panel
+    _current = None
+
+    def __init__(self) -> None:
+        """Initializes instance"""
+
+        # import local modules
+        from src.iface_config import Config
+        from src.indicators import Indicators
+        from src.iface_extract import Extract
+        from src.metrics import Metrics
+        from src.cache_policy import CachePolicy
+
+        self.config = Config()
+        self.metrics = Metrics()
+        self.policy = CachePolicy()
+        self.indicators = Indicators()
+        self.extract = Extract()
+        self.max_workers = self.config.vars.warmup_max_workers
+        self.interval = self.config.vars.warmup_interval_hours * 3600
+
+        self.fetchers = {
+            "fred": self.extract.get_fred_series,
+            "yfinance": self.extract.get_yf_data,
+            "sgs": self.extract.get_sgs_series,
+            "imf": self.extract.get_imf_data,
+            # one mirror for every Focus indicator
+            "focus": lambda _: self.extract.get_focus_mirror(),
+            "pages": self.warm_page,
+        }
+
+        # scrapers and files are only memoized by the page getters
+        self.pages = {}
+        for page in self.config.vars.warmup_pages:
+            page = {"getter": page} if isinstance(page, str) else page
+            args = tuple(page.get("args", ()))
+            label = f"{page['getter'].split(':')[-1]}({', '.join(map(repr, args))})"
+            self.pages[label] = (page["getter"], args)
+        self._instances = {}
+
+        self.status = {}
+        self.last_run = None
+        self.last_error = None
+        self._lock = Lock()
+        self._thread = None
+
+    def __repr__(self) -> str:
+        """Warmup Class Basic
+        Representation"""
+
+        return f"Warmup Class, last run: {str(self.last_run)}"
+
+    def __str__(self) -> str:
+        """Warmup Class
+        Print Representation"""
+
+        return f"Warmup Class, last run: {str(self.last_run)}"
+
+
+    def get_jobs(self) -> dict:
+        """Walks every indicator group
+        Return the unique ids per source"""
+
+        jobs = {}
+        for theme in self.indicators.groups.values():
+            for ind in theme:
+                source = self.indicators.sources.get(ind)
+                # scrapers and files have no store backed fetcher
+                if source not in self.fetchers:
+                    continue
+                ids = jobs.setdefault(source, [])
+                if self.indicators.ids[ind] not in ids:
+                    ids.append(self.indicators.ids[ind])
+
+        jobs["focus"] = ["mirror"]
+        if self.pages:
+            jobs["pages"] = list(self.pages)
+
+        return jobs
+
+
+    def warm_page(self, label: str):
+        """Calls a page getter with the arguments
+        the page passes, filling its memo"""
+
+        getter, args = self.pages[label]
+        module, name = getter.split(":")
+        class_name, method = name.split(".")
+        key = f"{module}:{class_name}"
+
+        with self._lock:
+            instance = self._instances.get(key)
+        if instance is None:
+            # one instance per page class, reused by every run
+            instance = getattr(importlib.import_module(module), class_name)()
+            with self._lock:
+                instance = self._instances.setdefault(key, instance)
+
+        return getattr(instance, method)(*args)
+
+
+    def run(self) -> dict:
+        """Fetches all the groups in parallel
+        Return the status per source"""
+
+        jobs = self.get_jobs()
+
+        with self._lock:
+            self.status = {
+                source: {"total": len(ids), "done": 0, "failed": 0, "errors": {}}
+                for source, ids in jobs.items()
+            }
+
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix="warmup") as pool:
+            futures = {
+                # stale series refresh inline, the warm-up is already off the request path
+                pool.submit(self.policy.run_blocking, self.fetchers[source], ind): (source, ind)
+                for source, ids in jobs.items() for ind in ids
+            }
+
+            for future in as_completed(futures):
+                source, ind = futures[future]
+                with self._lock:
+                    try:
+                        future.result()
+                        self.status[source]["done"] += 1
+                    except Exception as error:
+                        self.status[source]["failed"] += 1
+                        self.status[source]["errors"][ind] = str(error)
+
+        self.last_run = datetime.now()
+
+        return self.status
+
+
+    def report(self) -> pd.DataFrame:
+        """Gets the progress and
+        failures of each source"""
+
+        with self._lock:
+            report = pd.DataFrame({
+                source: {"total": status["total"],
+                         "done": status["done"],
+                         "failed": status["failed"],
+                         "errors": ", ".join(map(str, status["errors"]))}
+                for source, status in self.status.items()
+            }).T
+
+        report.index.name = "source"
+
+        return report
+
+
+    def loop(self) -> None:
+        """Runs the warm-up now and
+        then every interval hours"""
+
+        while True:
+            try:
+                self.run()
+                self.metrics.export()
+            except Exception as error:
+                # the schedule keeps going, the next run tries again
+                with self._lock:
+                    self.last_error = f"{datetime.now():%Y-%m-%d %H:%M}: {error}"
+                warnings.warn(f"Warm-up failed: {error}")
+            if not self.interval:
+                break
+            sleep(self.interval)
+
+
+    def start(self) -> Thread:
+        """Starts the warm-up off
+        the request path"""
+
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = Thread(target=self.loop, name="warmup", daemon=True)
+            self._thread.start()
+        Warmup._current = self
+
+        return self._thread
+
+
+    @classmethod
+    def current(cls):
+        """Gets the started warm-up
+        Return None before the start"""
+
+        return cls._current